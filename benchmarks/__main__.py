@@ -0,0 +1,177 @@
+"""
+Benchmark and allocation-regression suite for the lookup engine.
+
+Every case reports the time per lookup (ns/op) and the peak memory allocated by one
+lookup (measured with tracemalloc). Results can be saved as a JSON baseline and later
+runs compared against it; the run fails when a case regresses past the thresholds, or
+when there is no baseline to compare against.
+
+Run with: python -m benchmarks [--baseline PATH] [--save] [--quick]
+"""
+import argparse
+import json
+import platform
+import sys
+import timeit
+import tracemalloc
+from pathlib import Path
+from typing import Any, Callable, NamedTuple, Optional
+
+from benchmarks import documents
+from deepfinder import deep_find
+from deepfinder.entity import DeepFinderDict, DeepFinderList
+
+DEFAULT_BASELINE = Path(__file__).parent / 'baseline.json'
+DEFAULT_TIME_THRESHOLD = 0.25
+DEFAULT_ALLOCATION_THRESHOLD = 0.10
+ALLOCATION_SLACK = 512
+
+
+class Case(NamedTuple):
+    name: str
+    lookup: Callable[[], Any]
+
+
+def build_cases() -> list[Case]:
+    """Build every benchmark case from the synthetic documents."""
+    documents_by_name = {}
+    for depth in (2, 8, 32):
+        documents_by_name[f'depth={depth}'] = documents.nested_dict(depth)
+    for width in (10, 1000):
+        documents_by_name[f'width={width}'] = documents.wide_dict(width)
+    for size in (100, 10_000):
+        documents_by_name[f'fanout={size}'] = documents.records(size)
+    documents_by_name['fanout=100x100'] = documents.grouped_records(100, 100)
+    for position in (0, 500, 999):
+        documents_by_name[f'first-hit={position}/1000'] = documents.first_hit(1000, position)
+    documents_by_name['tuples=1000'] = documents.tuple_records(1000)
+    documents_by_name['frozenset=1000'] = documents.set_records(1000)
+    documents_by_name['objects=1000'] = documents.object_records(1000)
+
+    cases = []
+    for name, (document, path) in documents_by_name.items():
+        cases.append(Case(f'deep_find/{name}', _bind(deep_find, document, path)))
+        if isinstance(document, dict):
+            entity = DeepFinderDict(document)
+            cases.append(Case(f'DeepFinderDict.deep_find/{name}', _bind_method(entity, path)))
+
+    for size in (100, 10_000):
+        document, path = documents.top_level_records(size)
+        cases.append(Case(f'deep_find/top-level={size}', _bind(deep_find, document, path)))
+        entity = DeepFinderList(document)
+        cases.append(Case(f'DeepFinderList.deep_find/top-level={size}', _bind_method(entity, path)))
+    return cases
+
+
+def _bind(function: Callable[[Any, str], Any], document: Any, path: str) -> Callable[[], Any]:
+    return lambda: function(document, path)
+
+
+def _bind_method(entity: Any, path: str) -> Callable[[], Any]:
+    return lambda: entity.deep_find(path)
+
+
+def measure(case: Case, min_time: float, repeat: int) -> dict[str, float]:
+    """
+    Measure the time per lookup and the peak allocation of one lookup.
+
+    Args:
+        case: The benchmark case.
+        min_time: Minimum duration in seconds of every timing repetition.
+        repeat: Number of timing repetitions. The fastest one is reported.
+
+    Returns:
+        A dictionary with 'ns_per_op' and 'peak_bytes'.
+    """
+    timer = timeit.Timer(case.lookup)
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    seconds = min(timer.repeat(repeat=repeat, number=number))
+
+    case.lookup()
+    tracemalloc.start()
+    try:
+        tracemalloc.reset_peak()
+        current, _ = tracemalloc.get_traced_memory()
+        case.lookup()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'ns_per_op': seconds / number * 1e9, 'peak_bytes': peak - current}
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    time_threshold: float,
+    allocation_threshold: float,
+) -> list[str]:
+    """
+    Compare results against a baseline.
+
+    Returns:
+        A description of every case that got slower or allocates more than allowed.
+    """
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            continue
+        if result['ns_per_op'] > base['ns_per_op'] * (1 + time_threshold):
+            regressions.append(
+                f'{name}: {result["ns_per_op"]:.0f} ns/op, baseline {base["ns_per_op"]:.0f} ns/op'
+            )
+        if result['peak_bytes'] > base['peak_bytes'] * (1 + allocation_threshold) + ALLOCATION_SLACK:
+            regressions.append(
+                f'{name}: {result["peak_bytes"]:.0f} peak bytes, baseline {base["peak_bytes"]:.0f} bytes'
+            )
+    return regressions
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--baseline', type=Path, default=DEFAULT_BASELINE,
+                        help='JSON baseline to compare against or save to (default: %(default)s)')
+    parser.add_argument('--save', action='store_true',
+                        help='save the results as the new baseline instead of comparing')
+    parser.add_argument('--time-threshold', type=float, default=DEFAULT_TIME_THRESHOLD,
+                        help='allowed relative slowdown per case (default: %(default)s)')
+    parser.add_argument('--allocation-threshold', type=float, default=DEFAULT_ALLOCATION_THRESHOLD,
+                        help='allowed relative growth of peak allocations per case (default: %(default)s)')
+    parser.add_argument('--quick', action='store_true', help='shorter timings, for smoke runs')
+    parser.add_argument('--filter', default='', help='only run cases whose name contains this text')
+    args = parser.parse_args(argv)
+    if not args.save and not args.baseline.exists():
+        parser.error(f'no baseline at {args.baseline}: save one first with --save (make bench-baseline)')
+
+    min_time, repeat = (0.01, 3) if args.quick else (0.1, 5)
+    results = {}
+    for case in build_cases():
+        if args.filter not in case.name:
+            continue
+        results[case.name] = result = measure(case, min_time, repeat)
+        print(f'{case.name:<52} {result["ns_per_op"]:>14,.0f} ns/op {result["peak_bytes"]:>12,.0f} B peak')
+
+    if args.save:
+        document = {'python': platform.python_version(), 'cases': results}
+        args.baseline.write_text(json.dumps(document, indent=2, sort_keys=True) + '\n')
+        print(f'\nBaseline saved to {args.baseline}')
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())
+    regressions = find_regressions(
+        results, baseline['cases'], args.time_threshold, args.allocation_threshold,
+    )
+    if regressions:
+        print(f'\n{len(regressions)} regression(s) against {args.baseline}:')
+        for regression in regressions:
+            print(f'  {regression}')
+        return 1
+    print(f'\nNo regressions against {args.baseline}')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,40 @@
+"""
+Compare deep_find_batch with worker processes against in-process evaluation.
+
+Run with: python -m benchmarks.batch_bench [--size N]
+"""
+import argparse
+import os
+import time
+
+from deepfinder import deep_find_batch
+
+PATHS = ['id', 'user.name', 'events.*.type', 'events.?.payload.value']
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.batch_bench')
+    parser.add_argument('--size', type=int, default=200_000, help='number of documents (default: %(default)s)')
+    args = parser.parse_args()
+
+    docs = [
+        {
+            'id': index,
+            'user': {'name': f'user{index}', 'tags': ['a', 'b', 'c']},
+            'events': [{'type': f'type{event}', 'payload': {'value': event * index}} for event in range(10)],
+        }
+        for index in range(args.size)
+    ]
+
+    processes = 1
+    while processes <= (os.cpu_count() or 1):
+        deep_find_batch(docs[:10_000], PATHS, processes=processes)
+        started = time.perf_counter()
+        deep_find_batch(docs, PATHS, processes=processes)
+        seconds = time.perf_counter() - started
+        print(f'processes={processes:<3} {seconds * 1e3:8.1f} ms  {args.size / seconds:12,.0f} docs/s')
+        processes *= 2
+
+
+if __name__ == '__main__':
+    main()
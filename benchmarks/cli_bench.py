@@ -0,0 +1,57 @@
+"""
+Measure the throughput of the JSON Lines scanner for an increasing number of workers.
+
+Run with: python -m benchmarks.cli_bench [--megabytes N]
+"""
+import argparse
+import json
+import os
+import tempfile
+import time
+
+from deepfinder.cli import scan
+
+PATHS = ['id', 'user.name', 'events.*.type', 'events.?.payload.value']
+
+
+def write_documents(fp, megabytes: int) -> int:
+    """Write synthetic documents until the file holds at least 'megabytes' MB."""
+    size = 0
+    index = 0
+    while size < megabytes * 1024 * 1024:
+        document = {
+            'id': index,
+            'user': {'name': f'user{index}', 'tags': ['a', 'b', 'c']},
+            'events': [{'type': f'type{event}', 'payload': {'value': event * index}} for event in range(10)],
+        }
+        line = (json.dumps(document) + '\n').encode()
+        fp.write(line)
+        size += len(line)
+        index += 1
+    return size
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.cli_bench')
+    parser.add_argument('--megabytes', type=int, default=64, help='size of the input file (default: %(default)s)')
+    args = parser.parse_args()
+
+    with tempfile.NamedTemporaryFile(suffix='.jsonl', delete=False) as fp:
+        size = write_documents(fp, args.megabytes)
+    try:
+        workers = 1
+        while workers <= (os.cpu_count() or 1):
+            for ordered in (True, False):
+                started = time.perf_counter()
+                for _ in scan(fp.name, PATHS, workers=workers, ordered=ordered):
+                    pass
+                seconds = time.perf_counter() - started
+                mode = 'ordered' if ordered else 'unordered'
+                print(f'workers={workers:<3} {mode:<10} {size / seconds / 1e6:8.1f} MB/s')
+            workers *= 2
+    finally:
+        os.unlink(fp.name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,32 @@
+"""
+Compare deep_find with generated getters against hand-written lookups.
+
+Run with: python -m benchmarks.codegen_bench
+"""
+import timeit
+
+from deepfinder import compile_path, deep_find
+
+DATA = {'order': {'customer': {'id': 7}, 'items': [{'sku': 'a'}, {'sku': 'b'}, {'sku': 'c'}]}}
+NUMBER = 200_000
+
+
+def main():
+    customer_path = compile_path('order.customer.id', codegen=True)
+    items_path = compile_path('order.items.*.sku', codegen=True)
+    cases = {
+        'hand-written .get chain': lambda: DATA.get('order', {}).get('customer', {}).get('id'),
+        'deep_find (string)': lambda: deep_find(DATA, 'order.customer.id'),
+        'deep_find (codegen)': lambda: deep_find(DATA, customer_path),
+        'codegen getter': lambda: customer_path.getter(DATA),
+        'hand-written wildcard': lambda: [item.get('sku') for item in DATA['order']['items']],
+        'wildcard (string)': lambda: deep_find(DATA, 'order.items.*.sku'),
+        'wildcard (codegen)': lambda: items_path.getter(DATA),
+    }
+    for name, case in cases.items():
+        seconds = min(timeit.repeat(case, number=NUMBER, repeat=5))
+        print(f'{name:<26} {seconds / NUMBER * 1e9:8.0f} ns/op')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+"""
+Compare the per-call cost of deep_find with string and precompiled paths against the
+first release, which split the path string on every call.
+
+The implementations are timed in alternating rounds in the same process, so changes
+in machine load affect them alike. The fastest round of each is reported.
+
+Run with: python -m benchmarks.compile_path_bench
+"""
+import timeit
+
+from benchmarks import reference
+from deepfinder import compile_path, deep_find
+
+DOCUMENTS = {
+    'a.b.c': {'a': {'b': {'c': 1}}},
+    'order.customer.addresses.1.city': {
+        'order': {'customer': {'addresses': [{'city': 'Pallet Town'}, {'city': 'Viridian City'}]}},
+    },
+}
+NUMBER = 200_000
+ROUNDS = 5
+
+
+def main():
+    for path, document in DOCUMENTS.items():
+        compiled = compile_path(path)
+        cases = {
+            'first release (split per call)': lambda: reference.deep_find(document, path),
+            'string (path cache)': lambda: deep_find(document, path),
+            'precompiled': lambda: deep_find(document, compiled),
+        }
+        timings = {name: [] for name in cases}
+        for _ in range(ROUNDS):
+            for name, case in cases.items():
+                timings[name].append(timeit.timeit(case, number=NUMBER) / NUMBER)
+        print(path)
+        for name, seconds in timings.items():
+            print(f'  {name:<32} {min(seconds) * 1e9:8.0f} ns/op')
+
+
+if __name__ == '__main__':
+    main()
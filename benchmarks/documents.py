@@ -0,0 +1,74 @@
+"""
+Synthetic documents for the benchmark suite.
+
+Every builder is deterministic, so results can be compared between runs.
+"""
+from typing import Any
+
+
+class Node:
+    """A plain object with attributes, used for object nodes."""
+
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+def nested_dict(depth: int) -> tuple[dict, str]:
+    """A chain of dictionaries 'depth' levels deep."""
+    document: Any = 39
+    for _ in range(depth):
+        document = {'key': document}
+    return document, '.'.join(['key'] * depth)
+
+
+def wide_dict(width: int) -> tuple[dict, str]:
+    """A dictionary with 'width' keys, each holding a short list."""
+    document = {f'key{index}': [index, {'value': index}] for index in range(width)}
+    return document, f'key{width // 2}.1.value'
+
+
+def records(size: int) -> tuple[dict, str]:
+    """A list of 'size' records under a key, expanded with a wildcard."""
+    document = {'items': [{'id': index, 'payload': {'value': index}} for index in range(size)]}
+    return document, 'items.*.payload.value'
+
+
+def grouped_records(groups: int, size: int) -> tuple[dict, str]:
+    """'groups' lists of 'size' records, expanded with chained wildcards."""
+    document = {
+        'groups': [
+            {'items': [{'id': group * size + index} for index in range(size)]}
+            for group in range(groups)
+        ],
+    }
+    return document, 'groups.*.items.*.id'
+
+
+def first_hit(size: int, position: int) -> tuple[dict, str]:
+    """A list of 'size' records where only the one at 'position' has a value."""
+    items = [{'other': index} for index in range(size)]
+    items[position] = {'value': position}
+    return {'items': items}, 'items.?.value'
+
+
+def tuple_records(size: int) -> tuple[dict, str]:
+    """Records stored in tuples instead of lists."""
+    document = {'items': tuple((index, {'value': index}) for index in range(size))}
+    return document, 'items.*.1.value'
+
+
+def set_records(size: int) -> tuple[dict, str]:
+    """Records stored in a frozenset, read by index."""
+    document = {'items': frozenset((index, index * 2) for index in range(size))}
+    return document, f'items.{size // 2}.1'
+
+
+def object_records(size: int) -> tuple[Node, str]:
+    """Records stored as plain objects with attributes."""
+    document = Node(items=[Node(payload=Node(value=index)) for index in range(size)])
+    return document, 'items.*.payload.value'
+
+
+def top_level_records(size: int) -> tuple[list, str]:
+    """A top-level list of records, for DeepFinderList."""
+    return [{'id': index, 'tags': ['a', 'b']} for index in range(size)], '*?.tags.1'
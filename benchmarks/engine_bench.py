@@ -0,0 +1,44 @@
+"""
+Compare the traversal engine against the recursive implementation of the first release.
+
+Both implementations are timed in alternating rounds in the same process, so changes
+in machine load affect them alike. The fastest round of each is reported.
+
+Run with: python -m benchmarks.engine_bench
+"""
+import timeit
+
+from benchmarks import reference
+from deepfinder import deep_find
+
+SIZE = 10_000
+RECORDS = {'users': [{'x': {'y': index}} for index in range(SIZE)]}
+LATE_HIT = {'users': [{'x': None} for _ in range(SIZE - 1)] + [{'x': {'y': 1}}]}
+MISSES = {'users': [{'z': index} for index in range(SIZE)]}
+CHAIN = {'a': {'b': {'c': 1}}}
+ROUNDS = 7
+
+CASES = {
+    f'users.*.x.y ({SIZE} records)': (RECORDS, 'users.*.x.y', 20),
+    f'users.*?.x.y ({SIZE} records)': (RECORDS, 'users.*?.x.y', 20),
+    f'users.?.x.y (hit at {SIZE - 1})': (LATE_HIT, 'users.?.x.y', 20),
+    f'users.?.q (no hit in {SIZE})': (MISSES, 'users.?.q', 20),
+    'a.b.c': (CHAIN, 'a.b.c', 100_000),
+}
+
+
+def main():
+    print(f'{"case":<32} {"first release":>14} {"current":>14} {"ratio":>7}')
+    for name, (document, path, number) in CASES.items():
+        assert deep_find(document, path) == reference.deep_find(document, path)
+        timings = {reference.deep_find: [], deep_find: []}
+        for _ in range(ROUNDS):
+            for function, seconds in timings.items():
+                seconds.append(timeit.timeit(lambda: function(document, path), number=number) / number)
+        before = min(timings[reference.deep_find])
+        after = min(timings[deep_find])
+        print(f'{name:<32} {before * 1e6:>11.2f} us {after * 1e6:>11.2f} us {after / before:>7.2f}')
+
+
+if __name__ == '__main__':
+    main()
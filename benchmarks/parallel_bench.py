@@ -0,0 +1,44 @@
+"""
+Measure how wildcard expansions scale with deep_find(..., workers=N).
+
+Threads only run in parallel on free-threaded builds (python3.13t); with the GIL the
+numbers show the overhead of splitting the expansion.
+
+Run with: python -m benchmarks.parallel_bench [--size N]
+"""
+import argparse
+import os
+import sys
+import time
+
+from deepfinder import deep_find
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='python -m benchmarks.parallel_bench')
+    parser.add_argument('--size', type=int, default=1_000_000, help='number of records (default: %(default)s)')
+    args = parser.parse_args()
+
+    document = {'items': [{'id': index, 'payload': {'value': index}} for index in range(args.size)]}
+    path = 'items.*.payload.value'
+    gil_enabled = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f'Python {sys.version.split()[0]}, GIL {"enabled" if gil_enabled else "disabled"}, {args.size:,} records')
+
+    deep_find(document, path)
+    started = time.perf_counter()
+    expected = deep_find(document, path)
+    serial = time.perf_counter() - started
+    print(f'{"serial":<12} {serial * 1e3:8.1f} ms')
+
+    workers = 1
+    while workers <= (os.cpu_count() or 1) * 2:
+        started = time.perf_counter()
+        result = deep_find(document, path, workers=workers)
+        seconds = time.perf_counter() - started
+        assert result == expected
+        print(f'workers={workers:<4} {seconds * 1e3:8.1f} ms  {serial / seconds:5.2f}x')
+        workers *= 2
+
+
+if __name__ == '__main__':
+    main()
@@ -1,2 +1,14 @@
+from deepfinder.accessor import register_accessor
+from deepfinder.adeep_find import adeep_find
 from deepfinder.deep_find import deep_find
-from deepfinder.entity import DeepFinderDict, DeepFinderList
+from deepfinder.deep_find_batch import deep_find_batch
+from deepfinder.deep_find_column import deep_find_column
+from deepfinder.deep_find_many import deep_find_many
+from deepfinder.deep_find_stream import deep_find_stream, deep_iter_stream
+from deepfinder.deep_index import DeepIndex
+from deepfinder.deep_iter import deep_iter
+from deepfinder.deep_set import deep_delete, deep_set
+from deepfinder.deep_view import DeepView
+from deepfinder.entity import CachedDeepFinderDict, CachedDeepFinderList, DeepFinderDict, DeepFinderList
+from deepfinder.path import CompiledPath, compile_path
+from deepfinder.stats import DeepFindStats
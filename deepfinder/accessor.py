@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable, Mapping, Sequence
+from functools import cached_property
+from itertools import islice
+from operator import itemgetter
+from types import MemberDescriptorType
+from typing import Any, Callable, Optional
+
+from deepfinder.path import Segment, SegmentKind
+
+
+ACCESSOR_CACHE_SIZE = 4096
+ATTRIBUTE_PLAN_SIZE = 1024
+
+
+class Accessor:
+    """
+    How deep_find reads children of the instances of a type.
+
+    Attributes:
+        get: Function (obj, segment) returning the child for a path segment, or None
+            if there is no such child.
+        iterate: Function (obj) returning an iterable over the elements wildcards
+            expand to, or None if wildcards are looked up as plain keys.
+    """
+
+    __slots__ = ('get', 'iterate')
+
+    def __init__(
+        self,
+        get: Callable[[Any, Segment], Any],
+        iterate: Optional[Callable[[Any], Iterable[Any]]] = None,
+    ):
+        self.get = get
+        self.iterate = iterate
+
+
+_registry: dict[type, Accessor] = {}
+_accessors: dict[type, Accessor] = {}
+
+
+def register_accessor(
+    cls: type,
+    getter: Callable[[Any, str], Any],
+    iterator: Optional[Callable[[Any], Iterable[Any]]] = None,
+) -> None:
+    """
+    Register how deep_find traverses instances of a custom container type.
+
+    Registered types (and their subclasses) take precedence over the built-in
+    handling of mappings, sequences, iterables and objects.
+
+    Args:
+        cls: The type to register.
+        getter: Function (obj, key) returning the child for a path segment, or None if
+            there is no such child. key is the path segment as a string.
+        iterator: Function (obj) returning an iterable over the elements the '*', '?'
+            and '*?' operators expand to. If None, operators are looked up as keys.
+
+    Examples:
+        >>> class Row:
+        ...     def __init__(self, **fields):
+        ...         self.fields = fields
+        >>> register_accessor(Row, lambda row, key: row.fields.get(key))
+        >>> deep_find({'row': Row(id=1)}, 'row.id')
+        1
+    """
+    _registry[cls] = Accessor(lambda obj, segment: getter(obj, segment.key), iterator)
+    _accessors.clear()
+
+
+def _accessor_for(cls: type) -> Accessor:
+    """
+    Get the accessor for a type, resolving and caching it the first time.
+
+    Args:
+        cls: The type of the object being traversed.
+
+    Returns:
+        The accessor for the type.
+    """
+    accessor = _accessors.get(cls)
+    if accessor is None:
+        accessor = _resolve_accessor(cls)
+        if len(_accessors) >= ACCESSOR_CACHE_SIZE:
+            _accessors.clear()
+        _accessors[cls] = accessor
+    return accessor
+
+
+def _resolve_accessor(cls: type) -> Accessor:
+    """
+    Decide which accessor handles a type.
+
+    Args:
+        cls: The type of the object being traversed.
+
+    Returns:
+        The registered accessor of the type or of its closest registered base class,
+        otherwise the built-in accessor for mappings, named tuples, sequences, other
+        iterables (except strings) or plain objects.
+    """
+    for base in cls.__mro__:
+        accessor = _registry.get(base)
+        if accessor is not None:
+            return accessor
+
+    if issubclass(cls, Mapping):
+        return _MAPPING_ACCESSOR
+    if issubclass(cls, str):
+        return _OBJECT_ACCESSOR
+    if issubclass(cls, tuple) and hasattr(cls, '_fields'):
+        return Accessor(_AttributePlan(cls).get_field_or_item, _iterate_in_place)
+    if issubclass(cls, Sequence):
+        return _SEQUENCE_ACCESSOR
+    if issubclass(cls, Iterable):
+        return _ITERABLE_ACCESSOR
+    if not _has_data_attributes(cls):
+        return _OBJECT_ACCESSOR
+    return Accessor(_AttributePlan(cls).get)
+
+
+def _get_key(obj: Mapping[Any, Any], segment: Segment) -> Any:
+    return obj.get(segment.key)
+
+
+def _get_attribute(obj: Any, segment: Segment) -> Any:
+    attributes = getattr(obj, '__dict__', None)
+    if attributes is None:
+        return None
+    return attributes.get(segment.key)
+
+
+def _has_data_attributes(cls: type) -> bool:
+    """
+    Whether a class defines attributes read through the class: properties, cached properties or slots.
+
+    Instances of classes without them are read from their dictionary alone.
+    """
+    return any(
+        isinstance(attribute, _DATA_ATTRIBUTES)
+        for base in cls.__mro__[:-1]
+        for attribute in base.__dict__.values()
+    )
+
+
+class _AttributePlan:
+    """
+    How the attributes of the instances of a class are read, decided once per name.
+
+    A name is resolved the way attribute lookup would resolve it, but only to data:
+    named tuple fields, properties, cached properties, slots and, failing those, the
+    instance dictionary. Methods and other class attributes are not reachable.
+
+    Attributes:
+        cls: The class whose instances are read.
+        getters: Function (obj) reading every name seen so far, keyed by name.
+    """
+
+    __slots__ = ('cls', 'getters')
+
+    def __init__(self, cls: type):
+        self.cls = cls
+        self.getters: dict[str, Callable[[Any], Any]] = {}
+
+    def get(self, obj: Any, segment: Segment) -> Any:
+        getter = self.getters.get(segment.key)
+        if getter is None:
+            getter = self._plan(segment.key)
+        return getter(obj)
+
+    def get_field_or_item(self, obj: tuple, segment: Segment) -> Any:
+        if segment.kind is SegmentKind.INDEX:
+            return _get_item(obj, segment)
+        return self.get(obj, segment)
+
+    def _plan(self, name: str) -> Callable[[Any], Any]:
+        if len(self.getters) >= ATTRIBUTE_PLAN_SIZE:
+            self.getters.clear()
+        getter = self.getters[name] = _plan_attribute(self.cls, name)
+        return getter
+
+
+def _plan_attribute(cls: type, name: str) -> Callable[[Any], Any]:
+    """
+    Decide how to read an attribute of the instances of a class.
+
+    Args:
+        cls: The class whose instances are read.
+        name: The attribute name.
+
+    Returns:
+        A function (obj) returning the attribute, or None if it is not set.
+    """
+    fields = getattr(cls, '_fields', None)
+    if issubclass(cls, tuple) and isinstance(fields, tuple) and name in fields:
+        return itemgetter(fields.index(name))
+
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            attribute = base.__dict__[name]
+            if isinstance(attribute, _DATA_ATTRIBUTES):
+                return _descriptor_getter(attribute, cls)
+            break
+
+    def get_instance_attribute(obj: Any) -> Any:
+        attributes = getattr(obj, '__dict__', None)
+        if attributes is None:
+            return None
+        return attributes.get(name)
+
+    return get_instance_attribute
+
+
+def _descriptor_getter(descriptor: Any, cls: type) -> Callable[[Any], Any]:
+    """
+    Build a getter reading a descriptor, where unset attributes (AttributeError) read as None.
+    """
+    get = descriptor.__get__
+
+    def get_descriptor(obj: Any) -> Any:
+        try:
+            return get(obj, cls)
+        except AttributeError:
+            return None
+
+    return get_descriptor
+
+
+def _get_item(obj: Sequence[Any], segment: Segment) -> Any:
+    index = segment.index
+    if index is None or not -len(obj) <= index < len(obj):
+        return None
+    return obj[index]
+
+
+def _get_nth(obj: Iterable[Any], segment: Segment) -> Any:
+    index = segment.index
+    if index is None:
+        return None
+    if index < 0:
+        last = deque(obj, maxlen=-index)
+        return last[0] if len(last) == -index else None
+    return next(islice(obj, index, None), None)
+
+
+def _iterate_in_place(obj: Iterable[Any]) -> Iterable[Any]:
+    return obj
+
+
+_DATA_ATTRIBUTES = (property, cached_property, MemberDescriptorType)
+
+_MAPPING_ACCESSOR = Accessor(_get_key)
+_OBJECT_ACCESSOR = Accessor(_get_attribute)
+_SEQUENCE_ACCESSOR = Accessor(_get_item, _iterate_in_place)
+_ITERABLE_ACCESSOR = Accessor(_get_nth, _iterate_in_place)
@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from collections import deque
+from typing import TYPE_CHECKING, Any, AsyncIterable, Iterable, Mapping, Union
+
+from deepfinder.deep_find import _select, _walk
+from deepfinder.path import CompiledPath, Segment, SegmentKind, compile_path
+
+# asyncio and inspect are imported by the functions that use them, so that importing
+# deepfinder does not pay for them.
+if TYPE_CHECKING:
+    import asyncio
+
+DEFAULT_CONCURRENCY = 64
+
+
+async def adeep_find(
+    obj: Any,
+    path: Union[str, CompiledPath],
+    path_token: str = '.',
+    default: Any = None,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Any:
+    """
+    Find a value in a nested structure that holds awaitables and async iterables.
+
+    Every awaitable met along the path (coroutines, tasks, futures, async properties)
+    is awaited before the next segment is applied. Wildcards evaluate their elements
+    concurrently: '*' and '*?' gather every branch, while '?' returns as soon as the
+    first non-None result in order is known and cancels the branches after it. Async
+    iterables are read lazily by '?' and by non-negative indexes, which stop reading at
+    the element they need, and collected into a list by the other segments.
+
+    Args:
+        obj: The object to search in. Can be a dictionary, list, or any object with attributes.
+        path: The path to the desired value using dot notation (e.g., 'users.0.name'),
+            or a path already compiled with compile_path.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+        default: The value to return if the path is not found (default: None).
+        concurrency: Maximum number of awaitables awaited at the same time (default: 64).
+
+    Returns:
+        The found value or the default value if not found.
+
+    Examples:
+        >>> async def load_user(name):
+        ...     return {'name': name}
+        >>> data = {'users': [load_user('ash'), load_user('misty')]}
+        >>> await adeep_find(data, 'users.*.name')
+        ['ash', 'misty']
+    """
+    import asyncio
+
+    if not isinstance(path, CompiledPath):
+        path = compile_path(path, path_token)
+    result = await _evaluate(obj, path.segments, 0, asyncio.Semaphore(concurrency))
+
+    if result is not None:
+        return result
+
+    return default
+
+
+async def _evaluate(obj: Any, segments: tuple[Segment, ...], position: int, semaphore: asyncio.Semaphore) -> Any:
+    """
+    Apply the segments from 'position' on, resolving awaitables before every segment.
+
+    Args:
+        obj: The current object being traversed.
+        segments: The compiled path segments.
+        position: Index of the first segment to apply.
+        semaphore: Limits how many awaitables are awaited at the same time.
+
+    Returns:
+        The found value(s) or None if not found.
+    """
+    end = len(segments)
+    while position < end:
+        obj = await _resolve(obj, semaphore)
+        if obj is None:
+            return None
+        if hasattr(obj, '__aiter__') and not isinstance(obj, Mapping):
+            segment = segments[position]
+            if segment.kind is SegmentKind.FIRST:
+                return await _first(obj, segments, position, semaphore)
+            if segment.kind is SegmentKind.INDEX:
+                obj = await _nth(obj, segment.index)
+                position += 1
+                continue
+            obj = [item async for item in obj]
+
+        value, next_position = _walk(obj, segments, position, position + 1)
+        if next_position == position:
+            return await _expand(value, segments, position, semaphore)
+        if value is None:
+            return None
+        obj = value
+        position = next_position
+
+    return await _resolve(obj, semaphore)
+
+
+async def _resolve(obj: Any, semaphore: asyncio.Semaphore) -> Any:
+    from inspect import isawaitable
+
+    while isawaitable(obj):
+        async with semaphore:
+            obj = await obj
+    return obj
+
+
+async def _expand(items: Iterable[Any], segments: tuple[Segment, ...], position: int, semaphore: asyncio.Semaphore) -> Any:
+    """
+    Evaluate the rest of the path for every element of a wildcard expansion concurrently.
+
+    Returns:
+        The list of results for '*', without None results for '*?' and '**', or the
+        first non-None result for '?'. A filter is applied once every element has
+        been resolved.
+    """
+    import asyncio
+
+    kind = segments[position].kind
+    if segments[position].selection is not None:
+        _, items = _select(items, segments[position].selection)
+    items = list(items)
+    predicate = segments[position].predicate
+    if predicate is not None:
+        items = await asyncio.gather(*(_resolve(item, semaphore) for item in items))
+        items = [item for item in items if predicate(item)]
+    branches = [_evaluate(item, segments, position + 1, semaphore) for item in items]
+    if kind is not SegmentKind.FIRST:
+        values = await asyncio.gather(*branches)
+        if kind is not SegmentKind.ALL:
+            return [value for value in values if value is not None]
+        return values
+
+    tasks = [asyncio.ensure_future(branch) for branch in branches]
+    try:
+        for task in tasks:
+            value = await task
+            if value is not None:
+                return value
+        return None
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+async def _nth(items: AsyncIterable[Any], index: int) -> Any:
+    """
+    Read the element at an index of an async iterable, or None if it is out of range.
+
+    Non-negative indexes stop reading at their element. Negative ones read the whole
+    iterable, keeping only the last elements.
+    """
+    if index < 0:
+        last = deque(maxlen=-index)
+        async for item in items:
+            last.append(item)
+        return last[0] if len(last) == -index else None
+    position = 0
+    async for item in items:
+        if position == index:
+            return item
+        position += 1
+    return None
+
+
+async def _first(items: AsyncIterable[Any], segments: tuple[Segment, ...], position: int, semaphore: asyncio.Semaphore) -> Any:
+    """
+    Evaluate a '?' segment over an async iterable without reading it further than needed.
+
+    Every element starts its branch as soon as it is read, while the next one is being
+    read. The first non-None result in order is returned as soon as the branches before
+    it have finished, and the pending read and branches are cancelled.
+    """
+    import asyncio
+
+    predicate = segments[position].predicate
+
+    async def branch(item):
+        if predicate is not None:
+            item = await _resolve(item, semaphore)
+            if not predicate(item):
+                return None
+        return await _evaluate(item, segments, position + 1, semaphore)
+
+    iterator = items.__aiter__()
+    read = asyncio.ensure_future(iterator.__anext__())
+    tasks = []
+    checked = 0
+    try:
+        while True:
+            while checked < len(tasks) and tasks[checked].done():
+                value = tasks[checked].result()
+                if value is not None:
+                    return value
+                checked += 1
+            waiting = tasks[checked:checked + 1]
+            if read is not None:
+                waiting.append(read)
+            if not waiting:
+                return None
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+            if read is None or not read.done():
+                continue
+            try:
+                item = read.result()
+            except StopAsyncIteration:
+                read = None
+                continue
+            tasks.append(asyncio.ensure_future(branch(item)))
+            read = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        if read is not None:
+            read.cancel()
+        for task in tasks:
+            task.cancel()
@@ -0,0 +1,201 @@
+from __future__ import annotations
+
+import argparse
+import json
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Any, Iterable, Iterator, Optional
+
+from deepfinder.deep_find_many import deep_find_many
+from deepfinder.path import CompiledPath, compile_path
+
+
+DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024
+
+_worker_state = {}
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    """
+    Extract paths from every document of a JSON Lines file.
+
+    Args:
+        argv: Command-line arguments, without the program name (default: sys.argv[1:]).
+
+    Returns:
+        The exit status.
+    """
+    parser = argparse.ArgumentParser(
+        prog='deepfinder',
+        description='Extract values from every document of a JSON Lines file using dot paths.',
+    )
+    parser.add_argument('paths', nargs='+', metavar='PATH', help="a path to extract, e.g. 'users.*.name'")
+    parser.add_argument('file', metavar='FILE', help="the JSON Lines file to read, or '-' for stdin")
+    parser.add_argument('-w', '--workers', type=int, default=os.cpu_count() or 1,
+                        help='number of worker processes (default: number of CPUs)')
+    parser.add_argument('-f', '--format', choices=('jsonl', 'tsv'), default='jsonl',
+                        help='output format (default: %(default)s)')
+    parser.add_argument('-u', '--unordered', action='store_true',
+                        help='write results as soon as they are ready instead of in input order')
+    parser.add_argument('-t', '--path-token', default='.',
+                        help='character used to separate path segments (default: %(default)s)')
+    parser.add_argument('-c', '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+                        help='approximate size in bytes of the input range given to a worker at a time')
+    parser.add_argument('-o', '--output', default='-', help="file to write to, or '-' for stdout (default)")
+    args = parser.parse_args(argv)
+
+    output = sys.stdout if args.output == '-' else open(args.output, 'w', encoding='utf-8')
+    try:
+        for text in scan(
+            args.file, args.paths, args.path_token, args.format,
+            args.workers, not args.unordered, args.chunk_size,
+        ):
+            output.write(text)
+    except (OSError, ValueError) as error:
+        print(f'deepfinder: error: {error}', file=sys.stderr)
+        return 1
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    return 0
+
+
+def scan(
+    file: str,
+    paths: list[str],
+    path_token: str = '.',
+    output_format: str = 'jsonl',
+    workers: int = 1,
+    ordered: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    """
+    Extract paths from every document of a JSON Lines file, in parallel.
+
+    The file is memory-mapped and split into byte ranges aligned to line boundaries.
+    Every range is evaluated by a worker process that maps the file itself, so only
+    the range offsets and the formatted output cross process boundaries.
+
+    Args:
+        file: The JSON Lines file to read, or '-' to read stdin in this process, in
+            batches of lines of about chunk_size bytes.
+        paths: The paths to extract from every document.
+        path_token: The character used to separate path segments (default: '.').
+        output_format: 'jsonl' to write an object from path to value per document, or
+            'tsv' to write the values separated by tabs (default: 'jsonl').
+        workers: Number of worker processes. With 1, everything runs in this process.
+        ordered: Whether to keep the input order of the documents (default: True).
+        chunk_size: Approximate size in bytes of every range or stdin batch.
+
+    Yields:
+        The formatted output of every range.
+    """
+    if file == '-':
+        _init_worker(None, paths, path_token, output_format)
+        while True:
+            # Line-aligned batches of about chunk_size bytes, so memory stays bounded.
+            lines = sys.stdin.buffer.readlines(chunk_size)
+            if not lines:
+                return
+            yield _evaluate_lines(lines)
+
+    with open(file, 'rb') as fp:
+        size = os.fstat(fp.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            ranges = _line_ranges(mapped, size, chunk_size)
+            if workers <= 1:
+                _init_worker(file, paths, path_token, output_format)
+                for start, end in ranges:
+                    yield _evaluate_range(start, end)
+                return
+
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(file, paths, path_token, output_format),
+            ) as executor:
+                if ordered:
+                    yield from executor.map(_evaluate_range, *zip(*ranges))
+                    return
+                futures = [executor.submit(_evaluate_range, start, end) for start, end in ranges]
+                for future in as_completed(futures):
+                    yield future.result()
+
+
+def _line_ranges(mapped: mmap.mmap, size: int, chunk_size: int) -> list[tuple[int, int]]:
+    """
+    Split a mapped file into byte ranges that start and end at line boundaries.
+
+    Args:
+        mapped: The mapped file.
+        size: The size of the file.
+        chunk_size: Approximate size in bytes of every range or stdin batch.
+
+    Returns:
+        The (start, end) offsets of the ranges.
+    """
+    ranges = []
+    start = 0
+    while start < size:
+        end = mapped.find(b'\n', min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+        ranges.append((start, end))
+        start = end
+    return ranges
+
+
+def _init_worker(file: Optional[str], paths: list[str], path_token: str, output_format: str) -> None:
+    """
+    Prepare a worker process: map the input file and compile the paths once.
+    """
+    if file is not None:
+        fp = open(file, 'rb')
+        _worker_state['mapped'] = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        fp.close()
+    _worker_state['paths'] = [compile_path(path, path_token) for path in paths]
+    _worker_state['names'] = paths
+    _worker_state['format'] = output_format
+
+
+def _evaluate_range(start: int, end: int) -> str:
+    """
+    Evaluate the paths on every line of a byte range of the mapped file.
+
+    Returns:
+        The formatted output of the range.
+    """
+    return _evaluate_lines(_worker_state['mapped'][start:end].splitlines())
+
+
+def _evaluate_lines(lines: Iterable[bytes]) -> str:
+    paths: list[CompiledPath] = _worker_state['paths']
+    names: list[str] = _worker_state['names']
+    output_format = _worker_state['format']
+
+    output = []
+    for line in lines:
+        if not line.strip():
+            continue
+        values = deep_find_many(json.loads(line), paths)
+        if output_format == 'tsv':
+            output.append('\t'.join(_tsv_field(value) for value in values))
+        else:
+            output.append(json.dumps(dict(zip(names, values)), ensure_ascii=False))
+    if not output:
+        return ''
+    return '\n'.join(output) + '\n'
+
+
+def _tsv_field(value: Any) -> str:
+    """
+    Format a value as a TSV field: strings as text, None as an empty field, anything else as JSON.
+    """
+    if value is None:
+        return ''
+    if not isinstance(value, str):
+        value = json.dumps(value, ensure_ascii=False)
+    return value.replace('\\', '\\\\').replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+from deepfinder.deep_find import _WILDCARDS, _evaluate
+from deepfinder.path import Segment, SegmentKind
+
+
+def _generate_getter(segments: tuple[Segment, ...]) -> Callable[[Any], Any]:
+    """
+    Generate a Python function specialized for a compiled path.
+
+    The generated code inlines dict.get calls, list and tuple indexing, and list
+    comprehensions or loops for wildcards, with slices and the predicates of filters
+    applied to the elements before they descend. Every step is guarded by an exact type
+    check; any other type falls back to the generic traversal engine for the rest
+    of the path, so results are the same as deep_find's.
+
+    Args:
+        segments: The compiled path segments.
+
+    Returns:
+        A function (obj) returning the found value(s) or None if not found.
+    """
+    namespace = {'_evaluate': _evaluate}
+    starts = [0] + [
+        position + 1 for position, segment in enumerate(segments)
+        if segment.kind in _WILDCARDS
+    ]
+    lines = []
+    for start in starts:
+        lines.extend(_generate_function(segments, start, namespace))
+    source = '\n'.join(lines)
+    exec(compile(source, f'<deepfinder getter {len(segments)} segments>', 'exec'), namespace)
+    return namespace['_get_0']
+
+
+def _generate_function(
+    segments: tuple[Segment, ...],
+    start: int,
+    namespace: dict[str, Any],
+) -> list[str]:
+    """
+    Generate the source of the function evaluating the path from a segment on.
+
+    Args:
+        segments: The compiled path segments.
+        start: Index of the first segment the function applies.
+        namespace: Namespace the source will run in. The path suffixes needed by the
+            generic fallbacks are added to it.
+
+    Returns:
+        The source lines of the function.
+    """
+    lines = [f'def _get_{start}(o):']
+    end = len(segments)
+    for position in range(start, end):
+        segment = segments[position]
+        kind = segment.kind
+        key = repr(segment.key)
+        fallback = f'_suffix_{position}'
+        namespace[fallback] = segments[position:]
+
+        if kind is SegmentKind.DESCENDANTS:
+            lines += [f'    return _evaluate(o, {fallback})', '']
+            return lines
+        if kind is SegmentKind.KEY:
+            lines += [
+                '    if type(o) is dict:',
+                f'        o = o.get({key})',
+                '    else:',
+                f'        return _evaluate(o, {fallback})',
+            ]
+        elif kind is SegmentKind.INDEX:
+            index = segment.index
+            lines += ['    t = type(o)', '    if t is list or t is tuple:']
+            if index >= 0:
+                lines += [f'        if {index} >= len(o):', '            return None']
+            else:
+                lines += [f'        if {-index} > len(o):', '            return None']
+            lines += [
+                f'        o = o[{index}]',
+                '    elif t is dict:',
+                f'        o = o.get({key})',
+                '    else:',
+                f'        return _evaluate(o, {fallback})',
+            ]
+        else:
+            rest = f'_get_{position + 1}'
+            items = 'o'
+            if segment.selection is not None:
+                start, stop, step = segment.selection
+                items = f'o[{start}:{stop}:{step}]'
+            if segment.predicate is not None:
+                items = f'filter(_predicate_{position}, {items})'
+                namespace[f'_predicate_{position}'] = segment.predicate
+            lines += ['    t = type(o)', '    if t is list or t is tuple:']
+            if kind is SegmentKind.ALL:
+                lines += [f'        return [{rest}(e) for e in {items}]']
+            elif kind is SegmentKind.ALL_NON_NULL:
+                lines += [f'        return [r for r in map({rest}, {items}) if r is not None]']
+            else:
+                lines += [
+                    f'        for e in {items}:',
+                    f'            r = {rest}(e)',
+                    '            if r is not None:',
+                    '                return r',
+                    '        return None',
+                ]
+            lines += [
+                '    if t is dict:',
+                f'        o = o.get({key})',
+                '    else:',
+                f'        return _evaluate(o, {fallback})',
+            ]
+
+        if position < end - 1:
+            lines += ['    if o is None:', '        return None']
+
+    lines += ['    return o', '']
+    return lines
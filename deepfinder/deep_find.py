@@ -1,13 +1,31 @@
 from __future__ import annotations
 
-from typing import Any, Iterable
+import sys
+from collections import deque
+from collections.abc import Sequence
+from itertools import count, islice
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Iterator, Optional, Union
+
+from deepfinder.accessor import _MAPPING_ACCESSOR, _SEQUENCE_ACCESSOR, _accessor_for, _accessors
+from deepfinder.path import CompiledPath, Segment, SegmentKind, _plain_tail, _recent_path, _recent_paths
+
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    from deepfinder.stats import DeepFindStats
 
 
 def deep_find(
     obj: Any,
-    path: str,
+    path: Union[str, CompiledPath],
     path_token: str = '.',
     default: Any = None,
+    stats: Optional[DeepFindStats] = None,
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+    limit: Optional[int] = None,
+    offset: int = 0,
+    flatten: Union[bool, int] = False,
 ) -> Any:
     """
     Find a value in a nested structure using a dot-notation path.
@@ -18,12 +36,39 @@ def deep_find(
 
     Args:
         obj: The object to search in. Can be a dictionary, list, or any object with attributes.
-        path: The path to the desired value using dot notation (e.g., 'users.0.name').
+        path: The path to the desired value using dot notation (e.g., 'users.0.name'),
+            or a path already compiled with compile_path.
         path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
         default: The value to return if the path is not found or raises an error (default: None).
+        stats: A DeepFindStats instance to fill with traversal counters for this call
+            (default: None, no counters are collected).
+        executor: An executor (usually a ThreadPoolExecutor) used to evaluate large wildcard
+            expansions in parallel chunks (default: None, evaluated serially).
+        workers: Evaluate large wildcard expansions in parallel on this many threads. With an
+            executor, only used to size the chunks (default: None, evaluated serially).
+            Parallel evaluation gives the same results as serial evaluation and is ignored
+            when stats are collected.
+        limit: Return at most this many of the values a wildcard ('*', '*?', '**') matches
+            (default: None, no limit). The traversal stops as soon as they are found, so
+            'users.*?.email' with limit=10 only visits users until 10 emails are found.
+            Paths with nested wildcards are paged through their flat list of values, so
+            they need flatten. Paths without those wildcards match a single value, which
+            limit and offset leave as it is.
+        offset: Skip this many values before collecting them (default: 0).
+        flatten: If True, return the values of nested wildcards in a single flat list
+            instead of a list of lists. The values are written into that list as they
+            are found, so no nested list is built. An integer flattens that many levels
+            of nesting only (default: False).
 
     Returns:
-        The found value or the default value if not found.
+        The found value or the default value if not found. With a limit or an offset,
+        the page of the list deep_find would return for the path. Parallel evaluation
+        is not used with a limit, an offset or flatten.
+
+    Raises:
+        ValueError: If limit, offset or flatten is negative, or if limit or offset is
+            given for a path with nested wildcards without flatten.
 
     Examples:
         >>> data = {'users': [{'name': 'John'}, {'name': 'Jane'}]}
@@ -31,11 +76,36 @@ def deep_find(
         'John'
         >>> deep_find(data, 'users.*.name')
         ['John', 'Jane']
+        >>> deep_find(data, 'users.*.name', limit=1, offset=1)
+        ['Jane']
+        >>> deep_find({'teams': [{'users': ['John']}, {'users': ['Jane']}]}, 'teams.*.users.*', flatten=True)
+        ['John', 'Jane']
     """
-    path = path.split(path_token)
-    if path == ['']:
-        path = None
-    result = _rec_helper(obj, path)
+    if not isinstance(path, CompiledPath):
+        compiled = _recent_paths.get((path, path_token))
+        path = compiled if compiled is not None else _recent_path(path, path_token)
+    windowed = limit is not None or offset
+    if windowed and (offset < 0 or (limit is not None and limit < 0)):
+        raise ValueError(f'limit and offset must not be negative: limit={limit}, offset={offset}')
+
+    if flatten is not False:
+        flatten = _flatten_levels(flatten)
+    if windowed and any(segment.kind in _LISTED for segment in path._segments):
+        result = _find_window(obj, path, offset, limit, stats, flatten)
+    elif stats is not None:
+        from deepfinder.stats import _evaluate_with_stats
+        result = _evaluate_with_stats(obj, path, stats, flatten)
+    elif flatten:
+        result = _evaluate(obj, path._segments, flatten=flatten)
+    elif executor is not None or workers is not None:
+        from deepfinder.parallel import _evaluate_parallel
+        result = _evaluate_parallel(obj, path._segments, executor, workers)
+    elif path._getter is not None:
+        result = path._getter(obj)
+    elif path._plain is not None:
+        result = _follow(obj, path._plain, path._segments)
+    else:
+        result = _evaluate(obj, path._segments)
 
     if result is not None:
         return result
@@ -43,83 +113,444 @@ def deep_find(
     return default
 
 
-def _rec_helper(obj: Any, path: list[str]) -> Any:
+def _flatten_levels(flatten: Union[bool, int]) -> int:
+    """
+    Get the number of levels of nested lists a flatten argument merges.
+    """
+    if flatten is True:
+        return sys.maxsize
+    if flatten < 0:
+        raise ValueError(f'flatten must not be negative: {flatten}')
+    return int(flatten)
+
+
+def _find_window(
+    obj: Any,
+    path: CompiledPath,
+    offset: int,
+    limit: Optional[int],
+    stats: Optional[DeepFindStats],
+    flatten: int,
+) -> Optional[list[Any]]:
+    """
+    Collect the matched values of a wildcard path from offset on, stopping the traversal after limit of them.
+
+    The values are counted as deep_iter yields them, which is the order of the list
+    deep_find returns, flattened when the path has nested wildcards.
+
+    Returns:
+        The list of matched values, or None if the wildcards have nothing to expand,
+        where deep_find would return None.
+
+    Raises:
+        ValueError: If the path has nested wildcards and flatten does not merge them.
+    """
+    segments = path.segments
+    listed = [position for position, segment in enumerate(segments) if segment.kind in _LISTED]
+    if flatten < len(listed) - 1:
+        raise ValueError(f'limit and offset need flatten=True on a path with nested wildcards: {path.path!r}')
+    stop = None if limit is None else offset + limit
+    if stats is not None:
+        from deepfinder.stats import _iterate_with_stats
+        values = _iterate_with_stats(obj, path, stats, offset, stop)
+    elif stop == offset:
+        values = []
+    else:
+        from deepfinder.deep_iter import _iterate
+        values = list(islice(_iterate(obj, segments), offset, stop))
+    if values or _evaluate(obj, segments[:listed[0] + 1]) is not None:
+        return values
+    return None
+
+
+_WILDCARDS = frozenset((SegmentKind.ALL, SegmentKind.FIRST, SegmentKind.ALL_NON_NULL))
+
+# The segments that turn their matches into a list, one level of nesting each.
+_LISTED = frozenset((SegmentKind.ALL, SegmentKind.ALL_NON_NULL, SegmentKind.DESCENDANTS))
+
+# Reading an enum member goes through the enum class, which is slow enough to show up in
+# per-element loops, so those compare with these aliases instead.
+_ALL = SegmentKind.ALL
+_FIRST = SegmentKind.FIRST
+_DESCENDANTS = SegmentKind.DESCENDANTS
+
+_NOTHING = object()
+_MERGED = object()
+
+
+class _Frame:
+    """
+    A pending wildcard expansion on the traversal stack.
+
+    Attributes:
+        kind: The wildcard kind ('*', '?' or '*?').
+        items: Iterator over the elements that are still to be visited. Containers are
+            iterated in place, so lazy iterables are only consumed as far as needed.
+        position: Index of the segment each element continues from.
+        results: The collected results, or None for the '?' operator.
+        level: Number of collecting frames enclosing this one, when flattening.
+        merged: Whether results is the list of an enclosing frame, which this frame
+            writes its results into instead of producing a nested list.
     """
-    Recursive helper function to traverse the object structure.
 
-    This function handles the actual traversal of the object structure, supporting
-    dictionaries, lists, and objects with attributes.
+    __slots__ = ('kind', 'items', 'position', 'results', 'level', 'merged')
+
+    def __init__(self, kind: SegmentKind, items: Iterator[Any], position: int):
+        self.kind = kind
+        self.items = items
+        self.position = position
+        self.results = None if kind is _FIRST else []
+        self.level = 0
+        self.merged = False
+
+
+def _evaluate(
+    obj: Any,
+    segments: tuple[Segment, ...],
+    walk: Optional[Callable[[Any, tuple[Segment, ...], int, int], tuple[Any, int]]] = None,
+    flatten: int = 0,
+) -> Any:
+    """
+    Iterative traversal engine.
+
+    The object is walked with a cursor over the compiled segments. Every wildcard
+    segment pushes a frame on an explicit stack instead of recursing, so neither
+    the path nor the remaining segments are copied per element and the depth of
+    the data is not limited by the recursion limit.
+
+    When the rest of the path after a wildcard only has keys and indexes, the wildcard
+    is evaluated by _follow_tail in a single loop instead, without going through the
+    stack for every element.
+
+    When flattening, the frames of nested wildcards up to the given level write into
+    the list of their enclosing wildcard, so the nested lists are never built.
 
     Args:
-        obj: The current object being traversed.
-        path: List of path segments remaining to traverse.
+        obj: The object to traverse.
+        segments: The compiled path segments.
+        walk: Replacement for _walk, used to instrument the traversal (default: _walk).
+        flatten: Number of levels of nested wildcard lists to merge (default: 0).
 
     Returns:
-        The found value or None if not found.
+        The found value(s) or None if not found.
     """
-    if not path:
+    tails = None if walk is not None else {}
+    if walk is None:
+        walk = _walk
+    end = len(segments)
+    obj, position = walk(obj, segments, 0, end)
+    if position == end:
         return obj
 
-    current_path = path.pop(0)
+    stack = []
+    while True:
+        if position < end:
+            segment = segments[position]
+            frame = _Frame(segment.kind, _elements(obj, segment), position + 1)
+            if flatten and frame.results is not None:
+                _merge(frame, stack, flatten)
+            tail = None
+            if tails is not None:
+                tail = tails.get(position, _NOTHING)
+                if tail is _NOTHING:
+                    tail = tails[position] = _plain_tail(segments, position + 1)
+            if tail is None:
+                stack.append(frame)
+                value = _NOTHING
+            else:
+                value = _follow_tail(frame, tail, segments)
+        else:
+            value = obj
 
-    if isinstance(obj, dict):
-        return _rec_helper(obj.get(current_path), path)
+        while stack:
+            frame = stack[-1]
+            if value is not _NOTHING:
+                if frame.kind is _FIRST:
+                    if value is not None:
+                        stack.pop()
+                        continue
+                elif (frame.kind is _ALL or value is not None) and value is not _MERGED:
+                    frame.results.append(value)
+            obj = next(frame.items, _NOTHING)
+            if obj is not _NOTHING:
+                break
+            stack.pop()
+            value = _MERGED if frame.merged else frame.results
+        else:
+            return value
+        obj, position = walk(obj, segments, frame.position, end)
 
-    if isinstance(obj, Iterable) and not isinstance(obj, str):
-        obj = list(obj)
 
-    if isinstance(obj, list):
-        return _rec_list_helper(obj, path, current_path)
+def _follow(obj: Any, tail: tuple[tuple[str, Optional[int], int], ...], segments: tuple[Segment, ...]) -> Any:
+    """
+    Follow keys and indexes from an object, with the lookups on dictionaries, lists and tuples inlined.
 
-    if hasattr(obj, '__dict__') and current_path in vars(obj):
-        return _rec_helper(vars(obj)[current_path], path)
-    
-    return
+    Args:
+        obj: The object to start from.
+        tail: The rest of the path, as returned by _plain_tail.
+        segments: The compiled path segments.
+
+    Returns:
+        The found value or None if the path did not match.
+    """
+    for key, index, position in tail:
+        cls = type(obj)
+        if cls is dict:
+            obj = obj.get(key)
+        elif _accessors.get(cls) is _SEQUENCE_ACCESSOR:
+            obj = obj[index] if index is not None and -len(obj) <= index < len(obj) else None
+        elif obj is not None:
+            return _walk(obj, segments, position, len(segments))[0]
+    return obj
 
 
-def _rec_list_helper(obj: list[Any], path: list[str], current_path: str):
+def _follow_tail(
+    frame: _Frame,
+    tail: tuple[tuple[str, Optional[int], int], ...],
+    segments: tuple[Segment, ...],
+) -> Any:
     """
-    Helper function to handle list traversal with special operators.
+    Evaluate a wildcard whose rest of the path only has keys and indexes.
 
-    This function handles the traversal of lists with support for special operators:
-    - '*': Get all items
-    - '?': Get first non-null value
-    - '*?': Get all non-null values
+    Lookups on dictionaries, lists and tuples are inlined; other types go through _walk.
 
     Args:
-        obj: The list to traverse.
-        path: List of path segments remaining to traverse.
-        current_path: The current path segment being processed.
+        frame: The frame of the wildcard, which is not pushed on the stack.
+        tail: The rest of the path, as returned by _plain_tail.
+        segments: The compiled path segments.
 
     Returns:
-        The found value(s) or None if not found.
+        What the frame gives its enclosing frame: the first non-None result for '?' (or
+        None), _MERGED when writing into an enclosing list, otherwise the list of results.
+    """
+    end = len(segments)
+    first = frame.kind is _FIRST
+    keep_nones = frame.kind is _ALL
+    results = frame.results
+    for value in frame.items:
+        for key, index, position in tail:
+            cls = type(value)
+            if cls is dict:
+                value = value.get(key)
+            elif _accessors.get(cls) is _SEQUENCE_ACCESSOR:
+                value = value[index] if index is not None and -len(value) <= index < len(value) else None
+            elif value is not None:
+                value = _walk(value, segments, position, end)[0]
+                break
+        if value is not None:
+            if first:
+                return value
+            results.append(value)
+        elif keep_nones:
+            results.append(None)
+    if first:
+        return None
+    return _MERGED if frame.merged else results
 
-    Examples:
-        >>> data = [{'name': 'John'}, {'name': 'Jane'}]
-        >>> _rec_list_helper(data, ['name'], '*')
-        ['John', 'Jane']
-        >>> _rec_list_helper(data, ['age'], '?')
-        None
-    """
-    if current_path == '*':
-        return [_rec_helper(sub_obj, path.copy()) for sub_obj in obj]
-
-    if current_path in ['*?', '?*']:
-        with_nones_results = [_rec_helper(sub_obj, path.copy()) for sub_obj in obj]
-        clear_results = [obj for obj in with_nones_results if obj is not None]
-        return clear_results
-
-    if current_path == '?':
-        for sub_obj in obj:
-            result = _rec_helper(sub_obj, path.copy())
-            if result is not None:
-                return result
-        return
 
-    try:
-        current_path_index = int(current_path)
-    except ValueError as _:
+def _merge(frame: _Frame, stack: list[_Frame], flatten: int) -> None:
+    """
+    Make a collecting frame write into the list of the closest collecting frame below it.
+
+    '?' frames in between are skipped: the first element that reaches a nested wildcard
+    resolves them, so every result written from then on is kept.
+    """
+    for parent in reversed(stack):
+        if parent.results is not None:
+            frame.level = parent.level + 1
+            if frame.level <= flatten:
+                frame.results = parent.results
+                frame.merged = True
+            return
+
+
+def _walk(obj: Any, segments: tuple[Segment, ...], position: int, end: int) -> tuple[Any, int]:
+    """
+    Follow key and index segments until the path ends or a wildcard must be expanded.
+
+    Children are read through the accessor of the object's type, which is resolved
+    once per type and cached.
+
+    Args:
+        obj: The current object being traversed.
+        segments: The compiled path segments.
+        position: Index of the first segment to apply.
+        end: Number of segments in the path.
+
+    Returns:
+        A (value, position) pair. When position is lower than end, value is the iterable
+        the wildcard segment at that position expands to. Otherwise value is the
+        found value, or None if the path did not match.
+    """
+    while position < end:
+        segment = segments[position]
+        cls = type(obj)
+
+        if cls is dict:
+            value = obj.get(segment.key)
+        else:
+            accessor = _accessors.get(cls) or _accessor_for(cls)
+            if accessor.iterate is not None and segment.kind in _WILDCARDS:
+                return accessor.iterate(obj), position
+            value = accessor.get(obj, segment)
+
+        if value is None:
+            if segment.kind is _DESCENDANTS and obj is not None:
+                depth = segment.key[2:].partition('[')[0]
+                max_depth = int(depth) if depth else None
+                prune = position + 1 < end and segments[position + 1].kind is not _DESCENDANTS
+                return _descendants(obj, max_depth, prune), position
+            return None, end
+        obj = value
+        position += 1
+
+    return obj, position
+
+
+def _elements(items: Iterable[Any], segment: Segment) -> Iterator[Any]:
+    """
+    Iterate over the elements a wildcard expands to, skipping those its filter rejects.
+
+    Slices and filters are applied here, before any element descends into the rest of
+    the path.
+    """
+    if segment.selection is not None:
+        _, items = _select(items, segment.selection)
+    if segment.predicate is None:
+        return iter(items)
+    return filter(segment.predicate, items)
+
+
+def _select(items: Iterable[Any], selection: tuple[Optional[int], ...]) -> tuple[Iterable[int], Iterable[Any]]:
+    """
+    Select the elements of a slice segment, without copying the iterable when possible.
+
+    Sequences are indexed directly. Other iterables are read with islice when the slice
+    counts from the start, or through a deque of the last elements when it counts from
+    the end. Only the remaining slices, such as negative steps, copy them into a list.
+
+    Args:
+        items: The iterable the segment expands.
+        selection: The (start, stop, step) bounds of the segment.
+
+    Returns:
+        An (indices, elements) pair, where indices are the positions of the selected
+        elements in items.
+    """
+    start, stop, step = selection
+    if isinstance(items, Sequence):
+        indices = range(len(items))[start:stop:step]
+        if type(items) is list or type(items) is tuple:
+            return indices, items[start:stop:step]
+        return indices, map(items.__getitem__, indices)
+
+    step = step or 1
+    if _is_forward(selection):
+        start = start or 0
+        indices = count(start, step) if stop is None else range(start, stop, step)
+        return indices, islice(items, start, stop, step)
+    if _is_tail(selection):
+        last = list(deque(enumerate(items), maxlen=-start))[:stop:step]
+        return [index for index, _ in last], [item for _, item in last]
+
+    items = list(items)
+    return range(len(items))[start:stop:step], items[start:stop:step]
+
+
+def _is_forward(selection: tuple[Optional[int], ...]) -> bool:
+    """Whether a slice only has non-negative bounds and a positive step."""
+    start, stop, step = selection
+    return (step is None or step > 0) and (start is None or start >= 0) and (stop is None or stop >= 0)
+
+
+def _is_tail(selection: tuple[Optional[int], ...]) -> bool:
+    """Whether a slice selects among the last elements only, with a positive step."""
+    start, stop, step = selection
+    return (step is None or step > 0) and start is not None and start < 0 and (stop is None or stop < 0)
+
+
+_SCALARS = (str, int, float, complex, type(None))
+
+
+def _descendants(obj: Any, max_depth: Optional[int], prune: bool) -> Iterator[Any]:
+    """
+    Iterate over an object and everything below it, depth first and in order.
+
+    The traversal keeps a stack of child iterators instead of recursing, and never
+    builds the list of descendants. A container reached through several paths (a
+    shared reference) is visited every time, like in a tree, but one that is already
+    among its own ancestors (a cyclic reference) is skipped.
+
+    Args:
+        obj: The object to descend from. It is yielded first.
+        max_depth: Maximum number of levels below obj to visit, or None for no limit.
+        prune: Whether to skip scalars (strings, numbers, None), for when the segment
+            that follows cannot match anything on a scalar.
+
+    Yields:
+        obj and its descendants.
+    """
+    yield obj
+    if max_depth == 0:
         return
-    if current_path_index >= len(obj):
+    children = _children(obj)
+    if children is None:
         return
-    return _rec_helper(obj[current_path_index], path)
+    # ancestors holds the container of every iterator in stack, which keeps their ids
+    # in ancestor_ids valid while they are being visited.
+    ancestors = [obj]
+    ancestor_ids = {id(obj)}
+    stack = [iter(children)]
+    while stack:
+        child = next(stack[-1], _NOTHING)
+        if child is _NOTHING:
+            stack.pop()
+            ancestor_ids.discard(id(ancestors.pop()))
+            continue
+        if isinstance(child, _SCALARS):
+            if not prune and child is not None:
+                yield child
+            continue
+        if id(child) in ancestor_ids:
+            continue
+        yield child
+        if max_depth is None or len(stack) < max_depth:
+            children = _children(child)
+            if children is not None:
+                stack.append(iter(children))
+                ancestors.append(child)
+                ancestor_ids.add(id(child))
+
+
+def _children(obj: Any) -> Optional[Iterable[Any]]:
+    """
+    Get the direct children of an object: mapping values, iterable elements or attributes.
+
+    Returns:
+        An iterable over the children, or None if the object has none.
+    """
+    if type(obj) is dict:
+        return obj.values()
+    if isinstance(obj, _SCALARS):
+        return None
+    accessor = _accessors.get(type(obj)) or _accessor_for(type(obj))
+    if accessor is _MAPPING_ACCESSOR:
+        return obj.values()
+    if accessor.iterate is not None:
+        return accessor.iterate(obj)
+    attributes = getattr(obj, '__dict__', None)
+    slots = [
+        getattr(obj, name, None)
+        for base in type(obj).__mro__
+        for name in _slot_names(base)
+    ]
+    if attributes is None:
+        return slots or None
+    return [*attributes.values(), *slots]
+
+
+def _slot_names(cls: type) -> tuple[str, ...]:
+    slots = cls.__dict__.get('__slots__', ())
+    if isinstance(slots, str):
+        slots = (slots,)
+    return tuple(name for name in slots if name not in ('__dict__', '__weakref__'))
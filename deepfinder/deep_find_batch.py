@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import atexit
+import os
+import pickle
+from typing import TYPE_CHECKING, Any, Hashable, Iterable, Mapping, Optional, Sequence, Union
+
+from deepfinder.deep_find_many import deep_find_many
+from deepfinder.path import CompiledPath
+
+# multiprocessing is imported by the functions that use it, so that importing
+# deepfinder does not pay for it.
+if TYPE_CHECKING:
+    from multiprocessing import shared_memory
+
+BATCH_THRESHOLD = 1000
+CHUNKS_PER_PROCESS = 4
+
+_pools = {}
+
+
+def deep_find_batch(
+    docs: Sequence[Any],
+    paths: Union[Iterable[Union[str, CompiledPath]], Mapping[Hashable, Union[str, CompiledPath]]],
+    processes: Optional[int] = None,
+    path_token: str = '.',
+    default: Any = None,
+    defaults: Optional[Mapping[Hashable, Any]] = None,
+) -> list[Union[tuple[Any, ...], dict[Hashable, Any]]]:
+    """
+    Find the values of several paths in every document of a batch, using worker processes.
+
+    The documents are split into chunks. Every chunk is serialized once into a shared
+    memory segment that a worker attaches to, and the worker writes its results back
+    into another segment, so no document or result goes through the pool's pipes. The
+    pool is created on first use and reused by later calls, which keeps the paths
+    compiled in the workers. Batches smaller than BATCH_THRESHOLD documents are
+    evaluated in this process.
+
+    Args:
+        docs: The documents to search in. They must be picklable.
+        paths: The paths to find, as accepted by deep_find_many.
+        processes: Number of worker processes (default: the number of CPUs).
+            With 1, everything runs in this process.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored for paths that are already compiled.
+        default: The value to return for a path that is not found (default: None).
+        defaults: Per-path default values, as accepted by deep_find_many.
+
+    Returns:
+        The deep_find_many result of every document, in order.
+
+    Examples:
+        >>> docs = [{'id': index, 'user': {'name': f'user{index}'}} for index in range(10_000)]
+        >>> results = deep_find_batch(docs, ['id', 'user.name'], processes=4)
+        >>> results[42]
+        (42, 'user42')
+    """
+    if not isinstance(paths, Mapping):
+        paths = list(paths)
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if processes <= 1 or len(docs) < BATCH_THRESHOLD:
+        return _evaluate_documents(docs, paths, path_token, default, defaults)
+
+    size = -(-len(docs) // (processes * CHUNKS_PER_PROCESS))
+    segments = []
+    try:
+        tasks = []
+        for start in range(0, len(docs), size):
+            segment, length = _share(list(docs[start:start + size]))
+            segments.append(segment)
+            tasks.append((segment.name, length, paths, path_token, default, defaults))
+
+        # Every task is waited for, even after one fails, so that the result segments of
+        # the others are released instead of staying in shared memory.
+        results = []
+        error = None
+        outcomes = _pool(processes).imap(_evaluate_shared, tasks)
+        for _ in tasks:
+            try:
+                name, length = next(outcomes)
+            except Exception as exception:
+                if error is None:
+                    error = exception
+                continue
+            if error is not None:
+                _release(name)
+                continue
+            try:
+                results.extend(_receive(name, length))
+            except Exception as exception:
+                error = exception
+        if error is not None:
+            raise error
+        return results
+    finally:
+        for segment in segments:
+            segment.close()
+            segment.unlink()
+
+
+def _evaluate_documents(
+    docs: Iterable[Any],
+    paths: Union[list[Any], dict[Hashable, Any]],
+    path_token: str,
+    default: Any,
+    defaults: Optional[Mapping[Hashable, Any]],
+) -> list[Any]:
+    return [deep_find_many(doc, paths, path_token, default, defaults) for doc in docs]
+
+
+def _share(value: Any) -> tuple[shared_memory.SharedMemory, int]:
+    """
+    Serialize a value into a new shared memory segment.
+
+    Returns:
+        The segment and the length of the serialized value.
+    """
+    from multiprocessing import shared_memory
+
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    segment = shared_memory.SharedMemory(create=True, size=max(len(data), 1))
+    segment.buf[:len(data)] = data
+    return segment, len(data)
+
+
+def _receive(name: str, length: int) -> Any:
+    """
+    Deserialize a value from a shared memory segment, then release the segment.
+    """
+    from multiprocessing import shared_memory
+
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        return pickle.loads(segment.buf[:length])
+    finally:
+        segment.close()
+        segment.unlink()
+
+
+def _release(name: str) -> None:
+    """
+    Release a shared memory segment without reading it.
+    """
+    from multiprocessing import shared_memory
+
+    segment = shared_memory.SharedMemory(name=name)
+    segment.close()
+    segment.unlink()
+
+
+def _evaluate_shared(task: tuple) -> tuple[str, int]:
+    """
+    Worker entry point: evaluate the paths on the documents of a shared segment.
+
+    Returns:
+        The name of the segment holding the results and the length of the results.
+    """
+    from multiprocessing import shared_memory
+
+    name, length, paths, path_token, default, defaults = task
+    segment = shared_memory.SharedMemory(name=name)
+    try:
+        docs = pickle.loads(segment.buf[:length])
+    finally:
+        segment.close()
+
+    results, length = _share(_evaluate_documents(docs, paths, path_token, default, defaults))
+    results.close()
+    return results.name, length
+
+
+def _pool(processes: int):
+    """
+    Return the persistent pool with the given number of processes, creating it on first use.
+    """
+    pool = _pools.get(processes)
+    if pool is None:
+        import multiprocessing
+
+        pool = _pools[processes] = multiprocessing.Pool(processes)
+    return pool
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.terminate()
+        pool.join()
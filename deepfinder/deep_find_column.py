@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from array import array
+from collections.abc import Sized
+from typing import Any, Iterable, Union
+
+from deepfinder.deep_find import _evaluate
+from deepfinder.path import CompiledPath, compile_path
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - numpy is optional
+    numpy = None
+
+
+DEFAULT_DTYPE = 'd'
+
+
+def deep_find_column(
+    records: Iterable[Any],
+    path: Union[str, CompiledPath],
+    dtype: Any = None,
+    missing: Any = None,
+    path_token: str = '.',
+) -> tuple[Any, Any]:
+    """
+    Find the value of a path in every record of a batch and store them in a typed array.
+
+    The path is compiled once and the values are written into a preallocated array
+    instead of an intermediate list. When NumPy is installed, NumPy arrays are
+    returned, otherwise array.array objects are used.
+
+    Args:
+        records: The records to search in. Iterables without a length are read into
+            a list of references first, so the arrays can be preallocated.
+        path: The path to the desired value using dot notation (e.g., 'metrics.latency_ms'),
+            or a path already compiled with compile_path.
+        dtype: The type of the values, as an array.array type code (e.g., 'd', 'q') or,
+            when NumPy is installed, anything numpy.dtype accepts (default: 'd').
+        missing: The value stored where the path is not found (default: NaN for
+            floating point types and 0 otherwise).
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+
+    Returns:
+        A (values, mask) pair of arrays with one entry per record. mask is set where
+        the path was not found in the record, or where its value cannot be stored as
+        dtype (e.g. a string in a numeric column); values holds missing there. mask is
+        a boolean NumPy array, or an array.array of 0 and 1 without NumPy.
+
+    Examples:
+        >>> records = [{'metrics': {'latency_ms': 12.5}}, {'metrics': {}}, {'metrics': {'latency_ms': 'n/a'}}]
+        >>> values, mask = deep_find_column(records, 'metrics.latency_ms')
+        >>> values.tolist(), [bool(flag) for flag in mask]
+        ([12.5, nan, nan], [False, True, True])
+    """
+    if not isinstance(path, CompiledPath):
+        path = compile_path(path, path_token)
+    segments = path.segments
+    if not isinstance(records, Sized):
+        records = list(records)
+    size = len(records)
+    if dtype is None:
+        dtype = DEFAULT_DTYPE
+
+    if numpy is not None:
+        dtype = numpy.dtype(dtype)
+        if missing is None:
+            missing = numpy.nan if dtype.kind in 'fc' else 0
+        values = numpy.full(size, missing, dtype=dtype)
+        mask = numpy.zeros(size, dtype=numpy.bool_)
+    else:
+        if missing is None:
+            missing = float('nan') if dtype in 'fd' else 0
+        values = array(dtype, [missing]) * size
+        mask = array('B', bytes(size))
+
+    for index, record in enumerate(records):
+        value = _evaluate(record, segments)
+        if value is None:
+            mask[index] = True
+            continue
+        try:
+            values[index] = value
+        except (TypeError, ValueError, OverflowError) as _:
+            mask[index] = True
+
+    return values, mask
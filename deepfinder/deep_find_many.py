@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
+from functools import lru_cache
+from typing import Any, Hashable, Iterable, Mapping, Optional, Union
+
+from deepfinder.deep_find import _WILDCARDS, _select, _walk
+from deepfinder.path import PATH_CACHE_SIZE, CompiledPath, Segment, SegmentKind, compile_path
+
+
+def deep_find_many(
+    obj: Any,
+    paths: Union[Iterable[Union[str, CompiledPath]], Mapping[Hashable, Union[str, CompiledPath]]],
+    path_token: str = '.',
+    default: Any = None,
+    defaults: Optional[Mapping[Hashable, Any]] = None,
+) -> Union[tuple[Any, ...], dict[Hashable, Any]]:
+    """
+    Find the values of several paths in a single traversal.
+
+    The paths are merged into a prefix trie, so segments shared by several paths
+    (including a common wildcard) are visited once for all of them. Every path
+    gets the same result deep_find would return for it.
+
+    Args:
+        obj: The object to search in. Can be a dictionary, list, or any object with attributes.
+        paths: The paths to find, either as a sequence of paths or as a mapping from a
+            result name to a path. Paths can be strings or compiled paths.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored for paths that are already compiled.
+        default: The value to return for a path that is not found (default: None).
+        defaults: Per-path default values, keyed by result name when paths is a mapping,
+            or by the path itself otherwise. They take precedence over default.
+
+    Returns:
+        A tuple with the result of every path in order, or a dictionary from result
+        name to result when paths is a mapping.
+
+    Examples:
+        >>> data = {'order': {'customer': {'id': 1, 'email': 'ash@kanto.com'}}}
+        >>> deep_find_many(data, ['order.customer.id', 'order.customer.email'])
+        (1, 'ash@kanto.com')
+        >>> deep_find_many(data, {'id': 'order.customer.id', 'phone': 'order.customer.phone'},
+        ...                defaults={'phone': 'unknown'})
+        {'id': 1, 'phone': 'unknown'}
+    """
+    if isinstance(paths, Mapping):
+        names = tuple(paths.keys())
+        paths = tuple(paths.values())
+    else:
+        paths = tuple(paths)
+        names = None
+
+    compiled = tuple(
+        path if isinstance(path, CompiledPath) else compile_path(path, path_token)
+        for path in paths
+    )
+    results = {}
+    _evaluate_node(obj, _build_trie(compiled), results, None)
+
+    keys = names if names is not None else paths
+    values = []
+    for path_id, key in enumerate(keys):
+        value = results.get(path_id)
+        if value is None:
+            value = defaults.get(key, default) if defaults else default
+        values.append(value)
+
+    if names is not None:
+        return dict(zip(names, values))
+    return tuple(values)
+
+
+class _TrieNode:
+    """
+    A node of the prefix trie built from the paths of a deep_find_many call.
+
+    Attributes:
+        step: The segment leading to this node, as a one-segment path.
+        terminals: Ids of the paths that end at this node.
+        children: Child nodes reached through key and index segments, keyed by segment.
+        fanouts: Child nodes reached through wildcard segments, keyed by segment.
+        ids: Ids of every path that goes through this node.
+    """
+
+    __slots__ = ('step', 'terminals', 'children', 'fanouts', 'ids')
+
+    def __init__(self, step: tuple[Segment, ...]):
+        self.step = step
+        self.terminals = []
+        self.children = {}
+        self.fanouts = {}
+        self.ids = frozenset()
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _build_trie(paths: tuple[CompiledPath, ...]) -> _TrieNode:
+    """
+    Merge compiled paths into a prefix trie.
+
+    Args:
+        paths: The compiled paths. Their position is used as their id.
+
+    Returns:
+        The root node of the trie.
+    """
+    root = _TrieNode(())
+    for path_id, path in enumerate(paths):
+        node = root
+        node.ids |= {path_id}
+        for segment in path.segments:
+            children = node.fanouts if segment.kind in _WILDCARDS else node.children
+            child = children.get(segment)
+            if child is None:
+                child = children[segment] = _TrieNode((segment,))
+            node = child
+            node.ids |= {path_id}
+        node.terminals.append(path_id)
+    return root
+
+
+def _evaluate_node(
+    obj: Any,
+    node: _TrieNode,
+    results: dict[int, Any],
+    wanted: Optional[set[int]],
+) -> None:
+    """
+    Find the values of every path below a trie node.
+
+    The recursion follows the trie, not the data, so its depth is bounded by the
+    length of the longest path.
+
+    Args:
+        obj: The object the node applies to.
+        node: The trie node.
+        results: Dictionary where the found values are stored by path id. Paths that
+            are not found are left out.
+        wanted: Ids of the paths that still have to be found, or None for all of them.
+    """
+    for path_id in node.terminals:
+        if wanted is None or path_id in wanted:
+            results[path_id] = obj
+    if obj is None:
+        return
+    if isinstance(obj, Iterator) and len(node.children) + bool(node.fanouts) > 1:
+        # Every child and the wildcards read the iterator, which can only be read once.
+        obj = list(obj)
+
+    for child in node.children.values():
+        if wanted is not None and wanted.isdisjoint(child.ids):
+            continue
+        value, position = _walk(obj, child.step, 0, 1)
+        if position == 0:
+            # A '**' segment, expanded to the descendants of the object.
+            _expand(value, [child], results, wanted)
+        elif value is not None:
+            _evaluate_node(value, child, results, wanted)
+
+    if not node.fanouts:
+        return
+
+    fanouts = [
+        child for child in node.fanouts.values()
+        if wanted is None or not wanted.isdisjoint(child.ids)
+    ]
+    if not fanouts:
+        return
+    value, position = _walk(obj, fanouts[0].step, 0, 1)
+    if position == 0:
+        sliced = [child for child in fanouts if child.step[0].selection is not None]
+        if sliced:
+            # Every slice selects its own elements, so the iterable is read more than once.
+            if len(fanouts) > 1 and not isinstance(value, Sequence):
+                value = list(value)
+            for child in sliced:
+                _expand(_select(value, child.step[0].selection)[1], [child], results, wanted)
+            fanouts = [child for child in fanouts if child.step[0].selection is None]
+        if fanouts:
+            _expand(value, fanouts, results, wanted)
+        return
+
+    # Not an iterable: wildcard segments are plain keys of dictionaries and objects.
+    for child in fanouts:
+        value, _ = _walk(obj, child.step, 0, 1)
+        if value is not None:
+            _evaluate_node(value, child, results, wanted)
+
+
+def _expand(
+    obj: Iterable[Any],
+    fanouts: list[_TrieNode],
+    results: dict[int, Any],
+    wanted: Optional[set[int]],
+) -> None:
+    """
+    Expand the wildcard segments that follow a trie node over the same iterable.
+
+    The elements are visited once, and each of them is evaluated for every wildcard
+    ('*', '?' and '*?', or a single '**') and every path below them at the same time.
+    Each wildcard only evaluates the elements its filter, if any, accepts.
+
+    Args:
+        obj: The iterable the wildcards apply to.
+        fanouts: The trie nodes the wildcards lead to.
+        results: Dictionary where the found values are stored by path id.
+        wanted: Ids of the paths that still have to be found, or None for all of them.
+    """
+    collectors = []
+    pendings = []
+    for node in fanouts:
+        ids = node.ids if wanted is None else node.ids & wanted
+        segment = node.step[0]
+        if segment.kind is SegmentKind.FIRST:
+            pendings.append((node, segment.predicate, set(ids)))
+        else:
+            keep_nones = segment.kind is SegmentKind.ALL
+            collectors.append((node, segment.predicate, keep_nones, {path_id: [] for path_id in ids}))
+
+    for sub_obj in obj:
+        for node, predicate, keep_nones, lists in collectors:
+            if predicate is not None and not predicate(sub_obj):
+                continue
+            sub_results = {}
+            _evaluate_node(sub_obj, node, sub_results, wanted)
+            for path_id, values in lists.items():
+                value = sub_results.get(path_id)
+                if keep_nones or value is not None:
+                    values.append(value)
+
+        for node, predicate, pending in pendings:
+            if not pending or (predicate is not None and not predicate(sub_obj)):
+                continue
+            sub_results = {}
+            _evaluate_node(sub_obj, node, sub_results, pending)
+            for path_id, value in sub_results.items():
+                if value is not None:
+                    results[path_id] = value
+                    pending.discard(path_id)
+
+        if not collectors and not any(pending for _, _, pending in pendings):
+            break
+
+    for _, _, _, lists in collectors:
+        results.update(lists)
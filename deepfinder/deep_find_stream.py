@@ -0,0 +1,504 @@
+from __future__ import annotations
+
+import codecs
+import io
+import json
+import re
+import sys
+from collections import deque
+from typing import IO, Any, Iterator, Optional, Union
+
+from deepfinder.deep_find import _WILDCARDS, _is_forward
+from deepfinder.path import CompiledPath, Segment, SegmentKind, compile_path
+
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_STRING_END = re.compile(r'["\\]')
+_STRUCTURE = re.compile(r'["\[\]{}]')
+_SCALAR_END = re.compile(r'[,\]}: \t\n\r]')
+
+_LIST = object()
+
+
+def deep_find_stream(
+    fp: IO,
+    path: Union[str, CompiledPath],
+    path_token: str = '.',
+    default: Any = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Any:
+    """
+    Find a value in a JSON document read incrementally from a stream.
+
+    Only the values on the requested path are turned into Python objects; everything
+    else is skipped as text, so memory is bounded by the size of the matched values
+    instead of the size of the document. Reading stops as soon as the result is known,
+    for instance after the first match of a '?' operator. If an object repeats a key,
+    its first occurrence is used.
+
+    Args:
+        fp: A text or binary (UTF-8) file-like object with a read method.
+        path: The path to the desired value using dot notation (e.g., 'users.0.name'),
+            or a path already compiled with compile_path.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+        default: The value to return if the path is not found (default: None).
+        chunk_size: Number of characters or bytes read from the stream at a time.
+
+    Returns:
+        The same result deep_find would return for json.load(fp), or the default value.
+
+    Examples:
+        >>> fp = io.StringIO('{"users": [{"name": "John"}, {"name": "Jane"}], "other": [1, 2]}')
+        >>> deep_find_stream(fp, 'users.*.name')
+        ['John', 'Jane']
+    """
+    if not isinstance(path, CompiledPath):
+        path = compile_path(path, path_token)
+    _check_streamable(path)
+    reader = _JSONReader(fp, chunk_size)
+    result = _find(reader, path.segments, 0, False)
+
+    if result is not None:
+        return result
+
+    return default
+
+
+def deep_iter_stream(
+    fp: IO,
+    path: Union[str, CompiledPath],
+    path_token: str = '.',
+    indexed: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[Any]:
+    """
+    Iterate over the values a path matches in a JSON document read incrementally.
+
+    This is the streaming counterpart of deep_iter: it yields the same values, in the
+    same order, while reading the stream only as far as needed for the next value.
+
+    Args:
+        fp: A text or binary (UTF-8) file-like object with a read method.
+        path: The path to the desired values using dot notation (e.g., 'users.*.name'),
+            or a path already compiled with compile_path.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+        indexed: If True, yield (index_tuple, value) pairs, where index_tuple holds the
+            index of the element taken at every wildcard segment along the way.
+        chunk_size: Number of characters or bytes read from the stream at a time.
+
+    Yields:
+        The matched values, or (index_tuple, value) pairs when indexed is True.
+
+    Examples:
+        >>> fp = io.StringIO('{"events": [{"id": 1}, {"id": 2}]}')
+        >>> list(deep_iter_stream(fp, 'events.*.id'))
+        [1, 2]
+    """
+    if not isinstance(path, CompiledPath):
+        path = compile_path(path, path_token)
+    _check_streamable(path)
+    reader = _JSONReader(fp, chunk_size)
+    result, indices = yield from _iterate(reader, path.segments, 0, False, (), indexed)
+    if result is not _LIST and result is not None:
+        yield (indices, result) if indexed else result
+
+
+def _check_streamable(path: CompiledPath) -> None:
+    """
+    Reject the '**' operator, as every descendant would have to be kept to apply the rest
+    of the path, filters, which need every element parsed before it is tested, and slices
+    counting from the end or backwards.
+    """
+    if any(segment.kind is SegmentKind.DESCENDANTS for segment in path.segments):
+        raise ValueError(f"the '**' operator is not supported on streams: {path.path!r}")
+    if any(segment.predicate is not None for segment in path.segments):
+        raise ValueError(f'filters are not supported on streams: {path.path!r}')
+    if any(segment.selection is not None and not _is_forward(segment.selection) for segment in path.segments):
+        raise ValueError(f'slices counting from the end or backwards are not supported on streams: {path.path!r}')
+
+
+def _selected(segment: Segment) -> Optional[range]:
+    """
+    Get the indices a slice segment selects, or None if the segment is not a slice.
+    """
+    if segment.selection is None:
+        return None
+    start, stop, step = segment.selection
+    return range(start or 0, sys.maxsize if stop is None else stop, step or 1)
+
+
+def _find(reader: _JSONReader, segments: tuple[Segment, ...], position: int, consume: bool) -> Any:
+    """
+    Evaluate the path from a segment on, on the next JSON value of the stream.
+
+    The recursion follows the path, not the data, so its depth is bounded by the
+    number of segments.
+
+    Args:
+        reader: The stream reader, positioned before the value.
+        segments: The compiled path segments.
+        position: Index of the first segment to apply.
+        consume: Whether the whole value must be consumed. If False, reading may stop
+            as soon as the result is known.
+
+    Returns:
+        The found value(s) or None if not found.
+    """
+    if position == len(segments):
+        return reader.read_value()
+
+    segment = segments[position]
+    token = reader.peek()
+
+    if token == '{':
+        result = None
+        found = False
+        for key in reader.members():
+            if found or key != segment.key:
+                reader.skip_value()
+                continue
+            found = True
+            result = _find(reader, segments, position + 1, consume)
+            if not consume:
+                return result
+        return result
+
+    if token != '[':
+        if consume:
+            reader.skip_value()
+        return None
+
+    kind = segment.kind
+    if kind is SegmentKind.FIRST:
+        result = None
+        for _ in reader.elements():
+            if result is not None:
+                reader.skip_value()
+                continue
+            result = _find(reader, segments, position + 1, True)
+            if result is not None and not consume:
+                return result
+        return result
+
+    if kind in _WILDCARDS:
+        selected = _selected(segment)
+        results = []
+        for index, _ in enumerate(reader.elements()):
+            if selected is not None and index not in selected:
+                reader.skip_value()
+                continue
+            result = _find(reader, segments, position + 1, True)
+            if kind is SegmentKind.ALL or result is not None:
+                results.append(result)
+        return results
+
+    index = segment.index
+    if index is None:
+        if consume:
+            reader.skip_value()
+        return None
+
+    if index < 0:
+        element = _last_element(reader, index)
+        if element is None:
+            return None
+        return _find(element, segments, position + 1, False)
+
+    result = None
+    for current, _ in enumerate(reader.elements()):
+        if current != index:
+            reader.skip_value()
+            continue
+        result = _find(reader, segments, position + 1, consume)
+        if not consume:
+            return result
+    return result
+
+
+def _iterate(
+    reader: _JSONReader,
+    segments: tuple[Segment, ...],
+    position: int,
+    consume: bool,
+    indices: tuple[int, ...],
+    indexed: bool,
+) -> Iterator[Any]:
+    """
+    Stream the values the path matches from a segment on, on the next JSON value.
+
+    Values are yielded by the '*' and '*?' operators, as (index_tuple, value) pairs
+    when indexed is True. The generator then returns a (result, index_tuple) pair describing the result
+    deep_find would give for this value: _LIST if a list was streamed, otherwise the
+    found value (or None) and the indices leading to it.
+
+    Args:
+        reader: The stream reader, positioned before the value.
+        segments: The compiled path segments.
+        position: Index of the first segment to apply.
+        consume: Whether the whole value must be consumed.
+        indices: Indices of the elements taken at the wildcards so far.
+        indexed: Whether to yield (index_tuple, value) pairs instead of values.
+    """
+    if position == len(segments):
+        return reader.read_value(), indices
+
+    segment = segments[position]
+    token = reader.peek()
+
+    if token == '{':
+        outcome = None, indices
+        found = False
+        for key in reader.members():
+            if found or key != segment.key:
+                reader.skip_value()
+                continue
+            found = True
+            outcome = yield from _iterate(reader, segments, position + 1, consume, indices, indexed)
+            if not consume:
+                return outcome
+        return outcome
+
+    if token != '[':
+        if consume:
+            reader.skip_value()
+        return None, indices
+
+    kind = segment.kind
+    if kind is SegmentKind.FIRST:
+        outcome = None, indices
+        for index, _ in enumerate(reader.elements()):
+            if outcome[0] is not None:
+                reader.skip_value()
+                continue
+            outcome = yield from _iterate(reader, segments, position + 1, True, indices + (index,), indexed)
+            if outcome[0] is not None and not consume:
+                return outcome
+        if outcome[0] is None:
+            return None, indices
+        return outcome
+
+    if kind in _WILDCARDS:
+        selected = _selected(segment)
+        for index, _ in enumerate(reader.elements()):
+            if selected is not None and index not in selected:
+                reader.skip_value()
+                continue
+            result, value_indices = yield from _iterate(
+                reader, segments, position + 1, True, indices + (index,), indexed,
+            )
+            if result is not _LIST and (kind is SegmentKind.ALL or result is not None):
+                yield (value_indices, result) if indexed else result
+        return _LIST, indices
+
+    index = segment.index
+    if index is None:
+        if consume:
+            reader.skip_value()
+        return None, indices
+
+    if index < 0:
+        element = _last_element(reader, index)
+        if element is None:
+            return None, indices
+        return (yield from _iterate(element, segments, position + 1, False, indices, indexed))
+
+    outcome = None, indices
+    for current, _ in enumerate(reader.elements()):
+        if current != index:
+            reader.skip_value()
+            continue
+        outcome = yield from _iterate(reader, segments, position + 1, consume, indices, indexed)
+        if not consume:
+            return outcome
+    return outcome
+
+
+def _last_element(reader: _JSONReader, index: int) -> Optional[_JSONReader]:
+    """
+    Select an element of the JSON array the reader is positioned at by negative index.
+
+    Only the text of the last -index elements is kept while the array is read.
+
+    Args:
+        reader: The stream reader, positioned before the array.
+        index: The negative index of the element.
+
+    Returns:
+        A reader over the text of the element, or None if the array is too short.
+    """
+    last = deque(maxlen=-index)
+    for _ in reader.elements():
+        last.append(reader.read_raw())
+    if len(last) < -index:
+        return None
+    return _JSONReader(io.StringIO(last[0]), DEFAULT_CHUNK_SIZE)
+
+
+class _JSONReader:
+    """
+    Incremental JSON tokenizer over a text or binary stream.
+
+    Values that are not needed are skipped by scanning for structural characters,
+    without decoding them. Values that are needed are cut out of the text and parsed
+    with json.loads.
+    """
+
+    def __init__(self, fp: IO, chunk_size: int):
+        self._fp = fp
+        self._chunk_size = chunk_size
+        self._decoder = None
+        self._buffer = ''
+        self._position = 0
+        self._mark = None
+        self._eof = False
+
+    def peek(self) -> str:
+        """
+        Skip whitespace and return the next character, or '' at the end of the stream.
+        """
+        while True:
+            self._position = _WHITESPACE.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer):
+                return self._buffer[self._position]
+            if not self._fill():
+                return ''
+
+    def read_value(self) -> Any:
+        """Parse the next value into a Python object."""
+        return json.loads(self.read_raw())
+
+    def read_raw(self) -> str:
+        """Return the JSON text of the next value."""
+        self.peek()
+        self._mark = self._position
+        try:
+            self.skip_value()
+            return self._buffer[self._mark:self._position]
+        finally:
+            self._mark = None
+
+    def skip_value(self) -> None:
+        """Move past the next value without parsing it."""
+        token = self.peek()
+        if token == '"':
+            self._skip_string()
+        elif token in ('{', '['):
+            self._skip_container()
+        elif token in ('', ',', ':', ']', '}'):
+            self._error('Expecting value')
+        else:
+            match = self._search(_SCALAR_END, required=False)
+            self._position = match.start() if match else len(self._buffer)
+
+    def members(self) -> Iterator[str]:
+        """
+        Iterate over the keys of the object the reader is positioned at.
+
+        After every key, the caller must read or skip the member value.
+        """
+        self._position += 1
+        if self.peek() == '}':
+            self._position += 1
+            return
+        while True:
+            if self.peek() != '"':
+                self._error('Expecting property name enclosed in double quotes')
+            key = self.read_value()
+            self._expect(':')
+            yield key
+            token = self.peek()
+            self._position += 1
+            if token == '}':
+                return
+            if token != ',':
+                self._error("Expecting ',' delimiter")
+
+    def elements(self) -> Iterator[None]:
+        """
+        Iterate over the elements of the array the reader is positioned at.
+
+        For every element, the caller must read or skip the element value.
+        """
+        self._position += 1
+        if self.peek() == ']':
+            self._position += 1
+            return
+        while True:
+            yield None
+            token = self.peek()
+            self._position += 1
+            if token == ']':
+                return
+            if token != ',':
+                self._error("Expecting ',' delimiter")
+
+    def _expect(self, token: str) -> None:
+        if self.peek() != token:
+            self._error(f'Expecting {token!r} delimiter')
+        self._position += 1
+
+    def _skip_string(self) -> None:
+        self._position += 1
+        while True:
+            match = self._search(_STRING_END)
+            self._position = match.end()
+            if match.group() == '"':
+                return
+            if self._position >= len(self._buffer) and not self._fill():
+                self._error('Unterminated string')
+            self._position += 1
+
+    def _skip_container(self) -> None:
+        depth = 0
+        while True:
+            match = self._search(_STRUCTURE)
+            token = match.group()
+            if token == '"':
+                self._position = match.start()
+                self._skip_string()
+                continue
+            self._position = match.end()
+            depth += 1 if token in ('{', '[') else -1
+            if depth == 0:
+                return
+
+    def _search(self, pattern: re.Pattern, required: bool = True) -> Optional[re.Match]:
+        while True:
+            match = pattern.search(self._buffer, self._position)
+            if match is not None:
+                return match
+            self._position = len(self._buffer)
+            if not self._fill():
+                if required:
+                    self._error('Unexpected end of document')
+                return None
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        chunk = self._fp.read(self._chunk_size)
+        if not chunk:
+            self._eof = True
+            if self._decoder is None:
+                return False
+            chunk = self._decoder.decode(b'', final=True)
+            if not chunk:
+                return False
+        elif isinstance(chunk, bytes):
+            if self._decoder is None:
+                self._decoder = codecs.getincrementaldecoder('utf-8-sig')()
+            chunk = self._decoder.decode(chunk)
+
+        keep = self._position if self._mark is None else self._mark
+        self._buffer = self._buffer[keep:] + chunk
+        self._position -= keep
+        if self._mark is not None:
+            self._mark -= keep
+        return True
+
+    def _error(self, message: str) -> None:
+        raise json.JSONDecodeError(message, self._buffer, self._position)
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import sys
+from typing import Any, Optional, Union
+
+from deepfinder.deep_find import _WILDCARDS, _evaluate
+from deepfinder.path import CompiledPath, Segment, SegmentKind, compile_path
+
+_INDEXED_TYPES = (dict, list, tuple)
+_MISSING = object()
+
+
+class DeepIndex:
+    """
+    A precomputed index over a nested structure, for repeated lookups on static data.
+
+    Dictionaries, lists and tuples are flattened once into a map from path to value,
+    where a path is the tuple of its segments ('users', '0', 'name'). A path written in
+    that canonical form resolves with a single hash lookup. Wildcards are expanded from
+    the per-level child tables kept for every list and tuple. Anything the index does not
+    cover (objects, other containers, levels past max_depth, negative indexes) is searched
+    with deep_find from the deepest indexed node, so results are always those of deep_find.
+
+    The index does not track changes: rebuild it if the structure is modified.
+
+    Args:
+        obj: The structure to index.
+        max_depth: Maximum number of levels to index (default: None, no limit).
+
+    Examples:
+        >>> index = DeepIndex({'users': [{'name': 'ash'}, {'name': 'misty'}]})
+        >>> index.deep_find('users.1.name')
+        'misty'
+        >>> index.deep_find('users.*.name')
+        ['ash', 'misty']
+    """
+
+    def __init__(self, obj: Any, max_depth: Optional[int] = None):
+        self.obj = obj
+        self.max_depth = max_depth
+        self._values = {(): obj}
+        self._children = {}
+        self._build()
+
+    def _build(self) -> None:
+        values = self._values
+        children = self._children
+        stack = [((), self.obj)]
+        while stack:
+            prefix, node = stack.pop()
+            if not self._indexed(prefix, node):
+                continue
+            if type(node) is dict:
+                items = [(prefix + (key,), value) for key, value in node.items() if type(key) is str]
+            else:
+                items = [(prefix + (str(index),), value) for index, value in enumerate(node)]
+                children[prefix] = tuple(path for path, _ in items)
+            for path, value in items:
+                values[path] = value
+                stack.append((path, value))
+
+    def _indexed(self, prefix: tuple[str, ...], node: Any) -> bool:
+        """Whether the children of a node are in the index."""
+        return type(node) in _INDEXED_TYPES and (self.max_depth is None or len(prefix) < self.max_depth)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def memory_usage(self) -> int:
+        """
+        Estimate the memory used by the index itself, not counting the indexed values.
+
+        Returns:
+            The size in bytes of the path map, the child tables and the path tuples.
+        """
+        size = sys.getsizeof(self._values) + sys.getsizeof(self._children)
+        for path in self._values:
+            size += sys.getsizeof(path)
+        for paths in self._children.values():
+            size += sys.getsizeof(paths)
+        return size
+
+    def deep_find(self, path: Union[str, CompiledPath], path_token: str = '.', default: Any = None) -> Any:
+        """
+        Find a value in the indexed structure, as deep_find would on the original one.
+
+        Args:
+            path: The path to the desired value using dot notation (e.g., 'users.0.name'),
+                or a path already compiled with compile_path.
+            path_token: The character used to separate path segments (default: '.').
+                Ignored when path is already compiled.
+            default: The value to return if the path is not found (default: None).
+
+        Returns:
+            The found value or the default value if not found.
+        """
+        if not isinstance(path, CompiledPath):
+            path = compile_path(path, path_token)
+        segments = path.segments
+
+        result = self._values.get(tuple(segment.key for segment in segments), _MISSING)
+        if result is _MISSING:
+            result = self._resolve((), segments, 0)
+
+        if result is not None:
+            return result
+
+        return default
+
+    def _resolve(self, prefix: tuple[str, ...], segments: tuple[Segment, ...], position: int) -> Any:
+        """
+        Apply the segments from 'position' on to the indexed node at 'prefix'.
+
+        Returns:
+            The found value(s) or None if not found.
+        """
+        value = self._values[prefix]
+        end = len(segments)
+        while position < end:
+            if not self._indexed(prefix, value):
+                return _evaluate(value, segments[position:])
+            segment = segments[position]
+            if segment.kind is SegmentKind.DESCENDANTS:
+                return _evaluate(value, segments[position:])
+            if type(value) is not dict:
+                if segment.kind in _WILDCARDS:
+                    return self._expand(prefix, segments, position)
+                if segment.kind is not SegmentKind.INDEX or segment.index < 0 or segment.key != str(segment.index):
+                    return _evaluate(value, segments[position:])
+            prefix += (segment.key,)
+            value = self._values.get(prefix)
+            if value is None:
+                return None
+            position += 1
+        return value
+
+    def _expand(self, prefix: tuple[str, ...], segments: tuple[Segment, ...], position: int) -> Any:
+        """
+        Expand the wildcard at 'position' over the child table of the node at 'prefix'.
+
+        Returns:
+            The list of results for '*', without None results for '*?', or the first
+            non-None result for '?'.
+        """
+        kind = segments[position].kind
+        children = self._children[prefix]
+        if segments[position].selection is not None:
+            children = children[slice(*segments[position].selection)]
+        predicate = segments[position].predicate
+        if predicate is not None:
+            children = (child for child in children if predicate(self._values[child]))
+        if kind is SegmentKind.FIRST:
+            for child in children:
+                value = self._resolve(child, segments, position + 1)
+                if value is not None:
+                    return value
+            return None
+
+        results = []
+        for child in children:
+            value = self._resolve(child, segments, position + 1)
+            if kind is SegmentKind.ALL or value is not None:
+                results.append(value)
+        return results
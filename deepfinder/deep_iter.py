@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Iterable, Iterator, Optional, Union
+
+from deepfinder.deep_find import _ALL, _FIRST, _NOTHING, _elements, _evaluate, _flatten_levels, _select, _walk
+from deepfinder.path import CompiledPath, Segment, SegmentKind, compile_path
+
+
+def deep_iter(
+    obj: Any,
+    path: Union[str, CompiledPath],
+    path_token: str = '.',
+    indexed: bool = False,
+    flatten: Union[bool, int] = True,
+) -> Iterator[Any]:
+    """
+    Iterate over the values a path matches, one at a time.
+
+    This is the streaming counterpart of deep_find. Instead of building the (possibly
+    nested) result lists of wildcard segments, every value that deep_find would put
+    into them is yielded as soon as it is found, in the same order. Lazy iterables
+    along the path are only consumed as results are requested.
+
+    Args:
+        obj: The object to search in. Can be a dictionary, list, or any object with attributes.
+        path: The path to the desired values using dot notation (e.g., 'users.*.name'),
+            or a path already compiled with compile_path.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+        indexed: If True, yield (index_tuple, value) pairs, where index_tuple holds the
+            index of the element taken at every wildcard segment along the way.
+        flatten: Number of levels of nested wildcards streamed below the first one, or
+            True for all of them (default: True). Deeper wildcards give their lists as
+            deep_find would, so flatten=0 yields the elements of deep_find's result and
+            flatten=N the elements of deep_find(..., flatten=N)'s.
+
+    Yields:
+        The matched values, or (index_tuple, value) pairs when indexed is True. A path
+        without wildcards yields its value once, or nothing if it is not found.
+
+    Examples:
+        >>> data = {'users': [{'name': 'John'}, {'name': 'Jane'}]}
+        >>> list(deep_iter(data, 'users.*.name'))
+        ['John', 'Jane']
+        >>> list(deep_iter(data, 'users.*.name', indexed=True))
+        [((0,), 'John'), ((1,), 'Jane')]
+    """
+    if not isinstance(path, CompiledPath):
+        path = compile_path(path, path_token)
+    levels = None if flatten is True else _flatten_levels(flatten)
+    return _iterate(obj, path.segments, indexed, levels=levels)
+
+
+def _iterate(
+    obj: Any,
+    segments: tuple[Segment, ...],
+    indexed: bool = False,
+    walk: Optional[Callable[[Any, tuple[Segment, ...], int, int], tuple[Any, int]]] = None,
+    levels: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Streaming traversal engine behind deep_iter.
+
+    Args:
+        obj: The object to traverse.
+        segments: The compiled path segments.
+        indexed: Whether to yield (index_tuple, value) pairs instead of values.
+        walk: Replacement for _walk, used to instrument the traversal (default: _walk).
+        levels: Number of nested wildcards to stream below the first one, or None for all.
+            The lists of deeper wildcards are built by the traversal engine.
+
+    Yields:
+        The matched values, as deep_iter does.
+    """
+    if walk is None:
+        walk = _walk
+    end = len(segments)
+    stack = []
+    position = 0
+    indices = ()
+    while True:
+        obj, position = walk(obj, segments, position, end)
+        if position < end and levels is not None and _nested_lists(stack, segments[position]) > levels:
+            value = _collect(obj, segments, position)
+            if indexed:
+                indices = tuple(frame.index for frame in stack)
+        elif position < end:
+            segment = segments[position]
+            if segment.kind is not _FIRST:
+                _commit(stack)
+            selected = None
+            if segment.selection is not None:
+                selected, obj = _select(obj, segment.selection)
+            stack.append(_StreamFrame(segment.kind, iter(obj), position + 1, segment.predicate, selected))
+            value = _NOTHING
+        else:
+            value = obj
+            if indexed:
+                indices = tuple(frame.index for frame in stack)
+
+        while stack:
+            frame = stack[-1]
+            if value is _NOTHING:
+                if frame.committed:
+                    stack.pop()
+                    continue
+            elif frame.kind is _FIRST:
+                if value is not None:
+                    stack.pop()
+                    continue
+            elif frame.kind is _ALL or value is not None:
+                yield (indices, value) if indexed else value
+
+            obj = next(frame.items, _NOTHING)
+            if obj is not _NOTHING:
+                frame.index = frame.index + 1 if frame.indices is None else next(frame.indices)
+                if frame.predicate is not None and not frame.predicate(obj):
+                    value = _NOTHING
+                    continue
+                position = frame.position
+                break
+
+            stack.pop()
+            value = _NOTHING
+            if frame.kind is _FIRST:
+                value = None
+                if indexed:
+                    indices = tuple(frame.index for frame in stack)
+        else:
+            if value is not _NOTHING and value is not None:
+                yield (indices, value) if indexed else value
+            return
+
+
+class _StreamFrame:
+    """
+    A pending wildcard expansion on the streaming traversal stack.
+
+    Attributes:
+        kind: The wildcard kind ('*', '?' or '*?').
+        items: Iterator over the elements that are still to be visited.
+        position: Index of the segment each element continues from.
+        predicate: The filter of the wildcard, or None. Rejected elements still count
+            for the indices, which always refer to the expanded container.
+        indices: For slices, iterator over the indices of the selected elements.
+        index: Index of the element currently being visited.
+        committed: For '?', whether the current element already produced a result.
+            Its values are streamed by the wildcards below it, so no other element
+            is visited afterwards.
+    """
+
+    __slots__ = ('kind', 'items', 'position', 'predicate', 'indices', 'index', 'committed')
+
+    def __init__(
+        self,
+        kind: SegmentKind,
+        items: Iterator[Any],
+        position: int,
+        predicate: Optional[Callable[[Any], bool]] = None,
+        indices: Optional[Iterable[int]] = None,
+    ):
+        self.kind = kind
+        self.items = items
+        self.position = position
+        self.predicate = predicate
+        self.indices = None if indices is None else iter(indices)
+        self.index = -1
+        self.committed = False
+
+
+def _nested_lists(stack: list[_StreamFrame], segment: Segment) -> int:
+    """
+    Count the wildcards whose lists enclose the one a segment would build, or -1 for '?'.
+    """
+    if segment.kind is SegmentKind.FIRST:
+        return -1
+    return sum(frame.kind is not SegmentKind.FIRST for frame in stack)
+
+
+def _collect(items: Iterable[Any], segments: tuple[Segment, ...], position: int) -> list[Any]:
+    """
+    Build the list deep_find gives for a wildcard segment, from the elements it expands to.
+
+    Args:
+        items: The iterable the segment at position expands to.
+        segments: The compiled path segments.
+        position: Index of the wildcard segment.
+
+    Returns:
+        The results of the rest of the path on every element, without the None ones
+        unless the segment is '*'.
+    """
+    rest = segments[position + 1:]
+    results = (_evaluate(element, rest) for element in _elements(items, segments[position]))
+    if segments[position].kind is SegmentKind.ALL:
+        return list(results)
+    return [result for result in results if result is not None]
+
+
+def _commit(stack: list[_StreamFrame]) -> None:
+    """
+    Mark the innermost '?' frames as resolved by the element they are visiting.
+
+    When a '*' or '*?' expansion starts below a '?', deep_find would return its list
+    (which is never None) as the result of that '?'.
+
+    Args:
+        stack: The streaming traversal stack.
+    """
+    for frame in reversed(stack):
+        if frame.kind is not SegmentKind.FIRST:
+            return
+        frame.committed = True
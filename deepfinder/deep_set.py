@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping, MutableMapping, MutableSequence
+from typing import Any, Callable, Optional, Union
+
+from deepfinder.deep_find import _SCALARS, _WILDCARDS, _elements, _evaluate, _slot_names, _walk
+from deepfinder.path import CompiledPath, Segment, SegmentKind, compile_path
+
+
+def deep_set(
+    obj: Any,
+    path: Union[str, CompiledPath],
+    value: Any = None,
+    path_token: str = '.',
+    create_missing: bool = False,
+    fn: Optional[Callable[[Any], Any]] = None,
+) -> int:
+    """
+    Set the value of a path in place, on every node it matches.
+
+    The path uses the same syntax as deep_find, so a single call can update every
+    element of a list ('users.*.active'), the elements matching a filter
+    ('items.[status=="ko"].retry') or a key wherever it is found ('**.password'). The
+    last segment is written into every container the rest of the path reaches: keys
+    are set on mappings (and added if missing, except after '**'), attributes on
+    objects, and indexes or wildcards replace the elements of mutable sequences.
+    Immutable containers, such as tuples, and attributes that cannot be set, such as
+    read-only properties, are left untouched.
+
+    The containers are collected in a single traversal before anything is written, so
+    the changes never affect which nodes the path matches.
+
+    Args:
+        obj: The object to modify. Can be a dictionary, list, or any object with attributes.
+        path: The path to the values to set using dot notation (e.g., 'users.*.name'),
+            or a path already compiled with compile_path.
+        value: The value to set. Functions and classes are set as they are; use fn to
+            compute the value from the current one.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+        create_missing: If True, missing intermediate keys and attributes are created
+            as empty dictionaries instead of ending the path (default: False).
+        fn: A function called with the current value of every matched node (None where
+            it is missing) that returns the value to set, instead of value.
+
+    Returns:
+        The number of nodes set.
+
+    Raises:
+        ValueError: If the path is empty or ends with '**', or if both value and fn are given.
+
+    Examples:
+        >>> data = {'users': [{'name': 'John'}, {'name': 'Jane'}]}
+        >>> deep_set(data, 'users.*.active', True)
+        2
+        >>> deep_set(data, 'users.0.name', fn=str.upper)
+        1
+        >>> data['users'][0]
+        {'name': 'JOHN', 'active': True}
+        >>> deep_set(data, 'settings.theme', 'dark', create_missing=True)
+        1
+        >>> data['settings']
+        {'theme': 'dark'}
+    """
+    if fn is not None and value is not None:
+        raise ValueError('deep_set takes either a value or fn, not both')
+    segments = _write_segments(path, path_token)
+    update = fn if fn is not None else lambda _: value
+    existing = len(segments) > 1 and segments[-2].kind is SegmentKind.DESCENDANTS
+    return sum(_set(parent, segments[-1], update, existing) for parent in _parents(obj, segments, create_missing))
+
+
+def deep_delete(obj: Any, path: Union[str, CompiledPath], path_token: str = '.') -> int:
+    """
+    Delete every node a path matches, in place.
+
+    Keys are removed from mappings, attributes from objects, and indexes or wildcards
+    remove the elements of mutable sequences (e.g. 'items.[status=="ko"]' removes the
+    matching items). Nodes that are not found are skipped.
+
+    Args:
+        obj: The object to modify. Can be a dictionary, list, or any object with attributes.
+        path: The path to the nodes to delete using dot notation (e.g., 'users.*.password'),
+            or a path already compiled with compile_path.
+        path_token: The character used to separate path segments (default: '.').
+            Ignored when path is already compiled.
+
+    Returns:
+        The number of nodes deleted.
+
+    Raises:
+        ValueError: If the path is empty or ends with '**'.
+
+    Examples:
+        >>> data = {'users': [{'name': 'John', 'password': 'x'}, {'name': 'Jane'}]}
+        >>> deep_delete(data, 'users.*.password')
+        1
+        >>> data
+        {'users': [{'name': 'John'}, {'name': 'Jane'}]}
+    """
+    segments = _write_segments(path, path_token)
+    return sum(_delete(parent, segments[-1]) for parent in _parents(obj, segments, False))
+
+
+def _write_segments(path: Union[str, CompiledPath], path_token: str) -> tuple[Segment, ...]:
+    """
+    Compile the path of a write, checking that it ends with a node that can be written.
+    """
+    if not isinstance(path, CompiledPath):
+        path = compile_path(path, path_token)
+    segments = path.segments
+    if not segments:
+        raise ValueError('cannot write to an empty path')
+    if segments[-1].kind is SegmentKind.DESCENDANTS:
+        raise ValueError(f'cannot write to a path ending with {segments[-1].key!r}')
+    return segments
+
+
+def _parents(obj: Any, segments: tuple[Segment, ...], create_missing: bool) -> list[Any]:
+    """
+    Find the containers the last segment of a path is applied to.
+
+    Every segment but the last is followed with deep_find semantics. A container reached
+    more than once (e.g. a list shared by two records) is only returned the first time,
+    so functions are applied and indexes deleted once per node.
+
+    Args:
+        obj: The object to traverse.
+        segments: The compiled path segments.
+        create_missing: Whether to create the missing intermediate keys and attributes.
+
+    Returns:
+        The containers, in document order.
+    """
+    last = len(segments) - 1
+    parents = []
+    seen = set()
+    pending = [(obj, 0)]
+    while pending:
+        node, position = pending.pop()
+        if position == last:
+            if id(node) not in seen:
+                seen.add(id(node))
+                parents.append(node)
+            continue
+
+        value, reached = _walk(node, segments, position, position + 1)
+        if reached == position:
+            children = _expand(value, segments, position)
+        elif value is None and create_missing:
+            value = _create(node, segments[position])
+            children = () if value is None else (value,)
+        else:
+            children = () if value is None or isinstance(value, _SCALARS) else (value,)
+        pending.extend((child, position + 1) for child in reversed(children))
+    return parents
+
+
+def _expand(items: Iterable[Any], segments: tuple[Segment, ...], position: int) -> list[Any]:
+    """
+    List the elements a wildcard segment in the middle of a path continues from.
+
+    '*?' skips None elements, and '?' keeps the first element the rest of the path is
+    found in, as deep_find would return it.
+    """
+    segment = segments[position]
+    elements = _elements(items, segment)
+    if segment.kind is SegmentKind.FIRST:
+        rest = segments[position + 1:]
+        first = next((element for element in elements if _evaluate(element, rest) is not None), None)
+        return [] if first is None else [first]
+    return [element for element in elements if element is not None and not isinstance(element, _SCALARS)]
+
+
+def _create(node: Any, segment: Segment) -> Any:
+    """
+    Add an empty dictionary under a key or attribute, if the node can hold it.
+
+    Returns:
+        The new dictionary, or None if the segment is an operator, the node is not a
+        mutable mapping or a plain object, or the attribute cannot be set.
+    """
+    if segment.kind not in (SegmentKind.KEY, SegmentKind.INDEX) or isinstance(node, _SCALARS):
+        return None
+    child = {}
+    if isinstance(node, MutableMapping):
+        node[segment.key] = child
+    elif isinstance(node, (Mapping, Iterable)):
+        return None
+    else:
+        try:
+            setattr(node, segment.key, child)
+        except AttributeError as _:
+            return None
+    return child
+
+
+def _set(parent: Any, segment: Segment, update: Callable[[Any], Any], existing: bool) -> int:
+    """
+    Apply the last segment of a deep_set path to one container.
+
+    Args:
+        parent: The container to write into.
+        segment: The last segment of the path.
+        update: The function returning the new value from the current one.
+        existing: Whether to only replace keys and attributes that are already found,
+            for paths ending with '**.key', which match the key at any depth.
+
+    Returns:
+        The number of nodes set, 0 when the container is immutable or the attribute
+        cannot be set (e.g. a read-only property, or a slotted object without the slot).
+    """
+    if isinstance(parent, _SCALARS):
+        return 0
+    if isinstance(parent, MutableMapping):
+        if (existing or segment.kind in _WILDCARDS) and segment.key not in parent:
+            return 0
+        parent[segment.key] = update(parent.get(segment.key))
+        return 1
+    if isinstance(parent, MutableSequence):
+        indices = _indices(parent, segment)
+        for index in indices:
+            parent[index] = update(parent[index])
+        return len(indices)
+    if isinstance(parent, (Mapping, Iterable)) or segment.kind not in (SegmentKind.KEY, SegmentKind.INDEX):
+        return 0
+    current = _walk(parent, (segment,), 0, 1)[0]
+    if existing and current is None:
+        return 0
+    value = update(current)
+    try:
+        setattr(parent, segment.key, value)
+    except AttributeError as _:
+        return 0
+    return 1
+
+
+def _delete(parent: Any, segment: Segment) -> int:
+    """
+    Apply the last segment of a deep_delete path to one container.
+
+    Returns:
+        The number of nodes deleted.
+    """
+    if isinstance(parent, _SCALARS):
+        return 0
+    if isinstance(parent, MutableMapping):
+        if segment.key not in parent:
+            return 0
+        del parent[segment.key]
+        return 1
+    if isinstance(parent, MutableSequence):
+        indices = _indices(parent, segment)
+        for index in sorted(indices, reverse=True):
+            del parent[index]
+        return len(indices)
+    if isinstance(parent, (Mapping, Iterable)) or segment.kind not in (SegmentKind.KEY, SegmentKind.INDEX):
+        return 0
+    attributes = getattr(parent, '__dict__', None)
+    if attributes is not None and segment.key in attributes:
+        del attributes[segment.key]
+        return 1
+    if not any(segment.key in _slot_names(base) for base in type(parent).__mro__):
+        return 0
+    try:
+        delattr(parent, segment.key)
+    except AttributeError as _:
+        return 0
+    return 1
+
+
+def _indices(sequence: MutableSequence[Any], segment: Segment) -> list[int]:
+    """
+    Find the positions of a mutable sequence the last segment of a path matches.
+
+    Indexes match their element when it is in bounds. Wildcards match the elements of
+    their slice that pass their filter: all of them for '*', those that are not None
+    for '*?', and the first that is not None for '?'.
+    """
+    if segment.kind is SegmentKind.INDEX:
+        return [segment.index] if -len(sequence) <= segment.index < len(sequence) else []
+    if segment.kind not in _WILDCARDS:
+        return []
+
+    indices = range(len(sequence))
+    if segment.selection is not None:
+        indices = indices[slice(*segment.selection)]
+    if segment.predicate is not None:
+        indices = [index for index in indices if segment.predicate(sequence[index])]
+    if segment.kind is SegmentKind.ALL:
+        return list(indices)
+    indices = [index for index in indices if sequence[index] is not None]
+    return indices[:1] if segment.kind is SegmentKind.FIRST else indices
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from typing import Any, Iterator, Union
+
+from deepfinder.deep_find import deep_find
+from deepfinder.deep_iter import deep_iter
+from deepfinder.path import CompiledPath
+
+_SCALAR_ITERABLES = (str, bytes, bytearray)
+
+
+class DeepView:
+    """
+    A read-only view that adds deep finding to any structure without copying it.
+
+    Unlike DeepFinderDict and DeepFinderList, which copy the top level of the data and
+    leave nested values as plain containers, a view only holds a reference to the
+    wrapped object. Item access returns views of nested containers, created on demand,
+    so wrapping a structure of any size takes constant time and memory.
+
+    Args:
+        obj: The structure to view.
+
+    Examples:
+        >>> payload = {'users': [{'name': 'ash'}, {'name': 'misty'}]}
+        >>> view = DeepView(payload)
+        >>> view.deep_find('users.*.name')
+        ['ash', 'misty']
+        >>> view['users'][1].deep_find('name')
+        'misty'
+    """
+
+    __slots__ = ('_obj',)
+
+    def __init__(self, obj: Any):
+        if isinstance(obj, DeepView):
+            obj = obj._obj
+        self._obj = obj
+
+    @property
+    def obj(self) -> Any:
+        """The viewed object."""
+        return self._obj
+
+    def deep_find(self, path: Union[str, CompiledPath], path_token: str = '.', default: Any = None) -> Any:
+        """
+        Find a value in the viewed structure using dot notation.
+
+        Args:
+            path: The path to the desired value using dot notation (e.g., 'users.0.name'),
+                or a path already compiled with compile_path.
+            path_token: The character used to separate path segments (default: '.').
+                Ignored when path is already compiled.
+            default: The value to return if the path is not found (default: None).
+
+        Returns:
+            The found value or the default value if not found.
+        """
+        return deep_find(self._obj, path, path_token, default)
+
+    def deep_iter(self, path: Union[str, CompiledPath], path_token: str = '.', indexed: bool = False) -> Iterator[Any]:
+        """
+        Iterate over the values a path matches in the viewed structure, one at a time.
+
+        Args:
+            path: The path to the desired values using dot notation (e.g., 'users.*.name'),
+                or a path already compiled with compile_path.
+            path_token: The character used to separate path segments (default: '.').
+                Ignored when path is already compiled.
+            indexed: If True, yield (index_tuple, value) pairs.
+
+        Yields:
+            The matched values, as deep_iter does.
+        """
+        return deep_iter(self._obj, path, path_token, indexed)
+
+    def __getitem__(self, key: Any) -> Any:
+        return _view(self._obj[key])
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        """
+        Get a child of a viewed mapping, as dict.get does, viewing nested containers.
+        """
+        return _view(self._obj.get(key, default))
+
+    def __iter__(self) -> Iterator[Any]:
+        if isinstance(self._obj, Mapping):
+            return iter(self._obj)
+        return map(_view, self._obj)
+
+    def __len__(self) -> int:
+        return len(self._obj)
+
+    def __contains__(self, item: Any) -> bool:
+        return item in self._obj
+
+    def __bool__(self) -> bool:
+        return bool(self._obj)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, DeepView):
+            other = other._obj
+        return self._obj == other
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._obj!r})'
+
+
+def _view(value: Any) -> Any:
+    """
+    Wrap containers in a view and return anything else as is.
+    """
+    if isinstance(value, Iterable) and not isinstance(value, _SCALAR_ITERABLES):
+        return DeepView(value)
+    return value
@@ -1,6 +1,12 @@
 import builtins
+from typing import Optional
+from weakref import ref
 
 from deepfinder import deep_find
+from deepfinder.deep_find import _LISTED
+from deepfinder.path import compile_path
+
+ENTITY_CACHE_SIZE = 128
 
 
 class DeepFinderList(list):
@@ -20,12 +26,14 @@ class DeepFinderList(list):
         ['pikachu', 'charmander']
     """
 
-    def deep_find(self, path: str):
+    def deep_find(self, path: str, limit: Optional[int] = None, offset: int = 0):
         """
         Find values in the list using dot notation.
 
         Args:
             path: The path to search for using dot notation (e.g., '*.name').
+            limit: Return at most this many values, as deep_find does (default: None, no limit).
+            offset: Skip this many values before collecting them (default: 0).
 
         Returns:
             The found value(s) or None if not found.
@@ -35,7 +43,7 @@ class DeepFinderList(list):
             >>> pokemons.deep_find('0.name')
             'pikachu'
         """
-        return deep_find(self, path)
+        return deep_find(self, path, limit=limit, offset=offset)
 
 
 class DeepFinderDict(dict):
@@ -58,12 +66,14 @@ class DeepFinderDict(dict):
         ['pikachu', 'charmander']
     """
 
-    def deep_find(self, path: str):
+    def deep_find(self, path: str, limit: Optional[int] = None, offset: int = 0):
         """
         Find values in the dictionary using dot notation.
 
         Args:
             path: The path to search for using dot notation (e.g., 'user.profile.name').
+            limit: Return at most this many values, as deep_find does (default: None, no limit).
+            offset: Skip this many values before collecting them (default: 0).
 
         Returns:
             The found value(s) or None if not found.
@@ -73,7 +83,238 @@ class DeepFinderDict(dict):
             >>> user.deep_find('name')
             'ash'
         """
-        return deep_find(self, path)
+        return deep_find(self, path, limit=limit, offset=offset)
+
+
+class _ResultCache:
+    """
+    Per-instance cache of deep_find results, shared by CachedDeepFinderList and CachedDeepFinderDict.
+
+    Results are stored with the version of the instance they were computed at. Every
+    mutating method increments the version, and so do the mutations of any cached
+    child held by the instance, so a cached result is only returned while nothing
+    under the instance has changed through a cached container. Changes to plain lists,
+    dictionaries or objects inside the instance are not seen: call invalidate() after
+    making them.
+
+    The lists built for wildcard segments are copied when a cached result is returned,
+    so callers can modify them without affecting later lookups. The cache holds up to
+    ENTITY_CACHE_SIZE paths and is cleared when it is full.
+    """
+
+    _version = 0
+    _cache = None
+    _parents = None
+
+    def deep_find(self, path: str, limit: Optional[int] = None, offset: int = 0):
+        """
+        Find values using dot notation, reusing the result of an earlier identical lookup.
+
+        Args:
+            path: The path to search for using dot notation (e.g., 'users.*.name').
+            limit: Return at most this many values, as deep_find does (default: None, no limit).
+            offset: Skip this many values before collecting them (default: 0).
+
+        Returns:
+            The found value(s) or None if not found.
+        """
+        cache = self._cache
+        if cache is None:
+            cache = self._cache = {}
+        key = path if limit is None and not offset else (path, limit, offset)
+        entry = cache.get(key)
+        if entry is None or entry[0] != self._version:
+            result = deep_find(self, path, limit=limit, offset=offset)
+            levels = sum(segment.kind in _LISTED for segment in compile_path(path).segments)
+            if len(cache) >= ENTITY_CACHE_SIZE:
+                cache.clear()
+            entry = cache[key] = (self._version, result, levels)
+        return _copy_lists(entry[1], entry[2])
+
+    def invalidate(self) -> None:
+        """
+        Discard the cached results of this instance and of every cached container holding it.
+        """
+        if self._parents is None:
+            self._version += 1
+            return
+        pending = [self]
+        seen = set()
+        while pending:
+            entity = pending.pop()
+            if id(entity) in seen:
+                continue
+            seen.add(id(entity))
+            entity._version += 1
+            if entity._parents is not None:
+                for parent in entity._parents.values():
+                    parent = parent()
+                    if parent is not None:
+                        pending.append(parent)
+
+    def _adopt(self, value) -> None:
+        if isinstance(value, _ResultCache):
+            if value._parents is None:
+                value._parents = {}
+            value._parents[id(self)] = ref(self)
+
+    def __getstate__(self):
+        return None
+
+
+class CachedDeepFinderList(_ResultCache, DeepFinderList):
+    """
+    A DeepFinderList that caches deep_find results until it is modified.
+
+    Examples:
+        >>> pokemons = CachedDeepFinderList([CachedDeepFinderDict({'name': 'pikachu'})])
+        >>> pokemons.deep_find('*.name')
+        ['pikachu']
+        >>> pokemons[0]['name'] = 'raichu'
+        >>> pokemons.deep_find('*.name')
+        ['raichu']
+    """
+
+    def __init__(self, *args):
+        super().__init__(*args)
+        for value in self:
+            self._adopt(value)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            # The new elements can be more or fewer than the ones they replace, so they
+            # are adopted from the assigned values rather than from self[index].
+            value = list(value)
+            super().__setitem__(index, value)
+            for item in value:
+                self._adopt(item)
+        else:
+            super().__setitem__(index, value)
+            self._adopt(value)
+        self.invalidate()
+
+    def __delitem__(self, index):
+        super().__delitem__(index)
+        self.invalidate()
+
+    def __iadd__(self, values):
+        size = len(self)
+        result = super().__iadd__(values)
+        for value in self[size:]:
+            self._adopt(value)
+        self.invalidate()
+        return result
+
+    def __imul__(self, count):
+        result = super().__imul__(count)
+        self.invalidate()
+        return result
+
+    def append(self, value):
+        super().append(value)
+        self._adopt(value)
+        self.invalidate()
+
+    def extend(self, values):
+        size = len(self)
+        super().extend(values)
+        for value in self[size:]:
+            self._adopt(value)
+        self.invalidate()
+
+    def insert(self, index, value):
+        super().insert(index, value)
+        self._adopt(value)
+        self.invalidate()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.invalidate()
+        return value
+
+    def remove(self, value):
+        super().remove(value)
+        self.invalidate()
+
+    def clear(self):
+        super().clear()
+        self.invalidate()
+
+    def sort(self, *args, **kwargs):
+        super().sort(*args, **kwargs)
+        self.invalidate()
+
+    def reverse(self):
+        super().reverse()
+        self.invalidate()
+
+
+class CachedDeepFinderDict(_ResultCache, DeepFinderDict):
+    """
+    A DeepFinderDict that caches deep_find results until it is modified.
+
+    Examples:
+        >>> user = CachedDeepFinderDict({'name': 'ash'})
+        >>> user.deep_find('name')
+        'ash'
+        >>> user['name'] = 'misty'
+        >>> user.deep_find('name')
+        'misty'
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        for value in self.values():
+            self._adopt(value)
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self._adopt(value)
+        self.invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.invalidate()
+
+    def __ior__(self, other):
+        self.update(other)
+        return self
+
+    def update(self, *args, **kwargs):
+        values = dict(*args, **kwargs)
+        super().update(values)
+        for value in values.values():
+            self._adopt(value)
+        self.invalidate()
+
+    def setdefault(self, key, default=None):
+        if key in self:
+            return self[key]
+        self[key] = default
+        return default
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.invalidate()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.invalidate()
+        return item
+
+    def clear(self):
+        super().clear()
+        self.invalidate()
+
+
+def _copy_lists(result, levels: int):
+    """
+    Copy the lists deep_find built for the first levels of wildcards in a result.
+    """
+    if not levels or type(result) is not list:
+        return result
+    return [_copy_lists(item, levels - 1) for item in result]
 
 
 def nativify():
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Any, Optional
+
+from deepfinder.deep_find import _evaluate, _select, _walk
+from deepfinder.path import Segment, SegmentKind
+
+PARALLEL_THRESHOLD = 10_000
+CHUNKS_PER_WORKER = 4
+
+
+def _evaluate_parallel(
+    obj: Any,
+    segments: tuple[Segment, ...],
+    executor: Optional[Executor] = None,
+    workers: Optional[int] = None,
+) -> Any:
+    """
+    Run the traversal engine, splitting the first large wildcard expansion across threads.
+
+    The path is walked up to its first wildcard. When that wildcard expands a sized
+    container of at least PARALLEL_THRESHOLD elements, the elements are split into
+    contiguous chunks and the rest of the path is evaluated per chunk on the executor.
+    Chunk results are joined in order, so the result is identical to serial evaluation.
+    Slices are applied before the elements are split, and filters by the workers, to
+    the elements of their chunk.
+    Every chunk is evaluated by the serial engine. Smaller or unsized expansions, such
+    as the descendants of a '**' segment, and calls with a single worker and no
+    executor are evaluated serially.
+
+    Args:
+        obj: The object to traverse.
+        segments: The compiled path segments.
+        executor: The executor to submit chunks to. When None, a ThreadPoolExecutor with
+            'workers' threads is created for the call.
+        workers: Number of threads, also used to size the chunks (default: the number of CPUs).
+
+    Returns:
+        The found value(s) or None if not found.
+    """
+    if executor is None and workers is not None and workers <= 1:
+        return _evaluate(obj, segments)
+
+    end = len(segments)
+    obj, position = _walk(obj, segments, 0, end)
+    if position == end:
+        return obj
+    if not hasattr(obj, '__len__'):
+        return _evaluate(obj, segments[position:])
+    items = obj
+    if segments[position].selection is not None:
+        _, items = _select(obj, segments[position].selection)
+    if not hasattr(items, '__len__') or len(items) < PARALLEL_THRESHOLD:
+        return _evaluate(obj, segments[position:])
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if executor is None:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return _expand_parallel(items, segments, position, executor, workers)
+    return _expand_parallel(items, segments, position, executor, workers)
+
+
+def _expand_parallel(
+    items: Any,
+    segments: tuple[Segment, ...],
+    position: int,
+    executor: Executor,
+    workers: int,
+) -> Any:
+    """
+    Expand the wildcard at 'position' over 'items' in chunks submitted to the executor.
+
+    Every chunk is evaluated by the serial engine, as the same wildcard (without its
+    slice, already applied to items) followed by the rest of the path, so the chunks
+    get the same fast paths as a serial lookup.
+
+    Returns:
+        The joined results, or for the '?' operator the first non-None result.
+    """
+    if not isinstance(items, (list, tuple)):
+        items = list(items)
+    segment = segments[position]
+    chunk_segments = (segment._replace(selection=None),) + segments[position + 1:]
+    size = -(-len(items) // (workers * CHUNKS_PER_WORKER))
+    futures = [
+        executor.submit(_evaluate, items[start:start + size], chunk_segments)
+        for start in range(0, len(items), size)
+    ]
+
+    if segment.kind is SegmentKind.FIRST:
+        try:
+            for future in futures:
+                result = future.result()
+                if result is not None:
+                    return result
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
+
+    results = []
+    for future in futures:
+        results.extend(future.result())
+    return results
@@ -0,0 +1,402 @@
+from __future__ import annotations
+
+import ast
+import operator
+import re
+from enum import IntEnum
+from functools import lru_cache
+from typing import Any, Callable, Iterator, NamedTuple, Optional
+
+
+PATH_CACHE_SIZE = 1024
+
+
+class SegmentKind(IntEnum):
+    """
+    Meaning of a single path segment, decided once when the path is compiled.
+
+    - KEY: a plain key or attribute name (e.g. 'name').
+    - INDEX: a segment that parses as an integer (e.g. '0', or '-1' for the last
+      element). It is still looked up as a key on dictionaries and objects.
+    - ALL: the '*' operator, or a slice ('10:20', '::100', '-5:') that expands to
+      part of the elements only.
+    - FIRST: the '?' operator.
+    - ALL_NON_NULL: the '*?' (or '?*') operator.
+    - DESCENDANTS: the '**' operator, or '**N' to descend at most N levels.
+
+    Any of the operators and slices can be followed by a filter in brackets (e.g. '*[age>30]'),
+    and a bare filter ('[age>30]') is short for '*[age>30]'. The segment keeps the
+    kind of its operator and gets a predicate. A segment in brackets whose condition
+    cannot be parsed (e.g. '[age>]') is a KEY.
+    """
+    KEY = 0
+    INDEX = 1
+    ALL = 2
+    FIRST = 3
+    ALL_NON_NULL = 4
+    DESCENDANTS = 5
+
+
+_OPERATORS = {
+    '*': SegmentKind.ALL,
+    '?': SegmentKind.FIRST,
+    '*?': SegmentKind.ALL_NON_NULL,
+    '?*': SegmentKind.ALL_NON_NULL,
+}
+
+_SLICE = re.compile(r'(-?\d*):(-?\d*)(?::(-?\d*))?')
+_FILTER = re.compile(r'(\*\*\d*|\*\?|\?\*|\*|\?|-?\d*:-?\d*(?::-?\d*)?)?\[(.+)\]', re.DOTALL)
+_FILTER_START = re.compile(r'(\*\*\d*|\*\?|\?\*|\*|\?|-?\d*:-?\d*(?::-?\d*)?)?\[')
+_CONDITION = re.compile(r'\s*([^=!<>]+?)\s*(?:(==|!=|>=|<=|>|<)\s*(.+?))?\s*', re.DOTALL)
+_COMPARISONS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+_JSON_LITERALS = {'true': True, 'false': False, 'null': None}
+
+
+class Segment(NamedTuple):
+    """
+    A pre-classified path segment.
+
+    Attributes:
+        kind: The segment kind.
+        key: The raw segment text, used for dictionary and attribute lookups.
+        index: The integer value of the segment, or None if it is not an integer.
+        predicate: For filter segments, the function (element) telling whether an
+            element of the expansion is kept, otherwise None.
+        selection: For slice segments, the (start, stop, step) bounds of the elements
+            the segment expands to, otherwise None.
+    """
+    kind: SegmentKind
+    key: str
+    index: Optional[int]
+    predicate: Optional[Callable[[Any], bool]] = None
+    selection: Optional[tuple[Optional[int], Optional[int], Optional[int]]] = None
+
+
+class CompiledPath:
+    """
+    An immutable, pre-parsed path that can be passed to deep_find instead of a string.
+
+    Compiling a path splits it and classifies every segment once, so repeated
+    lookups with the same path skip all parsing work. A compiled path can also be
+    called directly with the object to search in.
+
+    When codegen is enabled, a Python function specialized for the path is generated
+    as well, and used by deep_find for lookups with this path.
+
+    Examples:
+        >>> path = compile_path('users.*.name')
+        >>> deep_find({'users': [{'name': 'John'}]}, path)
+        ['John']
+        >>> path({'users': [{'name': 'John'}]})
+        ['John']
+    """
+
+    __slots__ = ('_path', '_path_token', '_segments', '_getter', '_plain')
+
+    def __init__(self, path: str, path_token: str = '.', codegen: bool = False):
+        segments = ()
+        if path != '':
+            segments = tuple(_compile_segment(segment, path_token) for segment in _split(path, path_token))
+        getter = None
+        if codegen:
+            from deepfinder.codegen import _generate_getter
+            getter = _generate_getter(segments)
+        object.__setattr__(self, '_path', path)
+        object.__setattr__(self, '_path_token', path_token)
+        object.__setattr__(self, '_segments', segments)
+        object.__setattr__(self, '_getter', getter)
+        object.__setattr__(self, '_plain', _plain_tail(segments, 0))
+
+    @property
+    def path(self) -> str:
+        """The original path string."""
+        return self._path
+
+    @property
+    def path_token(self) -> str:
+        """The separator used to split the path."""
+        return self._path_token
+
+    @property
+    def segments(self) -> tuple[Segment, ...]:
+        """The compiled segments, in order."""
+        return self._segments
+
+    @property
+    def getter(self) -> Optional[Callable[[Any], Any]]:
+        """The generated function for the path, or None if codegen was not enabled."""
+        return self._getter
+
+    def __call__(self, obj: Any, default: Any = None) -> Any:
+        """
+        Find the value of this path in an object.
+
+        Args:
+            obj: The object to search in.
+            default: The value to return if the path is not found (default: None).
+
+        Returns:
+            The same result as deep_find(obj, self, default=default).
+        """
+        from deepfinder.deep_find import deep_find
+        return deep_find(obj, self, default=default)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __reduce__(self):
+        # Filter predicates are local functions that cannot be pickled, so a compiled path
+        # is pickled as the arguments it compiles from, and compiled again when loaded.
+        return compile_path, (self._path, self._path_token, self._getter is not None)
+
+    def __len__(self) -> int:
+        return len(self._segments)
+
+    def __iter__(self) -> Iterator[Segment]:
+        return iter(self._segments)
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, CompiledPath):
+            return NotImplemented
+        return self._segments == other._segments
+
+    def __hash__(self) -> int:
+        return hash(self._segments)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self._path!r}, path_token={self._path_token!r})'
+
+
+def _plain_tail(
+    segments: tuple[Segment, ...],
+    position: int,
+) -> Optional[tuple[tuple[str, Optional[int], int], ...]]:
+    """
+    Describe the segments from position on as (key, index, position) triples.
+
+    The traversal engine follows such keys and indexes in a single loop.
+
+    Returns:
+        The triples, or None if one of the segments is an operator.
+    """
+    tail = segments[position:]
+    if any(segment.kind > SegmentKind.INDEX for segment in tail):
+        return None
+    return tuple((segment.key, segment.index, position + offset) for offset, segment in enumerate(tail))
+
+
+def _split(path: str, path_token: str) -> list[str]:
+    """
+    Split a path into segments, keeping the separators inside filter brackets.
+
+    Only segments that start like a filter (an operator or a slice followed by '[', or a
+    bare '[') are read bracket by bracket, so a '[' inside a key (e.g. 'a[.b') is split
+    like any other character. A filter whose brackets are never closed is split as keys.
+
+    Args:
+        path: The path to split.
+        path_token: The character used to separate path segments.
+
+    Returns:
+        The raw segment texts.
+    """
+    if '[' not in path:
+        return path.split(path_token)
+
+    segments = []
+    start = 0
+    while True:
+        end = _filter_end(path, start, path_token) if _FILTER_START.match(path, start) else None
+        if end is None:
+            end = path.find(path_token, start)
+            if end < 0:
+                end = len(path)
+        segments.append(path[start:end])
+        if end == len(path):
+            return segments
+        start = end + len(path_token)
+
+
+def _filter_end(path: str, start: int, path_token: str) -> Optional[int]:
+    """
+    Find where a filter segment starting at 'start' ends, skipping the brackets and quotes.
+
+    Returns:
+        The position of the separator after the segment, the length of the path if it is
+        the last segment, or None if its brackets or quotes are not closed.
+    """
+    depth = 0
+    quote = None
+    position = start
+    while position < len(path):
+        char = path[position]
+        if quote is not None:
+            if char == '\\':
+                position += 1
+            elif char == quote:
+                quote = None
+        elif depth and char in '"\'':
+            quote = char
+        elif char == '[':
+            depth += 1
+        elif char == ']' and depth:
+            depth -= 1
+        elif not depth and path.startswith(path_token, position):
+            return position
+        position += 1
+    if depth or quote is not None:
+        return None
+    return len(path)
+
+
+def _compile_segment(segment: str, path_token: str = '.') -> Segment:
+    """
+    Classify a single path segment.
+
+    Args:
+        segment: The raw segment text.
+        path_token: The separator of the path, used for the fields of filters.
+
+    Returns:
+        The classified segment.
+
+    Raises:
+        ValueError: If the segment is a slice with a step of zero.
+    """
+    kind = _OPERATORS.get(segment)
+    if kind is not None:
+        return Segment(kind, segment, None)
+    match = _SLICE.fullmatch(segment)
+    if match is not None:
+        bounds = [int(bound) if bound else None for bound in match.groups()]
+        if bounds[2] == 0:
+            raise ValueError(f'slice step cannot be zero: {segment!r}')
+        return Segment(SegmentKind.ALL, segment, None, None, tuple(bounds))
+    match = _FILTER.fullmatch(segment)
+    if match is not None:
+        expansion = _compile_segment(match.group(1) or '*')
+        try:
+            predicate = _compile_filter(match.group(2), path_token)
+        except ValueError as _:
+            # Not a valid filter: a plain key, as in the first release (e.g. '[a>b]').
+            return Segment(SegmentKind.KEY, segment, None)
+        return Segment(expansion.kind, segment, None, predicate, expansion.selection)
+    if segment.startswith('**') and (segment == '**' or segment[2:].isdigit()):
+        return Segment(SegmentKind.DESCENDANTS, segment, None)
+
+    try:
+        index = int(segment)
+    except ValueError as _:
+        return Segment(SegmentKind.KEY, segment, None)
+    return Segment(SegmentKind.INDEX, segment, index)
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def _compile_filter(condition: str, path_token: str) -> Callable[[Any], bool]:
+    """
+    Compile the condition of a filter segment into a predicate.
+
+    A condition is a field path, optionally followed by a comparison operator (==, !=,
+    >, >=, < or <=) and a literal: a number, a quoted string, true, false or null. A
+    bare field keeps the elements where it is found. The field is looked up on every
+    element with deep_find semantics; a comparison that is not supported between the
+    found value and the literal (e.g. None > 30) rejects the element.
+
+    Predicates are cached by condition, so equal filters compile to equal segments.
+
+    Args:
+        condition: The text between the filter brackets (e.g. 'age>30').
+        path_token: The separator of the field path.
+
+    Returns:
+        The function (element) telling whether an element passes the filter.
+
+    Raises:
+        ValueError: If the condition cannot be parsed.
+    """
+    from deepfinder.deep_find import _evaluate
+
+    match = _CONDITION.fullmatch(condition)
+    if match is None:
+        raise ValueError(f'invalid filter: [{condition}]')
+    field_path, comparison, literal = match.groups()
+    field = compile_path(field_path, path_token).segments
+
+    if comparison is None:
+        return lambda element: _evaluate(element, field) is not None
+
+    if literal in _JSON_LITERALS:
+        literal = _JSON_LITERALS[literal]
+    else:
+        try:
+            literal = ast.literal_eval(literal)
+        except (ValueError, SyntaxError) as _:
+            raise ValueError(f'invalid filter literal: [{condition}]') from None
+        if literal is not None and not isinstance(literal, (str, int, float)):
+            raise ValueError(f'invalid filter literal: [{condition}]')
+    compare = _COMPARISONS[comparison]
+
+    def predicate(element: Any) -> bool:
+        try:
+            return bool(compare(_evaluate(element, field), literal))
+        except TypeError as _:
+            return False
+
+    return predicate
+
+
+_recent_paths: dict[tuple[str, str], CompiledPath] = {}
+
+
+def _recent_path(path: str, path_token: str) -> CompiledPath:
+    """
+    Compile a path for deep_find and remember it in a plain dictionary keyed by (path, path_token).
+
+    deep_find looks string paths up in that dictionary before calling this function,
+    which is cheaper per call than going through the LRU cache of compile_path. The
+    dictionary holds up to PATH_CACHE_SIZE paths and is cleared when it is full.
+    """
+    compiled = compile_path(path, path_token)
+    if len(_recent_paths) >= PATH_CACHE_SIZE:
+        _recent_paths.clear()
+    _recent_paths[(path, path_token)] = compiled
+    return compiled
+
+
+@lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path: str, path_token: str = '.', codegen: bool = False) -> CompiledPath:
+    """
+    Compile a dot-notation path into a reusable CompiledPath.
+
+    Results are kept in a bounded LRU cache, so compiling the same path twice
+    returns the same object. deep_find uses this cache for plain string paths.
+
+    Args:
+        path: The path to compile using dot notation (e.g., 'users.0.name').
+        path_token: The character used to separate path segments (default: '.').
+        codegen: If True, also generate a Python function specialized for the path,
+            with inlined dictionary and list lookups. It is worth it for hot paths
+            evaluated many times (default: False).
+
+    Returns:
+        The compiled path.
+
+    Examples:
+        >>> path = compile_path('users.0.name')
+        >>> [segment.kind for segment in path]
+        [<SegmentKind.KEY: 0>, <SegmentKind.INDEX: 1>, <SegmentKind.KEY: 0>]
+        >>> find_name = compile_path('users.0.name', codegen=True)
+        >>> find_name({'users': [{'name': 'John'}]})
+        'John'
+    """
+    return CompiledPath(path, path_token, codegen)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+from collections.abc import Sequence
+from itertools import islice
+from time import perf_counter_ns
+from typing import Any, Iterable, Iterator, Optional
+
+from deepfinder.deep_find import _evaluate, _is_forward, _is_tail, _walk
+from deepfinder.path import CompiledPath
+
+
+class DeepFindStats:
+    """
+    Traversal counters collected for a single deep_find call.
+
+    Pass an instance as the stats argument of deep_find to fill it. Collection only
+    happens when stats are requested, so lookups without them pay nothing.
+
+    Attributes:
+        path: The compiled path of the last call.
+        nodes_visited: Number of times a segment was applied to a node.
+        containers_converted: Number of iterables that had to be copied into a list, for
+            slices that can neither be read from the start nor kept in a bounded buffer.
+        expanded: Number of elements expanded by every wildcard segment, per segment.
+        misses: Number of times the path stopped matching, per segment.
+        elapsed_ns: Time spent applying every segment, in nanoseconds, per segment.
+        total_ns: Total time of the call, in nanoseconds.
+
+    Examples:
+        >>> stats = DeepFindStats()
+        >>> deep_find({'users': [{'name': 'ash'}, {}]}, 'users.*.name', stats=stats)
+        ['ash', None]
+        >>> stats.expanded, stats.misses
+        ([0, 2, 0], [0, 0, 1])
+    """
+
+    def __init__(self):
+        self._reset(None)
+
+    def _reset(self, path: Optional[CompiledPath]) -> None:
+        size = len(path.segments) if path is not None else 0
+        self.path = path
+        self.nodes_visited = 0
+        self.containers_converted = 0
+        self.expanded = [0] * size
+        self.misses = [0] * size
+        self.elapsed_ns = [0] * size
+        self.total_ns = 0
+
+    @property
+    def stopped_at(self) -> Optional[int]:
+        """Index of the first segment where the path stopped matching, or None."""
+        for position, misses in enumerate(self.misses):
+            if misses:
+                return position
+        return None
+
+    def summary(self) -> str:
+        """
+        Describe the collected counters, one line per segment.
+
+        Returns:
+            A human readable report.
+        """
+        lines = [
+            f'path {self.path.path!r}: {self.nodes_visited} nodes visited, '
+            f'{self.containers_converted} containers converted, {self.total_ns} ns',
+        ]
+        for position, segment in enumerate(self.path.segments):
+            lines.append(
+                f'  {position:>3} {segment.key!r:<16} expanded={self.expanded[position]} '
+                f'misses={self.misses[position]} elapsed_ns={self.elapsed_ns[position]}'
+            )
+        return '\n'.join(lines)
+
+    def __repr__(self) -> str:
+        return (
+            f'{type(self).__name__}(nodes_visited={self.nodes_visited}, '
+            f'containers_converted={self.containers_converted}, expanded={self.expanded}, '
+            f'misses={self.misses}, elapsed_ns={self.elapsed_ns}, total_ns={self.total_ns})'
+        )
+
+
+def _evaluate_with_stats(obj: Any, path: CompiledPath, stats: DeepFindStats, flatten: int = 0) -> Any:
+    """
+    Run the traversal engine while collecting counters.
+
+    Args:
+        obj: The object to traverse.
+        path: The compiled path.
+        stats: The counters to fill. They are reset first.
+        flatten: Number of levels of nested wildcard lists to merge (default: 0).
+
+    Returns:
+        The found value(s) or None if not found.
+    """
+    stats._reset(path)
+    started = perf_counter_ns()
+    try:
+        return _evaluate(obj, path.segments, _stats_walker(stats), flatten)
+    finally:
+        stats.total_ns = perf_counter_ns() - started
+
+
+def _iterate_with_stats(
+    obj: Any,
+    path: CompiledPath,
+    stats: DeepFindStats,
+    start: int,
+    stop: Optional[int],
+) -> list[Any]:
+    """
+    Run the streaming traversal engine while collecting counters, keeping a window of the values.
+
+    Args:
+        obj: The object to traverse.
+        path: The compiled path.
+        stats: The counters to fill. They are reset first.
+        start: Number of values to skip.
+        stop: Number of values after which the traversal stops, or None.
+
+    Returns:
+        The values from start to stop.
+    """
+    from deepfinder.deep_iter import _iterate
+
+    stats._reset(path)
+    started = perf_counter_ns()
+    try:
+        if stop == start:
+            return []
+        return list(islice(_iterate(obj, path.segments, walk=_stats_walker(stats)), start, stop))
+    finally:
+        stats.total_ns = perf_counter_ns() - started
+
+
+def _stats_walker(stats: DeepFindStats):
+    """
+    Build a replacement for _walk that applies one segment at a time and counts it.
+
+    Args:
+        stats: The counters to fill.
+
+    Returns:
+        A function with the same signature and results as _walk.
+    """
+    expanded = stats.expanded
+    misses = stats.misses
+    elapsed_ns = stats.elapsed_ns
+
+    def walk(obj, segments, position, end):
+        while position < end:
+            started = perf_counter_ns()
+            stats.nodes_visited += 1
+            segment = segments[position]
+            value, next_position = _walk(obj, segments, position, position + 1)
+            elapsed_ns[position] += perf_counter_ns() - started
+
+            if next_position == position:
+                selection = segment.selection
+                if selection is None:
+                    return _count_elements(value, expanded, position), position
+                if isinstance(value, Sequence):
+                    # Sequences are sliced in place, only the selected elements are expanded.
+                    expanded[position] += len(range(len(value))[slice(*selection)])
+                    return value, position
+                if not _is_forward(selection) and not _is_tail(selection):
+                    stats.containers_converted += 1
+                return _count_elements(value, expanded, position), position
+            if value is None:
+                misses[position] += 1
+                return None, end
+            obj = value
+            position = next_position
+        return obj, position
+
+    return walk
+
+
+def _count_elements(iterable: Iterable[Any], expanded: list[int], position: int) -> Iterator[Any]:
+    for element in iterable:
+        expanded[position] += 1
+        yield element
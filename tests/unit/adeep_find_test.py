@@ -0,0 +1,139 @@
+import asyncio
+import unittest
+
+from deepfinder import adeep_find
+
+
+async def load(value, delay=0):
+    await asyncio.sleep(delay)
+    return value
+
+
+async def generate(*values):
+    for value in values:
+        await asyncio.sleep(0)
+        yield value
+
+
+class Profile:
+    def __init__(self, name):
+        self.name = name
+
+    @property
+    async def details(self):
+        return {'name': self.name}
+
+
+class TestAdeepFind(unittest.IsolatedAsyncioTestCase):
+    async def test_plain_structures(self):
+        """
+        Test that adeep_find returns the same results as deep_find on structures without awaitables.
+
+        Expected: await adeep_find({'users': [{'name': 'ash'}, {}]}, 'users.*.name') -> ['ash', None]
+        """
+        data = {'users': [{'name': 'ash'}, {}]}
+        self.assertEqual(await adeep_find(data, 'users.*.name'), ['ash', None])
+        self.assertEqual(await adeep_find(data, 'users.*?.name'), ['ash'])
+        self.assertEqual(await adeep_find(data, 'users.0.name'), 'ash')
+        self.assertEqual(await adeep_find(data, ''), data)
+
+    async def test_awaits_values_along_the_path(self):
+        """
+        Test that coroutines met along the path, and the final value, are awaited.
+
+        Expected: await adeep_find({'user': load({'pokemons': load([load('pikachu')])})}, 'user.pokemons.0') -> 'pikachu'
+        """
+        data = {'user': load({'pokemons': load([load('pikachu')])})}
+        self.assertEqual(await adeep_find(data, 'user.pokemons.0'), 'pikachu')
+
+    async def test_async_properties_and_iterables(self):
+        """
+        Test that async properties are awaited and async iterables are collected.
+
+        Expected: await adeep_find({'profiles': generate(Profile('ash'), Profile('misty'))}, 'profiles.*.details.name') -> ['ash', 'misty']
+        """
+        data = {'profiles': generate(Profile('ash'), Profile('misty'))}
+        self.assertEqual(await adeep_find(data, 'profiles.*.details.name'), ['ash', 'misty'])
+        self.assertEqual(await adeep_find({'values': generate(1, 2, 3)}, 'values.1'), 2)
+
+    async def test_wildcard_branches_run_concurrently(self):
+        """
+        Test that '*' awaits its branches concurrently, so the total time is close to the slowest branch.
+
+        Expected: ten branches of 50 ms each -> done in well under 500 ms
+        """
+        data = {'users': [{'name': load(f'user{index}', 0.05)} for index in range(10)]}
+        started = asyncio.get_running_loop().time()
+        result = await adeep_find(data, 'users.*.name')
+        elapsed = asyncio.get_running_loop().time() - started
+        self.assertEqual(result, [f'user{index}' for index in range(10)])
+        self.assertLess(elapsed, 0.3)
+
+    async def test_first_non_null_does_not_wait_for_later_branches(self):
+        """
+        Test that '?' returns once the first non-None result in order is known, cancelling later branches.
+
+        Expected: await adeep_find([load(None, 0.01), load('fast', 0.02), load('slow', 10)], '?') -> 'fast'
+        """
+        data = [load(None, 0.01), load('fast', 0.02), load('slow', 10)]
+        result = await asyncio.wait_for(adeep_find(data, '?'), timeout=1)
+        self.assertEqual(result, 'fast')
+
+    async def test_async_iterables_are_read_lazily(self):
+        """
+        Test that '?' and indexes stop reading an async iterable at the element they need.
+
+        Expected: await adeep_find({'values': endless()}, 'values.?.name') -> 'misty', reading 3 elements
+        """
+        read = 0
+
+        async def endless():
+            nonlocal read
+            for index in range(3):
+                read += 1
+                yield {'name': 'misty'} if index == 2 else {}
+            while True:
+                read += 1
+                await asyncio.sleep(1)
+                yield {}
+
+        result = await asyncio.wait_for(adeep_find({'values': endless()}, 'values.?.name'), timeout=0.5)
+        self.assertEqual(result, 'misty')
+        self.assertEqual(read, 4)
+
+        read = 0
+        result = await asyncio.wait_for(adeep_find({'values': endless()}, 'values.2.name'), timeout=0.5)
+        self.assertEqual(result, 'misty')
+        self.assertEqual(read, 3)
+        self.assertEqual(await adeep_find({'values': generate(1, 2, 3)}, 'values.-1'), 3)
+        self.assertEqual(await adeep_find({'values': generate(None, 2, 3)}, 'values.?'), 2)
+        self.assertEqual(await adeep_find({'values': generate({}, {'a': 1})}, 'values.?[a].a'), 1)
+
+    async def test_concurrency_cap(self):
+        """
+        Test that no more awaitables than the concurrency cap are awaited at the same time.
+
+        Expected: await adeep_find(twenty awaitables, '*', concurrency=3) -> at most 3 running at once
+        """
+        running = 0
+        peak = 0
+
+        async def tracked(value):
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return value
+
+        result = await adeep_find([tracked(index) for index in range(20)], '*', concurrency=3)
+        self.assertEqual(result, list(range(20)))
+        self.assertEqual(peak, 3)
+
+    async def test_default_value(self):
+        """
+        Test that the default value is returned when the path is not found.
+
+        Expected: await adeep_find({'user': load({})}, 'user.name', default='default') -> 'default'
+        """
+        self.assertEqual(await adeep_find({'user': load({})}, 'user.name', default='default'), 'default')
@@ -0,0 +1,119 @@
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr
+from unittest import mock
+
+from deepfinder.cli import main, scan
+
+
+DOCUMENTS = [
+    {'id': index, 'user': {'name': f'user{index}'}, 'tags': ['a', 'b'] if index % 2 else []}
+    for index in range(50)
+]
+PATHS = ['id', 'user.name', 'tags.*']
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.jsonl', delete=False) as fp:
+            for document in DOCUMENTS:
+                fp.write(json.dumps(document) + '\n')
+            fp.write('\n')
+        self.file = fp.name
+
+    def tearDown(self):
+        os.unlink(self.file)
+
+    def expected(self):
+        return [
+            {'id': document['id'], 'user.name': document['user']['name'], 'tags.*': document['tags']}
+            for document in DOCUMENTS
+        ]
+
+    def test_jsonl_output_keeps_input_order(self):
+        """
+        Test that scan writes one JSON object per document, in input order, whatever the range size.
+
+        Empty lines are skipped.
+
+        Expected: scan(file, ['id', 'user.name', 'tags.*']) -> {'id': 0, 'user.name': 'user0', 'tags.*': []}, ...
+        """
+        for chunk_size in (1, 100, 1 << 20):
+            with self.subTest(chunk_size=chunk_size):
+                lines = ''.join(scan(self.file, PATHS, chunk_size=chunk_size)).splitlines()
+                self.assertEqual([json.loads(line) for line in lines], self.expected())
+
+    def test_worker_processes(self):
+        """
+        Test that scan gives the same results with worker processes, ordered or not.
+
+        Expected: scan(file, paths, workers=2) -> same lines as with one worker
+        """
+        expected = self.expected()
+        ordered = ''.join(scan(self.file, PATHS, workers=2, chunk_size=100)).splitlines()
+        self.assertEqual([json.loads(line) for line in ordered], expected)
+
+        unordered = ''.join(scan(self.file, PATHS, workers=2, ordered=False, chunk_size=100)).splitlines()
+        self.assertCountEqual([json.loads(line) for line in unordered], expected)
+
+    def test_stdin_is_read_in_batches(self):
+        """
+        Test that scan reads stdin in line-aligned batches and yields the output of every batch.
+
+        Expected: scan('-', paths, chunk_size=100) -> several outputs, same lines as the file
+        """
+        with open(self.file, 'rb') as fp:
+            stdin = io.TextIOWrapper(io.BytesIO(fp.read()))
+        with mock.patch('sys.stdin', stdin):
+            outputs = list(scan('-', PATHS, chunk_size=100))
+        self.assertGreater(len(outputs), 1)
+        self.assertEqual([json.loads(line) for line in ''.join(outputs).splitlines()], self.expected())
+
+    def test_tsv_output(self):
+        """
+        Test that the TSV format writes strings as text, None as an empty field and anything else as JSON.
+
+        Expected: main(['id', 'user.name', 'tags.*', 'missing', file, '-f', 'tsv']) -> '1\\tuser1\\t["a", "b"]\\t'
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            output = os.path.join(directory, 'out.tsv')
+            status = main(PATHS + ['missing', self.file, '-f', 'tsv', '-w', '1', '-o', output])
+            with open(output, encoding='utf-8') as fp:
+                lines = fp.read().splitlines()
+        self.assertEqual(status, 0)
+        self.assertEqual(lines[1], '1\tuser1\t["a", "b"]\t')
+
+    def test_tsv_escapes_separators(self):
+        """
+        Test that tabs, newlines and backslashes inside values are escaped in the TSV format.
+
+        Expected: {'text': 'a\\tb\\nc\\\\'} -> 'a\\\\tb\\\\nc\\\\\\\\'
+        """
+        with open(self.file, 'w') as fp:
+            fp.write(json.dumps({'text': 'a\tb\nc\\'}) + '\n')
+        self.assertEqual(''.join(scan(self.file, ['text'], output_format='tsv')), 'a\\tb\\nc\\\\\n')
+
+    def test_empty_file(self):
+        """
+        Test that an empty file produces no output.
+
+        Expected: scan(empty_file, ['id']) -> ''
+        """
+        open(self.file, 'w').close()
+        self.assertEqual(''.join(scan(self.file, ['id'])), '')
+
+    def test_invalid_json_fails(self):
+        """
+        Test that main reports invalid documents and exits with status 1.
+
+        Expected: main(['id', file_with_invalid_line]) -> 1
+        """
+        with open(self.file, 'w') as fp:
+            fp.write('{"id": 1}\n{"id": \n')
+        with tempfile.TemporaryDirectory() as directory, redirect_stderr(io.StringIO()) as stderr:
+            status = main(['id', self.file, '-w', '1', '-o', os.path.join(directory, 'out.jsonl')])
+        self.assertEqual(status, 1)
+        self.assertIn('deepfinder: error:', stderr.getvalue())
@@ -0,0 +1,83 @@
+import unittest
+
+from deepfinder import compile_path, deep_find
+
+
+class CustomClass:
+    def __init__(self, **attributes):
+        self.__dict__.update(attributes)
+
+
+class TestCodegen(unittest.TestCase):
+    def test_generated_getter(self):
+        """
+        Test that compile_path generates a getter when codegen is enabled.
+
+        Expected: compile_path('a.0.b', codegen=True).getter({'a': [{'b': 1}]}) -> 1
+        """
+        path = compile_path('a.0.b', codegen=True)
+        self.assertEqual(path.getter({'a': [{'b': 1}]}), 1)
+
+    def test_no_getter_without_codegen(self):
+        """
+        Test that compile_path does not generate a getter by default.
+
+        Expected: compile_path('a.b').getter -> None
+        """
+        self.assertIsNone(compile_path('a.b').getter)
+
+    def test_compiled_path_is_callable(self):
+        """
+        Test that a compiled path can be called with the object to search in and a default.
+
+        Expected: compile_path('a', codegen=True)({}, default='default') -> 'default'
+        """
+        path = compile_path('a', codegen=True)
+        self.assertEqual(path({'a': 1}), 1)
+        self.assertEqual(path({}, default='default'), 'default')
+
+    def test_wildcards(self):
+        """
+        Test that generated getters expand wildcards the same way deep_find does.
+
+        Expected: compile_path(path, codegen=True) returns deep_find's result for '*', '?' and '*?'
+        """
+        data: dict = {'v': [{'w': [1, None]}, {'w': []}, {'x': 3}, {'w': (None, 2)}]}
+        for path in ['v.*.w.*', 'v.*?.w.?', 'v.?.w.*?', 'v.*.w.0', 'v.*?.w.*?']:
+            with self.subTest(path=path):
+                self.assertEqual(compile_path(path, codegen=True)(data), deep_find(data, path))
+
+    def test_fallback_to_generic_traversal(self):
+        """
+        Test that generated getters fall back to the generic traversal for other types.
+
+        Objects, sets and generators are not inlined by the generated code, so they
+        are handled by the generic engine for the rest of the path.
+
+        Expected: compile_path('a.*.b', codegen=True)(CustomClass(a={...})) -> same as deep_find
+        """
+        data = CustomClass(a=(CustomClass(b=1), {'b': 2}))
+        path = compile_path('a.*.b', codegen=True)
+        self.assertEqual(path(data), [1, 2])
+
+    def test_wildcard_is_a_key_in_dicts(self):
+        """
+        Test that generated getters look up wildcard operators as keys in dictionaries.
+
+        Expected: compile_path('*.a', codegen=True)({'*': {'a': 1}}) -> 1
+        """
+        path = compile_path('*.a', codegen=True)
+        self.assertEqual(path({'*': {'a': 1}}), 1)
+
+    def test_keys_are_not_evaluated_as_code(self):
+        """
+        Test that path segments are embedded in the generated code as string literals.
+
+        Expected: compile_path("a'+'b", codegen=True)({"a'+'b": 1}) -> 1
+        """
+        path = compile_path("a'+'b", codegen=True)
+        self.assertEqual(path({"a'+'b": 1}), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
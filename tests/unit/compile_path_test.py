@@ -0,0 +1,135 @@
+import pickle
+import unittest
+
+from deepfinder import CompiledPath, compile_path, deep_find
+from deepfinder import path
+from deepfinder.path import SegmentKind
+
+
+class TestCompilePath(unittest.TestCase):
+    def test_segments_are_classified(self):
+        """
+        Test that compile_path classifies every segment of the path.
+
+        This test verifies that keys, integer indices and operators are told
+        apart once at compile time, so deep_find does not have to parse them
+        again on every call.
+
+        Expected: compile_path('a.0.*.?.*?.?*') -> KEY, INDEX, ALL, FIRST, ALL_NON_NULL, ALL_NON_NULL
+        """
+        path = compile_path('a.0.*.?.*?.?*')
+        self.assertEqual(
+            [segment.kind for segment in path],
+            [
+                SegmentKind.KEY,
+                SegmentKind.INDEX,
+                SegmentKind.ALL,
+                SegmentKind.FIRST,
+                SegmentKind.ALL_NON_NULL,
+                SegmentKind.ALL_NON_NULL,
+            ],
+        )
+        self.assertEqual(path.segments[1].index, 0)
+
+    def test_empty_path_has_no_segments(self):
+        """
+        Test that an empty path compiles to a path without segments.
+
+        Expected: len(compile_path('')) -> 0
+        """
+        self.assertEqual(len(compile_path('')), 0)
+
+    def test_compiled_path_is_immutable(self):
+        """
+        Test that a CompiledPath cannot be modified after it is created.
+
+        Compiled paths are shared through the LRU cache, so changing one would
+        change the result of every lookup using the same path string.
+
+        Expected: setting an attribute on a CompiledPath raises AttributeError
+        """
+        path = compile_path('a.b')
+        with self.assertRaises(AttributeError):
+            path._segments = ()
+
+    def test_compiled_path_can_be_pickled(self):
+        """
+        Test that a CompiledPath survives a pickle round trip, including filters and generated getters.
+
+        Expected: pickle.loads(pickle.dumps(compile_path('a.b'))) == compile_path('a.b')
+        """
+        self.assertEqual(pickle.loads(pickle.dumps(compile_path('a.b'))), compile_path('a.b'))
+        self.assertEqual(pickle.loads(pickle.dumps(compile_path('a/0', '/'))), compile_path('a/0', '/'))
+
+        restored = pickle.loads(pickle.dumps(compile_path('users.[age>30].name')))
+        self.assertEqual(restored({'users': [{'age': 10, 'name': 'ash'}, {'age': 35, 'name': 'brock'}]}), ['brock'])
+
+        restored = pickle.loads(pickle.dumps(compile_path('a.b', codegen=True)))
+        self.assertIsNotNone(restored.getter)
+        self.assertEqual(restored({'a': {'b': 1}}), 1)
+
+    def test_compile_path_is_cached(self):
+        """
+        Test that compiling the same path twice returns the same object.
+
+        Expected: compile_path('a.b') is compile_path('a.b')
+        """
+        self.assertIs(compile_path('a.b'), compile_path('a.b'))
+
+    def test_deep_find_remembers_string_paths(self):
+        """
+        Test that deep_find keeps the paths it compiles in a bounded dictionary keyed by path and token.
+
+        Expected: deep_find(data, 'a.b') stores the compiled path under ('a.b', '.'), and the
+        dictionary never holds more than PATH_CACHE_SIZE paths
+        """
+        path._recent_paths.clear()
+        deep_find({'a': {'b': 1}}, 'a.b')
+        deep_find({'a': {'b': 1}}, 'a/b', path_token='/')
+        self.assertEqual(path._recent_paths[('a.b', '.')], compile_path('a.b'))
+        self.assertEqual(path._recent_paths[('a/b', '/')], compile_path('a/b', '/'))
+        for index in range(path.PATH_CACHE_SIZE + 1):
+            deep_find({}, f'key{index}')
+        self.assertLessEqual(len(path._recent_paths), path.PATH_CACHE_SIZE)
+
+    def test_custom_path_token(self):
+        """
+        Test that compile_path splits the path using a custom path token.
+
+        Expected: compile_path('a/0', '/') == CompiledPath('a.0')
+        """
+        self.assertEqual(compile_path('a/0', '/'), CompiledPath('a.0'))
+
+    def test_deep_find_with_compiled_path(self):
+        """
+        Test that deep_find accepts a compiled path instead of a string.
+
+        Expected: deep_find({'users': [{'name': 'ash'}]}, compile_path('users.*.name')) -> ['ash']
+        """
+        data: dict = {'users': [{'name': 'ash'}]}
+        result = deep_find(data, compile_path('users.*.name'))
+        self.assertEqual(result, ['ash'])
+
+    def test_deep_find_with_compiled_path_ignores_path_token(self):
+        """
+        Test that deep_find ignores path_token when the path is already compiled.
+
+        Expected: deep_find({'a': {'b': 1}}, compile_path('a/b', '/'), path_token='.') -> 1
+        """
+        data: dict = {'a': {'b': 1}}
+        result = deep_find(data, compile_path('a/b', '/'), path_token='.')
+        self.assertEqual(result, 1)
+
+    def test_integer_segment_is_a_key_in_dicts(self):
+        """
+        Test that integer segments are still looked up as string keys in dictionaries.
+
+        Expected: deep_find({'0': 'zero'}, compile_path('0')) -> 'zero'
+        """
+        data: dict = {'0': 'zero'}
+        result = deep_find(data, compile_path('0'))
+        self.assertEqual(result, 'zero')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+from collections import namedtuple
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Any, NamedTuple
+
+from deepfinder import deep_find
+
+
+Point = namedtuple('Point', 'x y')
+
+
+class Trainer(NamedTuple):
+    name: str
+    badges: Any
+
+
+class Slotted:
+    __slots__ = ('name', 'region')
+
+    def __init__(self, name):
+        self.name = name
+
+
+@dataclass
+class SlottedPokemon:
+    __slots__ = ('name', 'moves')
+    name: str
+    moves: list
+
+
+class Profile:
+    def __init__(self, first, last):
+        self.first = first
+        self.last = last
+
+    @property
+    def full_name(self):
+        return f'{self.first} {self.last}'
+
+    @property
+    def missing(self):
+        raise AttributeError('missing')
+
+    @cached_property
+    def initials(self):
+        return [self.first[0], self.last[0]]
+
+    def method(self):
+        return 'method'
+
+
+class TestDeepFindAttributes(unittest.TestCase):
+    def test_namedtuple_fields_and_indexes(self):
+        """
+        Test that named tuples are read by field name, by index and with wildcards.
+
+        Expected: deep_find(Point(1, 2), 'y') -> 2, deep_find(Point(1, 2), '0') -> 1
+        """
+        self.assertEqual(deep_find(Point(1, 2), 'y'), 2)
+        self.assertEqual(deep_find(Point(1, 2), '0'), 1)
+        self.assertEqual(deep_find(Point(1, 2), '*'), [1, 2])
+        self.assertEqual(deep_find(Point(1, 2), 'z'), None)
+        self.assertEqual(deep_find({'trainer': Trainer('ash', {'kanto': 8})}, 'trainer.badges.kanto'), 8)
+
+    def test_slots(self):
+        """
+        Test that attributes stored in __slots__ are read, and unset slots read as None.
+
+        Expected: deep_find(Slotted('ash'), 'name') -> 'ash', deep_find(Slotted('ash'), 'region') -> None
+        """
+        self.assertEqual(deep_find(Slotted('ash'), 'name'), 'ash')
+        self.assertEqual(deep_find(Slotted('ash'), 'region', default='kanto'), 'kanto')
+        pokemon = SlottedPokemon('pikachu', [{'name': 'thunderbolt'}])
+        self.assertEqual(deep_find(pokemon, 'moves.*.name'), ['thunderbolt'])
+
+    def test_properties(self):
+        """
+        Test that properties and cached properties are read, and AttributeError reads as None.
+
+        Expected: deep_find(Profile('ash', 'ketchum'), 'full_name') -> 'ash ketchum'
+        """
+        profile = Profile('ash', 'ketchum')
+        self.assertEqual(deep_find(profile, 'full_name'), 'ash ketchum')
+        self.assertEqual(deep_find(profile, 'initials.1'), 'k')
+        self.assertEqual(deep_find(profile, 'first'), 'ash')
+        self.assertIsNone(deep_find(profile, 'missing'))
+
+    def test_methods_are_not_reachable(self):
+        """
+        Test that methods and other class attributes are not returned, as before.
+
+        Expected: deep_find(Profile('ash', 'ketchum'), 'method') -> None
+        """
+        profile = Profile('ash', 'ketchum')
+        self.assertIsNone(deep_find(profile, 'method'))
+        self.assertIsNone(deep_find(profile, '__class__'))
+        self.assertIsNone(deep_find('text', 'upper'))
@@ -0,0 +1,84 @@
+import importlib
+import os
+import unittest
+from unittest import mock
+
+from deepfinder import compile_path, deep_find_batch, deep_find_many
+
+batch_module = importlib.import_module('deepfinder.deep_find_batch')
+
+
+class Broken:
+    @property
+    def value(self):
+        raise KeyError('value')
+
+
+DOCS = [
+    {'id': index, 'user': {'name': f'user{index}'}, 'tags': ['a', 'b'] if index % 2 else []}
+    for index in range(100)
+]
+
+
+class TestDeepFindBatch(unittest.TestCase):
+    def test_same_results_as_deep_find_many(self):
+        """
+        Test that worker processes return the deep_find_many result of every document, in order.
+
+        Expected: deep_find_batch(DOCS, paths, processes=2) -> [deep_find_many(doc, paths) for doc in DOCS]
+        """
+        paths = ['id', 'user.name', 'tags.*', compile_path('user/name', '/'), 'missing']
+        with mock.patch.object(batch_module, 'BATCH_THRESHOLD', 10):
+            results = deep_find_batch(DOCS, paths, processes=2, defaults={'missing': 'default'})
+        expected = [deep_find_many(doc, paths, defaults={'missing': 'default'}) for doc in DOCS]
+        self.assertEqual(results, expected)
+
+    def test_named_paths(self):
+        """
+        Test that named paths return a dictionary per document.
+
+        Expected: deep_find_batch(DOCS, {'id': 'id', 'phone': 'user.phone'}, processes=2)[3] -> {'id': 3, 'phone': 'unknown'}
+        """
+        paths = {'id': 'id', 'phone': 'user.phone'}
+        with mock.patch.object(batch_module, 'BATCH_THRESHOLD', 10):
+            results = deep_find_batch(DOCS, paths, processes=2, defaults={'phone': 'unknown'})
+        self.assertEqual(results[3], {'id': 3, 'phone': 'unknown'})
+        self.assertEqual(len(results), len(DOCS))
+
+    def test_defaults_keyed_by_compiled_path(self):
+        """
+        Test that defaults can be keyed by compiled paths, including filters, when workers are used.
+
+        Expected: deep_find_batch(DOCS, [path], processes=2, defaults={path: 'x'}) -> ('x',) for every document
+        """
+        missing = compile_path('user.phone')
+        tagged = compile_path('tags.?[0=="c"]')
+        with mock.patch.object(batch_module, 'BATCH_THRESHOLD', 10):
+            results = deep_find_batch(DOCS, [missing, tagged], processes=2, defaults={missing: 'x', tagged: 'y'})
+        self.assertEqual(results, [('x', 'y')] * len(DOCS))
+
+    @unittest.skipUnless(os.path.isdir('/dev/shm'), 'shared memory is not listed in /dev/shm')
+    def test_worker_errors_release_shared_memory(self):
+        """
+        Test that an error in one document is raised and every shared memory segment is released.
+
+        Expected: KeyError, and no segment left in /dev/shm
+        """
+        docs = [{'item': {}} for _ in range(100)]
+        docs[50] = {'item': Broken()}
+        before = set(os.listdir('/dev/shm'))
+        with mock.patch.object(batch_module, 'BATCH_THRESHOLD', 10):
+            with self.assertRaises(KeyError):
+                deep_find_batch(docs, ['item.value'], processes=2)
+        self.assertEqual(set(os.listdir('/dev/shm')) - before, set())
+
+    def test_small_batches_run_in_process(self):
+        """
+        Test that batches under the threshold are evaluated without the process pool.
+
+        Expected: deep_find_batch(DOCS[:5], ['id'], processes=2) -> [(0,), ..., (4,)], no pool created
+        """
+        with mock.patch.object(batch_module, '_pool') as pool:
+            results = deep_find_batch(DOCS[:5], ['id'], processes=2)
+        self.assertEqual(results, [(index,) for index in range(5)])
+        pool.assert_not_called()
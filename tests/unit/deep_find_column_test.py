@@ -0,0 +1,79 @@
+import math
+import unittest
+
+from deepfinder import deep_find_column
+from deepfinder.deep_find_column import numpy
+
+
+class TestDeepFindColumn(unittest.TestCase):
+    def test_values_and_mask(self):
+        """
+        Test that deep_find_column stores the value of every record and marks the missing ones.
+
+        Expected: deep_find_column([{'m': {'l': 1.5}}, {'m': {}}, {'m': {'l': 3}}], 'm.l')
+                  -> values [1.5, nan, 3.0], mask [False, True, False]
+        """
+        records: list = [{'m': {'l': 1.5}}, {'m': {}}, {'m': {'l': 3}}]
+        values, mask = deep_find_column(records, 'm.l')
+        self.assertEqual([bool(item) for item in mask], [False, True, False])
+        self.assertEqual(values[0], 1.5)
+        self.assertTrue(math.isnan(values[1]))
+        self.assertEqual(values[2], 3.0)
+
+    def test_integer_dtype_and_missing_value(self):
+        """
+        Test that deep_find_column uses the given type and fills missing entries with the missing value.
+
+        Expected: deep_find_column([{'v': 1}, {}], 'v', dtype='q', missing=-1) -> values [1, -1]
+        """
+        records: list = [{'v': 1}, {}]
+        values, mask = deep_find_column(records, 'v', dtype='q', missing=-1)
+        self.assertEqual(values.tolist(), [1, -1])
+        self.assertEqual([bool(item) for item in mask], [False, True])
+
+    def test_values_of_another_type_are_masked(self):
+        """
+        Test that values that cannot be stored as the array's type are marked as missing.
+
+        Expected: deep_find_column([{'v': 1}, {'v': 'n/a'}, {'v': {}}, {'v': 2 ** 70}], 'v', dtype='q', missing=-1)
+                  -> values [1, -1, -1, -1], mask [False, True, True, True]
+        """
+        records: list = [{'v': 1}, {'v': 'n/a'}, {'v': {}}, {'v': 2 ** 70}]
+        values, mask = deep_find_column(records, 'v', dtype='q', missing=-1)
+        self.assertEqual(values.tolist(), [1, -1, -1, -1])
+        self.assertEqual([bool(item) for item in mask], [False, True, True, True])
+
+    def test_records_without_length(self):
+        """
+        Test that deep_find_column accepts records from an iterable without a length.
+
+        Expected: deep_find_column((r for r in [{'v': 1}, {'v': 2}]), 'v', dtype='q') -> values [1, 2]
+        """
+        records = (record for record in [{'v': 1}, {'v': 2}])
+        values, _ = deep_find_column(records, 'v', dtype='q')
+        self.assertEqual(values.tolist(), [1, 2])
+
+    def test_empty_records(self):
+        """
+        Test that deep_find_column returns empty arrays for an empty batch.
+
+        Expected: deep_find_column([], 'v') -> values [], mask []
+        """
+        values, mask = deep_find_column([], 'v')
+        self.assertEqual(len(values), 0)
+        self.assertEqual(len(mask), 0)
+
+    @unittest.skipIf(numpy is None, 'numpy is not installed')
+    def test_numpy_arrays(self):
+        """
+        Test that deep_find_column returns NumPy arrays when NumPy is installed.
+
+        Expected: deep_find_column([{'v': 1}], 'v', dtype='int32') -> numpy arrays of int32 and bool
+        """
+        values, mask = deep_find_column([{'v': 1}], 'v', dtype='int32')
+        self.assertEqual(values.dtype, numpy.int32)
+        self.assertEqual(mask.dtype, numpy.bool_)
+
+
+if __name__ == '__main__':
+    unittest.main()
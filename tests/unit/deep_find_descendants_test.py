@@ -0,0 +1,109 @@
+import unittest
+
+from deepfinder import compile_path, deep_find, deep_find_many, deep_iter
+
+
+class Node:
+    def __init__(self, id, children=()):
+        self.id = id
+        self.children = list(children)
+
+
+class SlottedNode:
+    __slots__ = ('id', 'child')
+
+    def __init__(self, id, child=None):
+        self.id = id
+        self.child = child
+
+
+ORDER = {
+    'id': 1,
+    'order': {
+        'id': 2,
+        'items': [{'sku': 'a', 'id': 3}, {'sku': 'b', 'bundle': {'items': [{'sku': 'c', 'id': 4}]}}],
+    },
+    'tags': ['x', 'y'],
+}
+
+
+class TestDeepFindDescendants(unittest.TestCase):
+    def test_any_depth(self):
+        """
+        Test that '**' finds a key at any depth, including on the starting object, in document order.
+
+        Expected: deep_find(ORDER, '**.id') -> [1, 2, 3, 4]
+        """
+        self.assertEqual(deep_find(ORDER, '**.id'), [1, 2, 3, 4])
+        self.assertEqual(deep_find(ORDER, 'order.**.sku'), ['a', 'b', 'c'])
+        self.assertEqual(deep_find(ORDER, '**.missing'), [])
+        self.assertEqual(deep_find(ORDER, 'missing.**.id', default='default'), 'default')
+
+    def test_all_descendants(self):
+        """
+        Test that a trailing '**' returns the object and every descendant, scalars included.
+
+        Expected: deep_find({'a': [1, {'b': 2}]}, '**') -> [{'a': [...]}, [1, {'b': 2}], 1, {'b': 2}, 2]
+        """
+        data = {'a': [1, {'b': 2}]}
+        self.assertEqual(deep_find(data, '**'), [data, data['a'], 1, {'b': 2}, 2])
+
+    def test_max_depth(self):
+        """
+        Test that '**N' descends at most N levels.
+
+        Expected: deep_find(ORDER, '**1.id') -> [1, 2], deep_find(ORDER, '**0.id') -> [1]
+        """
+        self.assertEqual(deep_find(ORDER, '**0.id'), [1])
+        self.assertEqual(deep_find(ORDER, '**1.id'), [1, 2])
+        self.assertEqual(deep_find(ORDER, '**3.id'), [1, 2, 3])
+
+    def test_objects_and_cycles(self):
+        """
+        Test that '**' descends into object attributes and slots, and skips cyclic references.
+
+        Expected: deep_find(root, '**.id') -> [1, 2, 3, 4] for a graph where a child points back to the root
+        """
+        root = Node(1, [Node(2), Node(3, [SlottedNode(4)])])
+        root.children[0].children.append(root)
+        self.assertEqual(deep_find(root, '**.id'), [1, 2, 3, 4])
+
+        cycle = []
+        cycle.append(cycle)
+        cycle.append({'id': 5})
+        self.assertEqual(deep_find(cycle, '**.id'), [5])
+
+    def test_shared_references(self):
+        """
+        Test that a node reached through several paths is matched every time, like in a tree.
+
+        Expected: deep_find({'a': shared, 'b': [shared]}, '**.id') -> [1, 1]
+        """
+        shared = {'id': 1}
+        self.assertEqual(deep_find({'a': shared, 'b': [shared]}, '**.id'), [1, 1])
+        self.assertEqual(deep_find({'a': (), 'b': [()]}, '**'), [{'a': (), 'b': [()]}, (), [()], ()])
+        self.assertEqual(list(deep_iter({'a': shared, 'b': [shared]}, '**.id')), [1, 1])
+
+    def test_deep_iter_streams_descendants(self):
+        """
+        Test that deep_iter yields the matches of '**' one at a time, without listing the descendants first.
+
+        Expected: next(deep_iter(huge, '**.id')) -> 0 without visiting the rest of the structure
+        """
+        def records():
+            for index in range(10):
+                yield {'id': index}
+            raise AssertionError('consumed past the first records')
+
+        self.assertEqual(list(deep_iter(ORDER, '**.id')), [1, 2, 3, 4])
+        matches = deep_iter({'records': records()}, '**.id')
+        self.assertEqual([next(matches), next(matches)], [0, 1])
+
+    def test_other_entry_points(self):
+        """
+        Test that generated getters and deep_find_many give the same results for '**' paths.
+
+        Expected: compile_path('**.sku', codegen=True)(ORDER) -> ['a', 'b', 'c']
+        """
+        self.assertEqual(compile_path('order.**.sku', codegen=True)(ORDER), ['a', 'b', 'c'])
+        self.assertEqual(deep_find_many(ORDER, ['**.id', 'order.**.sku']), ([1, 2, 3, 4], ['a', 'b', 'c']))
@@ -0,0 +1,183 @@
+import io
+import unittest
+
+from deepfinder import DeepIndex, compile_path, deep_find, deep_find_many, deep_find_stream, deep_iter
+from deepfinder.path import SegmentKind
+
+
+class User:
+    def __init__(self, name, age=None):
+        self.name = name
+        self.age = age
+
+
+DATA = {
+    'users': [
+        {'name': 'ash', 'age': 10, 'address': {'city': 'pallet'}},
+        {'name': 'brock', 'age': 35},
+        {'name': 'misty'},
+        {'name': 'oak', 'age': 60, 'address': {'city': 'pallet'}},
+    ],
+    'items': [{'status': 'ok', 'id': 1}, {'status': 'ko', 'id': 2}, {'status': 'ok', 'id': 3}],
+}
+
+
+class TestDeepFindFilters(unittest.TestCase):
+    def test_comparisons(self):
+        """
+        Test that a filter keeps the elements whose field compares true with the literal.
+
+        Expected: deep_find(DATA, 'users.[age>30].name') -> ['brock', 'oak']
+        """
+        self.assertEqual(deep_find(DATA, 'users.[age>30].name'), ['brock', 'oak'])
+        self.assertEqual(deep_find(DATA, 'users.[age<=35].name'), ['ash', 'brock'])
+        self.assertEqual(deep_find(DATA, 'items.[status=="ok"].id'), [1, 3])
+        self.assertEqual(deep_find(DATA, "items.[status != 'ok'].id"), [2])
+        self.assertEqual(deep_find(DATA, 'users.[age==null].name'), ['misty'])
+
+    def test_missing_fields_are_rejected_by_ordering(self):
+        """
+        Test that elements without the field fail ordering comparisons instead of raising.
+
+        Expected: deep_find(DATA, 'users.[age<100].name') -> ['ash', 'brock', 'oak']
+        """
+        self.assertEqual(deep_find(DATA, 'users.[age<100].name'), ['ash', 'brock', 'oak'])
+
+    def test_field_presence(self):
+        """
+        Test that a bare field keeps the elements where it is found.
+
+        Expected: deep_find(DATA, 'users.[address].name') -> ['ash', 'oak']
+        """
+        self.assertEqual(deep_find(DATA, 'users.[address].name'), ['ash', 'oak'])
+
+    def test_nested_field(self):
+        """
+        Test that the field of a filter is a path, split with the path token.
+
+        Expected: deep_find(DATA, 'users.[address.city=="pallet"].name') -> ['ash', 'oak']
+        """
+        self.assertEqual(deep_find(DATA, 'users.[address.city=="pallet"].name'), ['ash', 'oak'])
+        self.assertEqual(deep_find(DATA, 'users/[address/city=="pallet"]/name', path_token='/'), ['ash', 'oak'])
+
+    def test_first_stops_at_first_match(self):
+        """
+        Test that '?' with a filter returns the first result of a matching element and visits no further.
+
+        Expected: deep_find(users, '?[age>30].name') -> 'brock', the last user is never tested
+        """
+        tested = []
+
+        class Tracked(dict):
+            def get(self, key, default=None):
+                tested.append(self['name'])
+                return super().get(key, default)
+
+        users = [Tracked(user) for user in DATA['users']]
+        self.assertEqual(deep_find(users, '?[age>30].name'), 'brock')
+        self.assertNotIn('oak', tested)
+
+    def test_rejected_elements_do_not_descend(self):
+        """
+        Test that the rest of the path is never evaluated on rejected elements.
+
+        Expected: only the properties of matching users are read
+        """
+        read = []
+
+        class Lazy:
+            def __init__(self, age):
+                self.age = age
+
+            @property
+            def name(self):
+                read.append(self.age)
+                return f'user{self.age}'
+
+        self.assertEqual(deep_find([Lazy(10), Lazy(40)], '[age>30].name'), ['user40'])
+        self.assertEqual(read, [40])
+
+    def test_non_null_and_descendants(self):
+        """
+        Test that filters combine with '*?' and '**'.
+
+        Expected: deep_find(DATA, '**[age>30].name') -> ['brock', 'oak']
+        """
+        self.assertEqual(deep_find(DATA, 'users.*?[age>30].address.city'), ['pallet'])
+        self.assertEqual(deep_find(DATA, 'users.[age>30].address.city'), [None, 'pallet'])
+        self.assertEqual(deep_find(DATA, '**[age>30].name'), ['brock', 'oak'])
+
+    def test_objects(self):
+        """
+        Test that filter fields are read from objects like any other path.
+
+        Expected: deep_find(users, '[age>=18].name') -> ['brock']
+        """
+        users = [User('ash', 10), User('brock', 35), User('misty')]
+        self.assertEqual(deep_find(users, '[age>=18].name'), ['brock'])
+
+    def test_all_entry_points_agree(self):
+        """
+        Test that codegen, deep_find_many, deep_iter and DeepIndex apply filters like deep_find.
+
+        Expected: every entry point returns the names of the users older than 30
+        """
+        path = 'users.[age>30].name'
+        self.assertEqual(compile_path(path, codegen=True)(DATA), ['brock', 'oak'])
+        self.assertEqual(deep_find_many(DATA, [path, 'users.?[age>30].name']), (['brock', 'oak'], 'brock'))
+        self.assertEqual(DeepIndex(DATA).deep_find(path), ['brock', 'oak'])
+        self.assertEqual(list(deep_iter(DATA, path)), ['brock', 'oak'])
+
+    def test_iter_indices_refer_to_source(self):
+        """
+        Test that deep_iter reports the index of matching elements in the filtered container.
+
+        Expected: deep_iter(DATA, 'users.[age>30].name', indexed=True) -> ((1,), 'brock'), ((3,), 'oak')
+        """
+        self.assertEqual(
+            list(deep_iter(DATA, 'users.[age>30].name', indexed=True)),
+            [((1,), 'brock'), ((3,), 'oak')],
+        )
+
+    def test_dictionary_key(self):
+        """
+        Test that a filter is a plain key on dictionaries, like the other operators.
+
+        Expected: deep_find({'[a]': 1}, '[a]') -> 1
+        """
+        self.assertEqual(deep_find({'[a]': 1}, '[a]'), 1)
+
+    def test_brackets_inside_keys(self):
+        """
+        Test that a '[' inside a key, or a filter that is never closed, does not swallow the rest of the path.
+
+        Expected: deep_find({'a[': {'b': 1}}, 'a[.b') -> 1
+        """
+        self.assertEqual(deep_find({'a[': {'b': 1}}, 'a[.b'), 1)
+        self.assertEqual(deep_find({'x[y]': {'z': 2}}, 'x[y].z'), 2)
+        self.assertEqual(deep_find({'[a': {'b': 3}}, '[a.b'), 3)
+        self.assertEqual(deep_find(DATA, 'users.[address.city=="pallet"].name'), ['ash', 'oak'])
+
+    def test_invalid_filter(self):
+        """
+        Test that a segment in brackets that does not parse as a filter is a plain key, as in the first release.
+
+        Expected: deep_find({'[a>b]': 1}, '[a>b]') -> 1, and deep_find(DATA, 'users.[age>].name') -> None
+        """
+        self.assertEqual(deep_find({'[a>b]': 1}, '[a>b]'), 1)
+        self.assertEqual(deep_find({'[x==]': 1}, '[x==]'), 1)
+        self.assertEqual(compile_path('items.[status==ok].id').segments[1].kind, SegmentKind.KEY)
+        self.assertIsNone(deep_find(DATA, 'users.[age>].name'))
+
+    def test_streams_reject_filters(self):
+        """
+        Test that filters are rejected on streams.
+
+        Expected: ValueError
+        """
+        with self.assertRaises(ValueError):
+            deep_find_stream(io.StringIO('[]'), '[a>1]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,113 @@
+import unittest
+
+from deepfinder import DeepFindStats, deep_find, deep_iter
+
+REGIONS = {
+    'regions': [
+        {'towns': [{'gyms': ['boulder', 'cascade']}, {'gyms': ['thunder']}]},
+        {'towns': [{'gyms': []}, {'gyms': ['zephyr', None]}]},
+    ],
+}
+
+
+class TestDeepFindFlatten(unittest.TestCase):
+    def test_flatten(self):
+        """
+        Test that flatten=True returns the values of nested wildcards in one flat list.
+
+        Expected: deep_find(REGIONS, 'regions.*.towns.*.gyms.*', flatten=True)
+            -> ['boulder', 'cascade', 'thunder', 'zephyr', None]
+        """
+        self.assertEqual(
+            deep_find(REGIONS, 'regions.*.towns.*.gyms.*', flatten=True),
+            ['boulder', 'cascade', 'thunder', 'zephyr', None],
+        )
+        self.assertEqual(
+            deep_find(REGIONS, 'regions.*.towns.*.gyms.*?', flatten=True),
+            ['boulder', 'cascade', 'thunder', 'zephyr'],
+        )
+
+    def test_flatten_levels(self):
+        """
+        Test that an integer flattens that many levels of nesting, starting from the outermost.
+
+        Expected: deep_find(REGIONS, 'regions.*.towns.*.gyms.*', flatten=1)
+            -> [['boulder', 'cascade'], ['thunder'], [], ['zephyr', None]]
+        """
+        path = 'regions.*.towns.*.gyms.*'
+        self.assertEqual(
+            deep_find(REGIONS, path, flatten=1),
+            [['boulder', 'cascade'], ['thunder'], [], ['zephyr', None]],
+        )
+        self.assertEqual(deep_find(REGIONS, path, flatten=2), deep_find(REGIONS, path, flatten=True))
+        self.assertEqual(deep_find(REGIONS, path, flatten=0), deep_find(REGIONS, path))
+
+    def test_data_lists_are_kept(self):
+        """
+        Test that lists found in the data are values, not flattened.
+
+        Expected: deep_find(REGIONS, 'regions.*.towns.*.gyms', flatten=True)
+            -> [['boulder', 'cascade'], ['thunder'], [], ['zephyr', None]]
+        """
+        self.assertEqual(
+            deep_find(REGIONS, 'regions.*.towns.*.gyms', flatten=True),
+            [['boulder', 'cascade'], ['thunder'], [], ['zephyr', None]],
+        )
+
+    def test_first_between_wildcards(self):
+        """
+        Test that the list below a '?' is flattened into the wildcard above it.
+
+        Expected: deep_find(REGIONS, 'regions.*.towns.?.gyms.*', flatten=True) -> ['boulder', 'cascade']
+        """
+        self.assertEqual(deep_find(REGIONS, 'regions.*.towns.?.gyms.*', flatten=True), ['boulder', 'cascade'])
+
+    def test_stats(self):
+        """
+        Test that flattening works while stats are collected.
+
+        Expected: the same result as without stats
+        """
+        path = 'regions.*.towns.*.gyms.*'
+        self.assertEqual(
+            deep_find(REGIONS, path, flatten=True, stats=DeepFindStats()),
+            deep_find(REGIONS, path, flatten=True),
+        )
+
+    def test_deep_iter_levels(self):
+        """
+        Test that deep_iter streams the elements of deep_find's flattened result.
+
+        Expected: deep_iter(REGIONS, 'regions.*.towns.*.gyms.*', flatten=1) yields the gym lists
+        """
+        path = 'regions.*.towns.*.gyms.*'
+        for flatten in (0, 1, True):
+            self.assertEqual(list(deep_iter(REGIONS, path, flatten=flatten)), deep_find(REGIONS, path, flatten=flatten))
+        self.assertEqual(
+            list(deep_iter(REGIONS, path, indexed=True, flatten=1))[:2],
+            [((0, 0), ['boulder', 'cascade']), ((0, 1), ['thunder'])],
+        )
+
+    def test_deep_iter_levels_with_descendants(self):
+        """
+        Test that a '**' below the streamed levels gives the list deep_find builds for it.
+
+        Expected: deep_iter({'a': [{'x': 1}, {'x': 2}]}, 'a.*.**', flatten=0) -> [[{'x': 1}, 1], [{'x': 2}, 2]]
+        """
+        data = {'a': [{'x': 1}, {'x': 2}]}
+        for flatten in (0, 1, 2):
+            self.assertEqual(list(deep_iter(data, 'a.*.**', flatten=flatten)), deep_find(data, 'a.*.**', flatten=flatten))
+        self.assertEqual(list(deep_iter(data, 'a.*.**', flatten=0)), [[{'x': 1}, 1], [{'x': 2}, 2]])
+
+    def test_negative_levels_are_rejected(self):
+        """
+        Test that a negative flatten is rejected.
+
+        Expected: ValueError
+        """
+        with self.assertRaises(ValueError):
+            deep_find(REGIONS, 'regions.*', flatten=-1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+import unittest
+from collections.abc import Sequence
+from itertools import count
+
+from deepfinder import deep_find
+
+
+class NonIterableSequence(Sequence):
+    def __init__(self, values):
+        self.values = values
+
+    def __getitem__(self, index):
+        return self.values[index]
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        raise AssertionError('sequence should be indexed in place')
+
+
+class TestFindInIterables(unittest.TestCase):
+    def test_sequence_is_indexed_in_place(self):
+        """
+        Test that deep_find indexes sequences in place instead of copying them.
+
+        This test uses a sequence that fails when iterated, so the lookup only
+        succeeds if the element is read through __getitem__.
+
+        Expected: deep_find(NonIterableSequence(['a', 'b']), '1') -> 'b'
+        """
+        data = NonIterableSequence(['a', 'b'])
+        result = deep_find(data, '1')
+        self.assertEqual(result, 'b')
+
+    def test_first_non_null_stops_consuming_generator(self):
+        """
+        Test that the '?' operator stops consuming a generator once it finds a value.
+
+        Expected: deep_find(({'v': i} for i in [None, 1, 2, 3]), '?.v') -> 1, with 2 and 3 left unread
+        """
+        data = ({'v': value} for value in [None, 1, 2, 3])
+        result = deep_find(data, '?.v')
+        self.assertEqual(result, 1)
+        self.assertEqual(next(data), {'v': 2})
+
+    def test_first_non_null_on_infinite_iterator(self):
+        """
+        Test that the '?' operator works on an infinite iterator.
+
+        Expected: deep_find(count(), '?') -> 0
+        """
+        result = deep_find(count(), '?')
+        self.assertEqual(result, 0)
+
+    def test_index_of_infinite_iterator(self):
+        """
+        Test that an integer index advances a lazy iterator only up to the index.
+
+        Expected: deep_find(count(), '5') -> 5
+        """
+        result = deep_find(count(), '5')
+        self.assertEqual(result, 5)
+
+    def test_index_out_of_range_of_generator(self):
+        """
+        Test that an out of range index on a generator returns None.
+
+        Expected: deep_find((i for i in range(3)), '3') -> None
+        """
+        result = deep_find((value for value in range(3)), '3')
+        self.assertEqual(result, None)
+
+    def test_all_values_of_generator(self):
+        """
+        Test that the '*' operator collects every element of a generator.
+
+        Expected: deep_find({'values': ({'v': i} for i in range(3))}, 'values.*.v') -> [0, 1, 2]
+        """
+        data: dict = {'values': ({'v': value} for value in range(3))}
+        result = deep_find(data, 'values.*.v')
+        self.assertEqual(result, [0, 1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+from collections import ChainMap, OrderedDict
+from types import MappingProxyType
+
+from deepfinder import deep_find
+
+
+class TestFindInMappings(unittest.TestCase):
+    def test_chain_map(self):
+        """
+        Test that deep_find looks up keys in a ChainMap instead of listing its keys.
+
+        Expected: deep_find(ChainMap({'a': 1}, {'b': 2}), 'b') -> 2
+        """
+        data = ChainMap({'a': 1}, {'b': 2})
+        result = deep_find(data, 'b')
+        self.assertEqual(result, 2)
+
+    def test_mapping_proxy(self):
+        """
+        Test that deep_find looks up keys in a MappingProxyType.
+
+        Expected: deep_find({'config': MappingProxyType({'debug': True})}, 'config.debug') -> True
+        """
+        data: dict = {'config': MappingProxyType({'debug': True})}
+        result = deep_find(data, 'config.debug')
+        self.assertEqual(result, True)
+
+    def test_wildcard_is_a_key_in_mappings(self):
+        """
+        Test that wildcard operators are looked up as keys in mappings, as in dictionaries.
+
+        Expected: deep_find(OrderedDict({'*': 1}), '*') -> 1
+        """
+        data = OrderedDict({'*': 1})
+        result = deep_find(data, '*')
+        self.assertEqual(result, 1)
+
+    def test_index_is_a_key_in_mappings(self):
+        """
+        Test that integer segments are looked up as string keys in mappings.
+
+        Expected: deep_find(MappingProxyType({'0': 'zero'}), '0') -> 'zero'
+        """
+        data = MappingProxyType({'0': 'zero'})
+        result = deep_find(data, '0')
+        self.assertEqual(result, 'zero')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+import sys
+import unittest
+
+from deepfinder import deep_find
+
+
+class TestFindIterative(unittest.TestCase):
+    def test_dict_deeper_than_recursion_limit(self):
+        """
+        Test that deep_find can traverse a dictionary nested deeper than the recursion limit.
+
+        The traversal engine walks the path with a cursor instead of recursing,
+        so the depth of the data is not limited by sys.getrecursionlimit().
+
+        Expected: deep_find({'a': {'a': ... 39}}, 'a.a. ... .a') -> 39
+        """
+        depth = sys.getrecursionlimit() * 2
+        data: dict = 39
+        for _ in range(depth):
+            data = {'a': data}
+        result = deep_find(data, '.'.join(['a'] * depth))
+        self.assertEqual(result, 39)
+
+    def test_chained_wildcards_deeper_than_recursion_limit(self):
+        """
+        Test that deep_find can expand wildcards nested deeper than the recursion limit.
+
+        Every wildcard pushes a frame on an explicit stack, so chains of wildcards
+        do not hit the recursion limit either.
+
+        Expected: deep_find([[ ... [39] ... ]], '*.*. ... .*') -> [[ ... [39] ... ]]
+        """
+        depth = sys.getrecursionlimit() * 2
+        data: list = [39]
+        for _ in range(depth - 1):
+            data = [data]
+        result = deep_find(data, '.'.join(['*'] * depth))
+        for _ in range(depth - 1):
+            self.assertEqual(len(result), 1)
+            result = result[0]
+        self.assertEqual(result, [39])
+
+    def test_wildcard_results_keep_order(self):
+        """
+        Test that wildcard results keep the order of the traversed list.
+
+        Expected: deep_find({'v': [{'w': [1, 2]}, {'w': []}, {'x': 3}]}, 'v.*.w.*') -> [[1, 2], [], None]
+        """
+        data: dict = {'v': [{'w': [1, 2]}, {'w': []}, {'x': 3}]}
+        result = deep_find(data, 'v.*.w.*')
+        self.assertEqual(result, [[1, 2], [], None])
+
+    def test_first_non_null_inside_all(self):
+        """
+        Test that the '?' operator nested inside '*' resolves independently for every element.
+
+        Expected: deep_find([[None, 1], [None], [2, 3]], '*.?') -> [1, None, 2]
+        """
+        data: list = [[None, 1], [None], [2, 3]]
+        result = deep_find(data, '*.?')
+        self.assertEqual(result, [1, None, 2])
+
+
+    def test_key_only_rest_of_path_on_any_type(self):
+        """
+        Test that the rest of the path after a wildcard gives the same values on every container type.
+
+        Keys and indexes after the last wildcard are looked up in a single loop, with
+        dictionaries, lists and tuples handled inline and other types through their accessor.
+
+        Expected: deep_find(items, '*.v.-1') -> [3, 3, 3, None, 3, None]
+        """
+        class Holder:
+            def __init__(self, v):
+                self.v = v
+
+        class Values(dict):
+            pass
+
+        items = [
+            {'v': [1, 2, 3]},
+            {'v': (1, 2, 3)},
+            Values(v=[3]),
+            {'v': 'abc'},
+            Holder(range(4)),
+            {'v': {'-1': None}},
+        ]
+        self.assertEqual(deep_find(items, '*.v.-1'), [3, 3, 3, None, 3, None])
+        self.assertEqual(deep_find(items, '*?.v.-1'), [3, 3, 3, 3])
+        self.assertEqual(deep_find(items, '?.v.0'), 1)
+        self.assertEqual(deep_find(items, '*.v.x'), [None] * 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
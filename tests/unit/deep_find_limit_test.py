@@ -0,0 +1,111 @@
+import itertools
+import unittest
+
+from deepfinder import DeepFindStats, deep_find
+from deepfinder.entity import DeepFinderDict, DeepFinderList
+
+DATA = {
+    'users': [
+        {'name': 'ash', 'emails': ['ash@kanto', None, 'ash@johto']},
+        {'name': 'misty', 'emails': []},
+        {'name': 'brock', 'emails': ['brock@kanto']},
+        {'name': 'oak', 'emails': [None, 'oak@lab']},
+    ],
+}
+
+
+class TestDeepFindLimit(unittest.TestCase):
+    def test_limit(self):
+        """
+        Test that limit keeps the first values only.
+
+        Expected: deep_find(DATA, 'users.*.name', limit=2) -> ['ash', 'misty']
+        """
+        self.assertEqual(deep_find(DATA, 'users.*.name', limit=2), ['ash', 'misty'])
+        self.assertEqual(deep_find(DATA, 'users.*.name', limit=10), ['ash', 'misty', 'brock', 'oak'])
+        self.assertEqual(deep_find(DATA, 'users.*.name', limit=0), [])
+
+    def test_offset(self):
+        """
+        Test that offset skips the first values, with or without a limit.
+
+        Expected: deep_find(DATA, 'users.*.name', offset=1, limit=2) -> ['misty', 'brock']
+        """
+        self.assertEqual(deep_find(DATA, 'users.*.name', offset=1, limit=2), ['misty', 'brock'])
+        self.assertEqual(deep_find(DATA, 'users.*.name', offset=3), ['oak'])
+        self.assertEqual(deep_find(DATA, 'users.*.name', offset=5), [])
+
+    def test_nested_wildcards_need_flatten(self):
+        """
+        Test that values found through nested wildcards are paged through the flat list, which needs flatten.
+
+        Expected: deep_find(DATA, 'users.*.emails.*?', limit=3, flatten=True) -> ['ash@kanto', 'ash@johto', 'brock@kanto']
+        """
+        self.assertEqual(
+            deep_find(DATA, 'users.*.emails.*?', limit=3, flatten=True),
+            ['ash@kanto', 'ash@johto', 'brock@kanto'],
+        )
+        self.assertEqual(deep_find(DATA, 'users.*.emails.*', offset=1, limit=2, flatten=1), [None, 'ash@johto'])
+        with self.assertRaises(ValueError):
+            deep_find(DATA, 'users.*.emails.*?', limit=3)
+
+    def test_path_without_wildcards(self):
+        """
+        Test that a path without wildcards returns its value as deep_find does, or the default value.
+
+        Expected: deep_find(DATA, 'users.0.name', limit=5) -> 'ash'
+        """
+        self.assertEqual(deep_find(DATA, 'users.0.name', limit=5), 'ash')
+        self.assertEqual(deep_find(DATA, 'users.0.emails', limit=1), ['ash@kanto', None, 'ash@johto'])
+        self.assertEqual(deep_find(DATA, 'users.?.emails.?', offset=2), 'ash@kanto')
+        self.assertEqual(deep_find(DATA, 'users.9.name', limit=5, default='none'), 'none')
+
+    def test_default_value(self):
+        """
+        Test that the default value is returned when the wildcard has nothing to expand, like deep_find.
+
+        Expected: deep_find(DATA, 'groups.*', limit=5, default='none') -> 'none', and [] for an empty list
+        """
+        self.assertEqual(deep_find(DATA, 'groups.*', limit=5, default='none'), 'none')
+        self.assertEqual(deep_find(DATA, 'users.0.name.*', limit=0, default='none'), 'none')
+        self.assertEqual(deep_find(DATA, 'users.1.emails.*', limit=5, default='none'), [])
+        self.assertEqual(deep_find(DATA, 'users.*.name', offset=10, default='none'), [])
+
+    def test_traversal_stops_at_limit(self):
+        """
+        Test that the traversal stops once the limit is reached, even on an endless iterable.
+
+        Expected: deep_find({'n': itertools.count()}, 'n.*?', limit=3, offset=2) -> [2, 3, 4]
+        """
+        self.assertEqual(deep_find({'n': itertools.count()}, 'n.*?', limit=3, offset=2), [2, 3, 4])
+
+        stats = DeepFindStats()
+        deep_find(DATA, 'users.*.emails.*?', limit=1, flatten=True, stats=stats)
+        self.assertEqual(stats.expanded, [0, 1, 0, 1])
+
+    def test_negative_values_are_rejected(self):
+        """
+        Test that a negative limit or offset is rejected.
+
+        Expected: ValueError
+        """
+        with self.assertRaises(ValueError):
+            deep_find(DATA, 'users.*.name', limit=-1)
+        with self.assertRaises(ValueError):
+            deep_find(DATA, 'users.*.name', offset=-1)
+
+    def test_entity_methods(self):
+        """
+        Test that DeepFinderDict and DeepFinderList accept limit and offset, cached separately.
+
+        Expected: DeepFinderList(DATA['users']).deep_find('*.name', limit=1) -> ['ash']
+        """
+        users = DeepFinderList(DATA['users'])
+        self.assertEqual(users.deep_find('*.name', limit=1), ['ash'])
+        self.assertEqual(users.deep_find('*.name', limit=1, offset=1), ['misty'])
+        self.assertEqual(users.deep_find('*.name'), ['ash', 'misty', 'brock', 'oak'])
+        self.assertEqual(DeepFinderDict(DATA).deep_find('users.*.name', offset=3), ['oak'])
+
+
+if __name__ == '__main__':
+    unittest.main()
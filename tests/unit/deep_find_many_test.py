@@ -0,0 +1,82 @@
+import unittest
+
+from deepfinder import deep_find_many
+
+
+class TestDeepFindMany(unittest.TestCase):
+    def test_sequence_of_paths(self):
+        """
+        Test that deep_find_many returns a tuple with the result of every path in order.
+
+        Expected: deep_find_many({'a': {'b': 1, 'c': 2}}, ['a.c', 'a.b']) -> (2, 1)
+        """
+        data: dict = {'a': {'b': 1, 'c': 2}}
+        result = deep_find_many(data, ['a.c', 'a.b'])
+        self.assertEqual(result, (2, 1))
+
+    def test_mapping_of_paths(self):
+        """
+        Test that deep_find_many returns a dictionary when the paths are given by name.
+
+        Expected: deep_find_many({'a': {'b': 1}}, {'x': 'a.b', 'y': 'a'}) -> {'x': 1, 'y': {'b': 1}}
+        """
+        data: dict = {'a': {'b': 1}}
+        result = deep_find_many(data, {'x': 'a.b', 'y': 'a'})
+        self.assertEqual(result, {'x': 1, 'y': {'b': 1}})
+
+    def test_shared_wildcard_is_expanded_once(self):
+        """
+        Test that paths sharing a wildcard expand it only once.
+
+        The shared list is a generator, which can only be consumed once, so both
+        paths can only get their values if the fan-out is shared.
+
+        Expected: deep_find_many({'v': generator}, ['v.*.a', 'v.*?.b', 'v.*.a']) -> ([1, 3], [2], [1, 3])
+        """
+        data: dict = {'v': (item for item in [{'a': 1, 'b': 2}, {'a': 3}])}
+        result = deep_find_many(data, ['v.*.a', 'v.*?.b', 'v.*.a'])
+        self.assertEqual(result, ([1, 3], [2], [1, 3]))
+
+    def test_first_non_null_per_path(self):
+        """
+        Test that the '?' operator finds the first non-null value for every path separately.
+
+        Expected: deep_find_many([{'a': 1}, {'b': 2}], ['?.a', '?.b', '?.c']) -> (1, 2, None)
+        """
+        data: list = [{'a': 1}, {'b': 2}]
+        result = deep_find_many(data, ['?.a', '?.b', '?.c'])
+        self.assertEqual(result, (1, 2, None))
+
+    def test_default_values(self):
+        """
+        Test that default and per-path defaults apply to paths that are not found.
+
+        Expected: deep_find_many({'a': 1}, ['a', 'b', 'c'], default=0, defaults={'c': 3}) -> (1, 0, 3)
+        """
+        data: dict = {'a': 1}
+        result = deep_find_many(data, ['a', 'b', 'c'], default=0, defaults={'c': 3})
+        self.assertEqual(result, (1, 0, 3))
+
+    def test_default_values_by_name(self):
+        """
+        Test that per-path defaults are keyed by result name when the paths are a mapping.
+
+        Expected: deep_find_many({}, {'x': 'a'}, defaults={'x': 'default'}) -> {'x': 'default'}
+        """
+        result = deep_find_many({}, {'x': 'a'}, defaults={'x': 'default'})
+        self.assertEqual(result, {'x': 'default'})
+
+    def test_generator_read_by_several_paths(self):
+        """
+        Test that several paths branching from a generator all see every element, as deep_find does.
+
+        Expected: deep_find_many({'a': iter([1, 2, 3])}, ['a.0', 'a.1']) -> (1, 2)
+        """
+        self.assertEqual(deep_find_many({'a': iter([1, 2, 3])}, ['a.0', 'a.1']), (1, 2))
+        self.assertEqual(deep_find_many({'a': iter([1, 2, 3])}, ['a.*', 'a.0']), ([1, 2, 3], 1))
+        records = ({'id': index} for index in range(3))
+        self.assertEqual(deep_find_many({'r': records}, ['r.-1.id', 'r.*.id', 'r.1:.id']), (2, [0, 1, 2], [1, 2]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from deepfinder import deep_find
+from deepfinder import parallel
+
+
+DOCUMENT = {
+    'items': [
+        {'id': index, 'tags': ['a', 'b'] if index % 3 else [], 'owner': {'name': f'user{index}'} if index % 5 else None}
+        for index in range(200)
+    ],
+}
+
+
+class TestDeepFindParallel(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.object(parallel, 'PARALLEL_THRESHOLD', 10)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_same_results_as_serial(self):
+        """
+        Test that parallel evaluation returns the same results as serial evaluation, in order.
+
+        Expected: deep_find(DOCUMENT, path, workers=4) -> deep_find(DOCUMENT, path)
+        """
+        paths = [
+            'items.*.id', 'items.*.owner.name', 'items.*?.owner.name', 'items.?.owner.name',
+            'items.*.tags.*', 'items.*?.tags.?', 'items.0.id', 'items.*.missing', 'missing.*',
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(deep_find(DOCUMENT, path, workers=4), deep_find(DOCUMENT, path))
+
+    def test_executor(self):
+        """
+        Test that chunks are submitted to the given executor.
+
+        Expected: deep_find(DOCUMENT, 'items.*.id', executor=executor) -> [0, 1, ..., 199]
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with mock.patch.object(executor, 'submit', wraps=executor.submit) as submit:
+                result = deep_find(DOCUMENT, 'items.*.id', executor=executor, workers=2)
+        self.assertEqual(result, list(range(200)))
+        self.assertEqual(submit.call_count, 2 * parallel.CHUNKS_PER_WORKER)
+
+    def test_small_expansions_are_serial(self):
+        """
+        Test that expansions below the threshold are not split across threads.
+
+        Expected: deep_find({'items': [1, 2]}, 'items.*', executor=executor) -> [1, 2], nothing submitted
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            with mock.patch.object(executor, 'submit') as submit:
+                result = deep_find({'items': [1, 2]}, 'items.*', executor=executor)
+        self.assertEqual(result, [1, 2])
+        submit.assert_not_called()
+
+    def test_default_value(self):
+        """
+        Test that the default value is returned when nothing is found in parallel.
+
+        Expected: deep_find(DOCUMENT, 'items.?.missing', default='default', workers=2) -> 'default'
+        """
+        self.assertEqual(deep_find(DOCUMENT, 'items.?.missing', default='default', workers=2), 'default')
@@ -0,0 +1,132 @@
+import io
+import unittest
+
+from deepfinder import DeepIndex, compile_path, deep_find, deep_find_many, deep_find_stream, deep_iter
+
+
+class Counted:
+    """An iterable that records how many elements were read from it."""
+
+    def __init__(self, size):
+        self.size = size
+        self.read = 0
+
+    def __iter__(self):
+        for index in range(self.size):
+            self.read += 1
+            yield {'id': index}
+
+
+EVENTS = {'events': [{'id': index} for index in range(10)]}
+
+
+class TestDeepFindSlices(unittest.TestCase):
+    def test_negative_index(self):
+        """
+        Test that negative indexes count from the end and are not found when out of range.
+
+        Expected: deep_find(EVENTS, 'events.-1.id') -> 9, 'events.-11.id' -> None
+        """
+        self.assertEqual(deep_find(EVENTS, 'events.-1.id'), 9)
+        self.assertEqual(deep_find(EVENTS, 'events.-10.id'), 0)
+        self.assertIsNone(deep_find(EVENTS, 'events.-11.id'))
+        self.assertEqual(deep_find((1, 2), '-3', default='default'), 'default')
+
+    def test_negative_index_on_iterables(self):
+        """
+        Test that negative indexes on iterators are bounded like on lists.
+
+        Expected: deep_find(iter([1, 2, 3]), '-3') -> 1, '-4' -> None
+        """
+        self.assertEqual(deep_find(iter([1, 2, 3]), '-3'), 1)
+        self.assertIsNone(deep_find(iter([1, 2, 3]), '-4'))
+
+    def test_slices(self):
+        """
+        Test that slice segments expand to the selected elements, as Python slicing does.
+
+        Expected: deep_find(EVENTS, 'events.2:5.id') -> [2, 3, 4]
+        """
+        self.assertEqual(deep_find(EVENTS, 'events.2:5.id'), [2, 3, 4])
+        self.assertEqual(deep_find(EVENTS, 'events.::4.id'), [0, 4, 8])
+        self.assertEqual(deep_find(EVENTS, 'events.-3:.id'), [7, 8, 9])
+        self.assertEqual(deep_find(EVENTS, 'events.-3:-1.id'), [7, 8])
+        self.assertEqual(deep_find(EVENTS, 'events.::-3.id'), [9, 6, 3, 0])
+        self.assertEqual(deep_find(EVENTS, 'events.20:.id'), [])
+
+    def test_slices_on_iterables(self):
+        """
+        Test that slices from the start stop reading an iterable once their elements are found.
+
+        Expected: deep_find(Counted(1000), '2:5.id') -> [2, 3, 4], reading 5 elements
+        """
+        events = Counted(1000)
+        self.assertEqual(deep_find(events, '2:5.id'), [2, 3, 4])
+        self.assertEqual(events.read, 5)
+        self.assertEqual(deep_find(Counted(1000), '-2:.id'), [998, 999])
+        self.assertEqual(deep_find(Counted(5), '::-2.id'), [4, 2, 0])
+
+    def test_rest_of_path_only_for_selected(self):
+        """
+        Test that the rest of the path is only evaluated for the selected elements.
+
+        Expected: a property read on the elements is read twice for '::50' over 100 elements
+        """
+        read = []
+
+        class Event:
+            def __init__(self, index):
+                self.index = index
+
+            @property
+            def id(self):
+                read.append(self.index)
+                return self.index
+
+        self.assertEqual(deep_find([Event(index) for index in range(100)], '::50.id'), [0, 50])
+        self.assertEqual(read, [0, 50])
+
+    def test_dictionary_key(self):
+        """
+        Test that a slice is a plain key on dictionaries.
+
+        Expected: deep_find({'10:30': 'open'}, '10:30') -> 'open'
+        """
+        self.assertEqual(deep_find({'10:30': 'open'}, '10:30'), 'open')
+
+    def test_slice_with_filter(self):
+        """
+        Test that a filter applies to the elements of a slice.
+
+        Expected: deep_find(EVENTS, 'events.-5:[id<7].id') -> [5, 6]
+        """
+        self.assertEqual(deep_find(EVENTS, 'events.-5:[id<7].id'), [5, 6])
+
+    def test_all_entry_points_agree(self):
+        """
+        Test that codegen, deep_find_many, deep_iter, DeepIndex and streams apply slices like deep_find.
+
+        Expected: every entry point returns [1, 3]
+        """
+        path = 'events.1:5:2.id'
+        self.assertEqual(compile_path(path, codegen=True)(EVENTS), [1, 3])
+        self.assertEqual(deep_find_many(EVENTS, [path, 'events.-1.id', 'events.*.id']), ([1, 3], 9, list(range(10))))
+        self.assertEqual(DeepIndex(EVENTS).deep_find(path), [1, 3])
+        self.assertEqual(deep_find_stream(io.StringIO('{"events": [{"id": 0}, {"id": 1}, {"id": 2}, {"id": 3}]}'), path), [1, 3])
+        self.assertEqual(list(deep_iter(EVENTS, path, indexed=True)), [((1,), 1), ((3,), 3)])
+        self.assertEqual(list(deep_iter(Counted(10), '-2:.id', indexed=True)), [((8,), 8), ((9,), 9)])
+
+    def test_invalid_slices(self):
+        """
+        Test that a step of zero is rejected, as are slices from the end on streams.
+
+        Expected: ValueError
+        """
+        with self.assertRaises(ValueError):
+            compile_path('events.::0')
+        with self.assertRaises(ValueError):
+            deep_find_stream(io.StringIO('[]'), '-2:')
+
+
+if __name__ == '__main__':
+    unittest.main()
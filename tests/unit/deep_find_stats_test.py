@@ -0,0 +1,105 @@
+import unittest
+
+from deepfinder import DeepFindStats, compile_path, deep_find
+
+
+class TestDeepFindStats(unittest.TestCase):
+    def test_result_is_unchanged(self):
+        """
+        Test that collecting stats does not change the result of deep_find.
+
+        Expected: deep_find(data, 'v.*?.w', stats=DeepFindStats()) -> deep_find(data, 'v.*?.w')
+        """
+        data: dict = {'v': [{'w': 1}, {}, {'w': 2}]}
+        result = deep_find(data, 'v.*?.w', stats=DeepFindStats())
+        self.assertEqual(result, deep_find(data, 'v.*?.w'))
+
+    def test_expanded_elements_and_misses(self):
+        """
+        Test that stats count the elements expanded by wildcards and the misses per segment.
+
+        Expected: deep_find({'users': [{'name': 'ash'}, {}]}, 'users.*.name') -> expanded [0, 2, 0], misses [0, 0, 1]
+        """
+        stats = DeepFindStats()
+        deep_find({'users': [{'name': 'ash'}, {}]}, 'users.*.name', stats=stats)
+        self.assertEqual(stats.expanded, [0, 2, 0])
+        self.assertEqual(stats.misses, [0, 0, 1])
+        self.assertEqual(stats.nodes_visited, 4)
+        self.assertEqual(len(stats.elapsed_ns), 3)
+
+    def test_first_non_null_stops_expanding(self):
+        """
+        Test that stats show that the '?' operator stops at the first non-null value.
+
+        Expected: deep_find([{}, {'v': 1}, {'v': 2}], '?.v') -> expanded [2, 0]
+        """
+        stats = DeepFindStats()
+        deep_find([{}, {'v': 1}, {'v': 2}], '?.v', stats=stats)
+        self.assertEqual(stats.expanded, [2, 0])
+
+    def test_stopped_at(self):
+        """
+        Test that stats report the first segment where the path stopped matching.
+
+        Expected: deep_find({'a': {'b': 1}}, 'a.c.d') -> stopped_at 1
+        """
+        stats = DeepFindStats()
+        deep_find({'a': {'b': 1}}, 'a.c.d', stats=stats)
+        self.assertEqual(stats.stopped_at, 1)
+
+    def test_containers_converted(self):
+        """
+        Test that stats count iterables copied into a list for a backward slice.
+
+        Expected: deep_find({'v': iter([1, 2])}, 'v.::-1') -> containers_converted 1
+        """
+        stats = DeepFindStats()
+        result = deep_find({'v': iter([1, 2])}, 'v.::-1', stats=stats)
+        self.assertEqual(result, [2, 1])
+        self.assertEqual(stats.containers_converted, 1)
+
+    def test_negative_index_is_not_converted(self):
+        """
+        Test that a negative index on an iterable only keeps its last elements.
+
+        Expected: deep_find({'v': iter([1, 2])}, 'v.-1') -> containers_converted 0
+        """
+        stats = DeepFindStats()
+        result = deep_find({'v': iter([1, 2])}, 'v.-1', stats=stats)
+        self.assertEqual(result, 2)
+        self.assertEqual(stats.containers_converted, 0)
+
+    def test_sliced_elements_are_expanded(self):
+        """
+        Test that a slice only expands the elements it selects.
+
+        Expected: deep_find({'v': list(range(100))}, 'v.::10') -> expanded [0, 10]
+        """
+        stats = DeepFindStats()
+        deep_find({'v': list(range(100))}, 'v.::10', stats=stats)
+        self.assertEqual(stats.expanded, [0, 10])
+
+    def test_stats_are_reset_for_every_call(self):
+        """
+        Test that reusing a stats instance only reports the last call.
+
+        Expected: stats.nodes_visited -> 1 after deep_find({'a': 1}, 'a')
+        """
+        stats = DeepFindStats()
+        deep_find({'a': {'b': {'c': 1}}}, 'a.b.c', stats=stats)
+        deep_find({'a': 1}, 'a', stats=stats)
+        self.assertEqual(stats.nodes_visited, 1)
+
+    def test_codegen_path(self):
+        """
+        Test that stats are collected for paths compiled with codegen too.
+
+        Expected: deep_find([1, 2], compile_path('*', codegen=True), stats=stats) -> expanded [2]
+        """
+        stats = DeepFindStats()
+        deep_find([1, 2], compile_path('*', codegen=True), stats=stats)
+        self.assertEqual(stats.expanded, [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
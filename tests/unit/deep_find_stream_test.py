@@ -0,0 +1,131 @@
+import io
+import json
+import unittest
+
+from deepfinder import deep_find, deep_find_stream, deep_iter_stream
+
+
+DOCUMENT = {
+    'users': [
+        {'name': 'ash', 'pokemons': [{'name': 'pikachu'}, {'name': 'charmander', 'ball': 'superball'}]},
+        {'name': 'misty', 'pokemons': []},
+        {'name': 'brock', 'pokemons': [{'name': 'onix', 'ball': 'pokeball'}]},
+    ],
+    'region': {'name': 'kanto', 'towns': ['pallet', 'viridian', 'pewter']},
+    'escaped': {'quote"key': 'back\\slash "quoted" é'},
+}
+
+
+class TestDeepFindStream(unittest.TestCase):
+    def test_same_results_as_deep_find(self):
+        """
+        Test that deep_find_stream returns the same results as deep_find on the parsed document.
+
+        Expected: deep_find_stream(StringIO(json.dumps(DOCUMENT)), path) -> deep_find(DOCUMENT, path)
+        """
+        text = json.dumps(DOCUMENT)
+        paths = [
+            '', 'users.0.name', 'users.*.name', 'users.*.pokemons.*.name', 'users.*?.pokemons.?.ball',
+            'users.?.pokemons.*.ball', 'users.*.pokemons.*?.ball', 'region.towns.2', 'region.towns.-1',
+            'region.towns.5', 'region.name.0', 'missing.path', 'escaped.quote"key',
+        ]
+        for path in paths:
+            with self.subTest(path=path):
+                self.assertEqual(deep_find_stream(io.StringIO(text), path), deep_find(DOCUMENT, path))
+
+    def test_binary_stream_and_small_chunks(self):
+        """
+        Test that deep_find_stream reads UTF-8 binary streams in chunks of any size.
+
+        Expected: deep_find_stream(BytesIO(...), 'escaped.quote"key', chunk_size=1) -> 'back\\\\slash "quoted" é'
+        """
+        data = json.dumps(DOCUMENT, ensure_ascii=False, indent=2).encode('utf-8')
+        result = deep_find_stream(io.BytesIO(data), 'escaped.quote"key', chunk_size=1)
+        self.assertEqual(result, 'back\\slash "quoted" é')
+
+    def test_default_value(self):
+        """
+        Test that deep_find_stream returns the default value when the path is not found.
+
+        Expected: deep_find_stream(StringIO('{"a": 1}'), 'b', default='default') -> 'default'
+        """
+        result = deep_find_stream(io.StringIO('{"a": 1}'), 'b', default='default')
+        self.assertEqual(result, 'default')
+
+    def test_first_non_null_stops_reading(self):
+        """
+        Test that the '?' operator stops reading the stream once it finds a value.
+
+        The document is cut right after the match, so reading further would fail.
+
+        Expected: deep_find_stream(StringIO('{"v": [{}, {"a": 1}, {"a": '), 'v.?.a') -> 1
+        """
+        result = deep_find_stream(io.StringIO('{"v": [{}, {"a": 1}, {"a": '), 'v.?.a')
+        self.assertEqual(result, 1)
+
+    def test_key_lookup_stops_reading(self):
+        """
+        Test that reading stops once a path without wildcards reaches its value.
+
+        Expected: deep_find_stream(StringIO('{"a": {"b": [1, 2]}, "c": '), 'a.b') -> [1, 2]
+        """
+        result = deep_find_stream(io.StringIO('{"a": {"b": [1, 2]}, "c": '), 'a.b')
+        self.assertEqual(result, [1, 2])
+
+    def test_malformed_document(self):
+        """
+        Test that a malformed document raises a JSONDecodeError.
+
+        Expected: deep_find_stream(StringIO('{"a": [1, 2'), 'a.*') raises JSONDecodeError
+        """
+        with self.assertRaises(json.JSONDecodeError):
+            deep_find_stream(io.StringIO('{"a": [1, 2'), 'a.*')
+
+
+class TestDeepIterStream(unittest.TestCase):
+    def test_values(self):
+        """
+        Test that deep_iter_stream yields the values matched by a wildcard path.
+
+        Expected: list(deep_iter_stream(..., 'users.*.pokemons.*.name')) -> ['pikachu', 'charmander', 'onix']
+        """
+        result = list(deep_iter_stream(io.StringIO(json.dumps(DOCUMENT)), 'users.*.pokemons.*.name'))
+        self.assertEqual(result, ['pikachu', 'charmander', 'onix'])
+
+    def test_indexed_values(self):
+        """
+        Test that deep_iter_stream yields the wildcard indices of every value when indexed is True.
+
+        Expected: list(deep_iter_stream(..., 'users.*?.pokemons.?.ball', indexed=True))
+                  -> [((0, 1), 'superball'), ((2, 0), 'pokeball')]
+        """
+        stream = io.StringIO(json.dumps(DOCUMENT))
+        result = list(deep_iter_stream(stream, 'users.*?.pokemons.?.ball', indexed=True))
+        self.assertEqual(result, [((0, 1), 'superball'), ((2, 0), 'pokeball')])
+
+    def test_values_are_read_lazily(self):
+        """
+        Test that deep_iter_stream only reads the stream as far as the next value.
+
+        The document is cut after the second element, so only the first two values
+        can be read.
+
+        Expected: the first two values of deep_iter_stream(StringIO('{"v": [1, 2, '), 'v.*') -> 1, 2
+        """
+        values = deep_iter_stream(io.StringIO('{"v": [1, 2, '), 'v.*')
+        self.assertEqual([next(values), next(values)], [1, 2])
+
+    def test_descendants_are_rejected(self):
+        """
+        Test that the '**' operator is rejected on streams.
+
+        Expected: deep_find_stream(StringIO('{}'), '**.id') -> ValueError
+        """
+        with self.assertRaises(ValueError):
+            deep_find_stream(io.StringIO('{}'), '**.id')
+        with self.assertRaises(ValueError):
+            list(deep_iter_stream(io.StringIO('{}'), 'a.**'))
+
+
+if __name__ == '__main__':
+    unittest.main()
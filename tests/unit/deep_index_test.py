@@ -0,0 +1,70 @@
+import unittest
+
+from deepfinder import DeepIndex, deep_find
+
+
+class Pokemon:
+    def __init__(self, name):
+        self.name = name
+
+
+DOCUMENT = {
+    'users': [
+        {'name': 'ash', 'pokemons': [Pokemon('pikachu'), Pokemon('charmander')]},
+        {'name': 'misty', 'pokemons': ()},
+        {'name': 'brock', 'pokemons': (Pokemon('onix'),), 'ball': None},
+    ],
+    'region': {'name': 'kanto', 'towns': ('pallet', 'viridian'), 'tags': {'a', 'b'}},
+    '-1': 'negative key',
+}
+
+
+class TestDeepIndex(unittest.TestCase):
+    def test_same_results_as_deep_find(self):
+        """
+        Test that every lookup on the index returns what deep_find returns on the structure.
+
+        Expected: DeepIndex(DOCUMENT).deep_find(path) -> deep_find(DOCUMENT, path)
+        """
+        paths = [
+            '', 'users', 'users.0.name', 'users.*.name', 'users.*?.ball', 'users.?.ball', 'users.2.ball',
+            'users.*.pokemons.*.name', 'users.?.pokemons.?.name', 'users.-1.name', 'users.01.name',
+            'users.9.name', 'users.name', 'region.towns.1', 'region.towns.*', 'region.tags.0', '-1',
+            'missing', 'users.0.name.0',
+        ]
+        for max_depth in (None, 0, 1, 2):
+            index = DeepIndex(DOCUMENT, max_depth=max_depth)
+            for path in paths:
+                with self.subTest(max_depth=max_depth, path=path):
+                    self.assertEqual(index.deep_find(path), deep_find(DOCUMENT, path))
+
+    def test_exact_paths_do_not_walk(self):
+        """
+        Test that canonical exact paths are answered from the path map without walking the structure.
+
+        Expected: index.deep_find('users.1.name') -> 'misty' without calling _resolve
+        """
+        index = DeepIndex(DOCUMENT)
+        index._resolve = None
+        self.assertEqual(index.deep_find('users.1.name'), 'misty')
+
+    def test_default_value(self):
+        """
+        Test that the default value is returned when the path is not found.
+
+        Expected: DeepIndex(DOCUMENT).deep_find('users.0.age', default=10) -> 10
+        """
+        self.assertEqual(DeepIndex(DOCUMENT).deep_find('users.0.age', default=10), 10)
+        self.assertEqual(DeepIndex(DOCUMENT).deep_find('users.2.ball', default='pokeball'), 'pokeball')
+
+    def test_max_depth_and_memory_usage(self):
+        """
+        Test that max_depth limits the number of indexed paths and the memory used.
+
+        Expected: len(DeepIndex(DOCUMENT, max_depth=1)) -> 4 (the root and its three keys)
+        """
+        shallow = DeepIndex(DOCUMENT, max_depth=1)
+        full = DeepIndex(DOCUMENT)
+        self.assertEqual(len(shallow), 4)
+        self.assertLess(len(shallow), len(full))
+        self.assertLess(shallow.memory_usage(), full.memory_usage())
@@ -0,0 +1,104 @@
+import unittest
+
+from deepfinder import deep_find, deep_iter
+
+
+class TestDeepIter(unittest.TestCase):
+    def test_values_of_wildcard(self):
+        """
+        Test that deep_iter yields every value matched by a wildcard.
+
+        Expected: list(deep_iter({'users': [{'name': 'ash'}, {'name': 'misty'}]}, 'users.*.name')) -> ['ash', 'misty']
+        """
+        data: dict = {'users': [{'name': 'ash'}, {'name': 'misty'}]}
+        result = list(deep_iter(data, 'users.*.name'))
+        self.assertEqual(result, ['ash', 'misty'])
+
+    def test_chained_wildcards_are_flattened(self):
+        """
+        Test that deep_iter yields the leaves of chained wildcards without nesting them.
+
+        Expected: list(deep_iter({'a': [{'b': [1, 2]}, {'b': [3]}]}, 'a.*.b.*')) -> [1, 2, 3]
+        """
+        data: dict = {'a': [{'b': [1, 2]}, {'b': [3]}]}
+        result = list(deep_iter(data, 'a.*.b.*'))
+        self.assertEqual(result, [1, 2, 3])
+
+    def test_indexed_values(self):
+        """
+        Test that deep_iter yields the wildcard indices of every value when indexed is True.
+
+        Expected: list(deep_iter({'a': [{'b': [1, 2]}, {'b': [3]}]}, 'a.*.b.*', indexed=True))
+                  -> [((0, 0), 1), ((0, 1), 2), ((1, 0), 3)]
+        """
+        data: dict = {'a': [{'b': [1, 2]}, {'b': [3]}]}
+        result = list(deep_iter(data, 'a.*.b.*', indexed=True))
+        self.assertEqual(result, [((0, 0), 1), ((0, 1), 2), ((1, 0), 3)])
+
+    def test_all_non_null_skips_nones(self):
+        """
+        Test that deep_iter skips None values under the '*?' operator and keeps source indices.
+
+        Expected: list(deep_iter([{'v': 1}, {}, {'v': 2}], '*?.v', indexed=True)) -> [((0,), 1), ((2,), 2)]
+        """
+        data: list = [{'v': 1}, {}, {'v': 2}]
+        result = list(deep_iter(data, '*?.v', indexed=True))
+        self.assertEqual(result, [((0,), 1), ((2,), 2)])
+
+    def test_first_non_null_yields_one_value(self):
+        """
+        Test that the '?' operator yields only the first non-null value.
+
+        Expected: list(deep_iter([{}, {'v': 1}, {'v': 2}], '?.v', indexed=True)) -> [((1,), 1)]
+        """
+        data: list = [{}, {'v': 1}, {'v': 2}]
+        result = list(deep_iter(data, '?.v', indexed=True))
+        self.assertEqual(result, [((1,), 1)])
+
+    def test_first_non_null_streams_nested_wildcard(self):
+        """
+        Test that a '?' resolved by a nested wildcard streams only that element's values.
+
+        deep_find returns the first non-null result of the '?', which here is the
+        list of the first element that has 'b'.
+
+        Expected: list(deep_iter([{}, {'b': [1, 2]}, {'b': [3]}], '?.b.*')) -> [1, 2]
+        """
+        data: list = [{}, {'b': [1, 2]}, {'b': [3]}]
+        result = list(deep_iter(data, '?.b.*'))
+        self.assertEqual(result, deep_find(data, '?.b.*'))
+
+    def test_path_without_wildcards(self):
+        """
+        Test that a path without wildcards yields its value once.
+
+        Expected: list(deep_iter({'a': {'b': 1}}, 'a.b')) -> [1]
+        """
+        data: dict = {'a': {'b': 1}}
+        result = list(deep_iter(data, 'a.b'))
+        self.assertEqual(result, [1])
+
+    def test_missing_path_yields_nothing(self):
+        """
+        Test that a path that is not found yields nothing.
+
+        Expected: list(deep_iter({'a': 1}, 'b')) -> []
+        """
+        data: dict = {'a': 1}
+        result = list(deep_iter(data, 'b'))
+        self.assertEqual(result, [])
+
+    def test_values_are_yielded_lazily(self):
+        """
+        Test that deep_iter only consumes the source as values are requested.
+
+        Expected: next(deep_iter({'v': generator}, 'v.*')) leaves the rest of the generator unread
+        """
+        source = iter([1, 2, 3])
+        values = deep_iter({'v': source}, 'v.*')
+        self.assertEqual(next(values), 1)
+        self.assertEqual(next(source), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
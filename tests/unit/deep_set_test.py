@@ -0,0 +1,276 @@
+import unittest
+
+from deepfinder import CachedDeepFinderDict, compile_path, deep_delete, deep_find, deep_set
+
+
+class User:
+    def __init__(self, name, age=None):
+        self.name = name
+        self.age = age
+
+
+class SlottedUser:
+    __slots__ = ('name', 'age')
+
+    def __init__(self, name, age):
+        self.name = name
+        self.age = age
+
+
+class Badge:
+    def __init__(self, name):
+        self.name = name
+
+    @property
+    def label(self):
+        return self.name.upper()
+
+
+def users():
+    return {
+        'users': [
+            {'name': 'ash', 'age': 10, 'password': 'pikachu'},
+            {'name': 'brock', 'age': 35},
+            None,
+            {'name': 'oak', 'age': 60, 'password': 'eevee'},
+        ],
+    }
+
+
+class TestDeepSet(unittest.TestCase):
+    def test_key_and_index(self):
+        """
+        Test that a plain path sets a single key or list element, adding missing keys.
+
+        Expected: deep_set(data, 'users.1.name', 'misty') -> 1, and the name is replaced
+        """
+        data = users()
+        self.assertEqual(deep_set(data, 'users.1.name', 'misty'), 1)
+        self.assertEqual(deep_set(data, 'users.0.city', 'pallet'), 1)
+        self.assertEqual(deep_set(data, 'users.-1', {'name': 'gary'}), 1)
+        self.assertEqual(deep_find(data, 'users.*?.name'), ['ash', 'misty', 'gary'])
+        self.assertEqual(data['users'][0]['city'], 'pallet')
+
+    def test_out_of_range_and_missing(self):
+        """
+        Test that paths that are not found set nothing.
+
+        Expected: deep_set(data, 'users.10.name', 'x') -> 0 and deep_set(data, 'missing.name', 'x') -> 0
+        """
+        data = users()
+        self.assertEqual(deep_set(data, 'users.10.name', 'x'), 0)
+        self.assertEqual(deep_set(data, 'users.-5', 'x'), 0)
+        self.assertEqual(deep_set(data, 'missing.name', 'x'), 0)
+        self.assertEqual(data, users())
+
+    def test_wildcards(self):
+        """
+        Test that '*' sets every element, '*?' the non-None ones and '?' the first match.
+
+        Expected: deep_set(data, 'users.*?.active', True) -> 3
+        """
+        data = users()
+        self.assertEqual(deep_set(data, 'users.*?.active', True), 3)
+        self.assertEqual(deep_find(data, 'users.*.active'), [True, True, None, True])
+        self.assertEqual(deep_set(data, 'users.?.password', 'secret'), 1)
+        self.assertEqual(deep_find(data, 'users.*?.password'), ['secret', 'eevee'])
+        self.assertEqual(deep_set(data, 'users.*', 0), 4)
+        self.assertEqual(data, {'users': [0, 0, 0, 0]})
+
+    def test_function_of_current_value(self):
+        """
+        Test that a callable value receives the current value of every matched node.
+
+        Expected: deep_set(data, 'users.*?.age', fn=lambda age: age + 1) -> ages [11, 36, 61]
+        """
+        data = users()
+        self.assertEqual(deep_set(data, 'users.*?.age', fn=lambda age: age + 1), 3)
+        self.assertEqual(deep_find(data, 'users.*?.age'), [11, 36, 61])
+        self.assertEqual(deep_set(data, 'users.0.nickname', fn=lambda current: current), 1)
+        self.assertIsNone(data['users'][0]['nickname'])
+        with self.assertRaises(ValueError):
+            deep_set(data, 'users.0.age', 1, fn=abs)
+
+    def test_callables_as_values(self):
+        """
+        Test that functions and classes passed as value are set as they are.
+
+        Expected: deep_set({'factory': None}, 'factory', dict) -> 1, and data['factory'] is dict
+        """
+        data = {'factory': None, 'hooks': [None]}
+        self.assertEqual(deep_set(data, 'factory', dict), 1)
+        self.assertEqual(deep_set(data, 'hooks.0', print), 1)
+        self.assertEqual(data, {'factory': dict, 'hooks': [print]})
+
+    def test_filters_slices_and_descendants(self):
+        """
+        Test that filters, slices and '**' select the nodes to write like they do for deep_find.
+
+        Expected: deep_set(data, 'users.[age>30].senior', True) -> 2, deep_set(data, '**.password', '***') -> 1
+        """
+        data = users()
+        self.assertEqual(deep_set(data, 'users.[age>30].senior', True), 2)
+        self.assertEqual(deep_find(data, 'users.*?.senior'), [True, True])
+        self.assertEqual(deep_set(data, 'users.:2.age', 0), 2)
+        self.assertEqual(deep_find(data, 'users.*?.age'), [0, 0, 60])
+        self.assertEqual(deep_set(data, 'users.[age==0]', None), 2)
+        self.assertEqual(data['users'][:2], [None, None])
+        self.assertEqual(deep_set(data, '**.password', '***'), 1)
+        self.assertEqual(data['users'][3]['password'], '***')
+
+    def test_create_missing(self):
+        """
+        Test that create_missing adds the missing intermediate dictionaries, and only those.
+
+        Expected: deep_set({}, 'a.b.c', 1, create_missing=True) -> {'a': {'b': {'c': 1}}}
+        """
+        data = {}
+        self.assertEqual(deep_set(data, 'a.b.c', 1, create_missing=True), 1)
+        self.assertEqual(data, {'a': {'b': {'c': 1}}})
+
+        data = users()
+        self.assertEqual(deep_set(data, 'users.*?.address.city', 'pallet', create_missing=True), 3)
+        self.assertEqual(deep_find(data, 'users.*?.address.city'), ['pallet'] * 3)
+
+        data = {'a': 5, 'items': []}
+        self.assertEqual(deep_set(data, 'a.b', 1, create_missing=True), 0)
+        self.assertEqual(deep_set(data, 'items.0.b', 1, create_missing=True), 0)
+        self.assertEqual(data, {'a': 5, 'items': []})
+
+    def test_objects(self):
+        """
+        Test that attributes and slots of objects are set, and created if missing.
+
+        Expected: deep_set(users, '*.age', 18) -> 2
+        """
+        people = [User('ash', 10), SlottedUser('misty', 12)]
+        self.assertEqual(deep_set(people, '*.age', 18), 2)
+        self.assertEqual(deep_find(people, '*.age'), [18, 18])
+        self.assertEqual(deep_set(people, '0.profile.city', 'pallet', create_missing=True), 1)
+        self.assertEqual(people[0].profile, {'city': 'pallet'})
+
+    def test_unwritable_attributes_are_skipped(self):
+        """
+        Test that read-only properties and missing slots are skipped, and the other nodes are still set.
+
+        Expected: deep_set(people, '*.label', 'x') -> 1, only set on the plain object
+        """
+        people = [Badge('boulder'), User('ash'), SlottedUser('misty', 12)]
+        self.assertEqual(deep_set(people, '*.label', 'x'), 1)
+        self.assertEqual(people[0].label, 'BOULDER')
+        self.assertEqual(people[1].label, 'x')
+        self.assertFalse(hasattr(people[2], 'label'))
+        self.assertEqual(deep_set(people, '2.profile.city', 'cerulean', create_missing=True), 0)
+
+    def test_shared_containers_are_written_once(self):
+        """
+        Test that a container reached through several paths gets a function applied once.
+
+        Expected: deep_set(data, '*.counter', fn=increment) -> 1 when both elements are the same dict
+        """
+        shared = {'counter': 0}
+        self.assertEqual(deep_set([shared, shared], '*.counter', fn=lambda counter: counter + 1), 1)
+        self.assertEqual(shared['counter'], 1)
+
+    def test_immutable_containers(self):
+        """
+        Test that tuples and other immutable containers are left untouched.
+
+        Expected: deep_set({'t': (1, 2)}, 't.0', 5) -> 0
+        """
+        data = {'t': (1, 2)}
+        self.assertEqual(deep_set(data, 't.0', 5), 0)
+        self.assertEqual(deep_set(data, 't.*', 5), 0)
+        self.assertEqual(data, {'t': (1, 2)})
+
+    def test_custom_classes_invalidate_their_cache(self):
+        """
+        Test that writes to a CachedDeepFinderDict go through its methods, so cached results are refreshed.
+
+        Expected: CachedDeepFinderDict.deep_find returns the new value after deep_set
+        """
+        data = CachedDeepFinderDict({'user': 'ash'})
+        self.assertEqual(data.deep_find('user'), 'ash')
+        deep_set(data, 'user', 'misty')
+        self.assertEqual(data.deep_find('user'), 'misty')
+
+    def test_invalid_paths(self):
+        """
+        Test that empty paths and paths ending with '**' are rejected.
+
+        Expected: ValueError
+        """
+        with self.assertRaises(ValueError):
+            deep_set({}, '', 1)
+        with self.assertRaises(ValueError):
+            deep_delete({}, 'a.**')
+
+
+class TestDeepDelete(unittest.TestCase):
+    def test_keys_and_descendants(self):
+        """
+        Test that keys are removed wherever the path matches them.
+
+        Expected: deep_delete(data, '**.password') -> 2
+        """
+        data = users()
+        self.assertEqual(deep_delete(data, '**.password'), 2)
+        self.assertEqual(deep_find(data, 'users.*?.password'), [])
+        self.assertEqual(deep_delete(data, '**.password'), 0)
+
+    def test_list_elements(self):
+        """
+        Test that indexes, filters and slices remove the matching list elements.
+
+        Expected: deep_delete(data, 'users.[age>30]') -> 2, leaving ash and the None element
+        """
+        data = users()
+        self.assertEqual(deep_delete(data, 'users.[age>30]'), 2)
+        self.assertEqual(data['users'], [users()['users'][0], None])
+        self.assertEqual(deep_delete(data, 'users.-1'), 1)
+        self.assertEqual(deep_delete(data, 'users.5'), 0)
+        self.assertEqual(len(data['users']), 1)
+
+        data = {'values': list(range(10))}
+        self.assertEqual(deep_delete(data, 'values.::2'), 5)
+        self.assertEqual(data['values'], [1, 3, 5, 7, 9])
+        self.assertEqual(deep_delete(data, 'values.*'), 5)
+        self.assertEqual(data['values'], [])
+
+    def test_non_null_and_first(self):
+        """
+        Test that '*?' removes the non-None elements and '?' only the first of them.
+
+        Expected: deep_delete([None, 1, 2], '?') -> 1, leaving [None, 2]
+        """
+        values = [None, 1, 2]
+        self.assertEqual(deep_delete(values, '?'), 1)
+        self.assertEqual(values, [None, 2])
+        self.assertEqual(deep_delete(values, '*?'), 1)
+        self.assertEqual(values, [None])
+
+    def test_objects(self):
+        """
+        Test that instance attributes and slots are deleted, and class attributes are not.
+
+        Expected: deep_delete(users, '*.age') -> 2
+        """
+        people = [User('ash', 10), SlottedUser('misty', 12)]
+        self.assertEqual(deep_delete(people, '*.age'), 2)
+        self.assertEqual(deep_find(people, '*.age'), [None, None])
+        self.assertEqual(deep_delete(people, '*.age'), 0)
+        self.assertEqual(deep_delete(people, '0.__init__'), 0)
+
+    def test_compiled_path(self):
+        """
+        Test that compiled paths can be used to delete.
+
+        Expected: deep_delete(data, compile_path('a/b', '/')) -> 1
+        """
+        data = {'a': {'b': 1, 'c': 2}}
+        self.assertEqual(deep_delete(data, compile_path('a/b', '/')), 1)
+        self.assertEqual(data, {'a': {'c': 2}})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import sys
+import unittest
+
+from deepfinder import DeepView
+
+
+PAYLOAD = {
+    'users': [
+        {'name': 'ash', 'pokemons': [{'name': 'pikachu'}, {'name': 'charmander', 'ball': 'superball'}]},
+        {'name': 'misty', 'pokemons': []},
+    ],
+    'region': 'kanto',
+}
+
+
+class TestDeepView(unittest.TestCase):
+    def test_deep_find_and_deep_iter(self):
+        """
+        Test that a view finds and iterates over the values of the viewed structure.
+
+        Expected: DeepView(PAYLOAD).deep_find('users.*.name') -> ['ash', 'misty']
+        """
+        view = DeepView(PAYLOAD)
+        self.assertEqual(view.deep_find('users.*.name'), ['ash', 'misty'])
+        self.assertEqual(view.deep_find('users.?.pokemons.?.ball'), 'superball')
+        self.assertEqual(view.deep_find('users.0.age', default=10), 10)
+        self.assertEqual(list(view.deep_iter('users.*.pokemons.*.name')), ['pikachu', 'charmander'])
+
+    def test_does_not_copy(self):
+        """
+        Test that a view holds a reference to the viewed object, so changes are visible through it.
+
+        Expected: DeepView(payload).obj is payload
+        """
+        payload = {'users': []}
+        view = DeepView(payload)
+        self.assertIs(view.obj, payload)
+        payload['users'].append({'name': 'brock'})
+        self.assertEqual(view.deep_find('users.0.name'), 'brock')
+        self.assertIs(DeepView(view).obj, payload)
+        self.assertLess(sys.getsizeof(view), sys.getsizeof(payload))
+
+    def test_item_access_returns_views_of_containers(self):
+        """
+        Test that item access wraps nested containers in views and returns scalars as is.
+
+        Expected: DeepView(PAYLOAD)['users'][0]['name'] -> 'ash', DeepView(PAYLOAD)['users'] -> a DeepView
+        """
+        view = DeepView(PAYLOAD)
+        users = view['users']
+        self.assertIsInstance(users, DeepView)
+        self.assertIs(users.obj, PAYLOAD['users'])
+        self.assertEqual(users[0]['name'], 'ash')
+        self.assertEqual(view['region'], 'kanto')
+        self.assertEqual(view.get('missing', 'default'), 'default')
+        self.assertEqual([user.deep_find('name') for user in users], ['ash', 'misty'])
+
+    def test_container_protocol(self):
+        """
+        Test that a view supports len, membership, iteration over mapping keys and equality.
+
+        Expected: len(DeepView(PAYLOAD)) -> 2, 'users' in DeepView(PAYLOAD) -> True
+        """
+        view = DeepView(PAYLOAD)
+        self.assertEqual(len(view), 2)
+        self.assertIn('users', view)
+        self.assertEqual(list(view), ['users', 'region'])
+        self.assertEqual(view, PAYLOAD)
+        self.assertEqual(view, DeepView(PAYLOAD))
+        self.assertFalse(DeepView([]))
+        self.assertEqual(repr(DeepView([1])), 'DeepView([1])')
@@ -0,0 +1,168 @@
+import pickle
+import unittest
+from unittest import mock
+
+from deepfinder import entity
+from deepfinder.entity import CachedDeepFinderDict, CachedDeepFinderList, DeepFinderDict, DeepFinderList
+
+
+class TestEntityCache(unittest.TestCase):
+    def test_repeated_queries_are_cached(self):
+        """
+        Test that an identical query on an unchanged instance does not traverse it again.
+
+        Expected: two calls to data.deep_find('users.*.name') -> one traversal
+        """
+        data = CachedDeepFinderDict({'users': [{'name': 'ash'}, {'name': 'misty'}]})
+        with mock.patch.object(entity, 'deep_find', wraps=entity.deep_find) as traversal:
+            self.assertEqual(data.deep_find('users.*.name'), ['ash', 'misty'])
+            self.assertEqual(data.deep_find('users.*.name'), ['ash', 'misty'])
+        self.assertEqual(traversal.call_count, 1)
+
+    def test_uncached_by_default(self):
+        """
+        Test that DeepFinderDict and DeepFinderList traverse their current contents on every lookup.
+
+        Expected: data['users'][0]['n'] = 5 on a plain nested dict -> data.deep_find('users.*.n') == [5, 2]
+        """
+        data = DeepFinderDict({'users': [{'n': 1}, {'n': 2}]})
+        self.assertEqual(data.deep_find('users.*.n'), [1, 2])
+        data['users'][0]['n'] = 5
+        self.assertEqual(data.deep_find('users.*.n'), [5, 2])
+        self.assertFalse(hasattr(DeepFinderList([1]), 'invalidate'))
+
+    def test_results_can_be_modified(self):
+        """
+        Test that modifying a returned result does not affect later cached lookups.
+
+        Expected: r = data.deep_find('users.*.n'); r.append(99) -> data.deep_find('users.*.n') == [1, 2]
+        """
+        data = CachedDeepFinderDict({'users': [{'n': [1]}, {'n': [2]}]})
+        result = data.deep_find('users.*.n')
+        result.append(99)
+        self.assertEqual(data.deep_find('users.*.n'), [[1], [2]])
+        nested = CachedDeepFinderList([[{'n': 1}], [{'n': 2}]])
+        nested.deep_find('*.*.n')[0].append(99)
+        self.assertEqual(nested.deep_find('*.*.n'), [[1], [2]])
+
+    def test_dict_mutations_invalidate(self):
+        """
+        Test that every mutating method of CachedDeepFinderDict invalidates the cached results.
+
+        Expected: data.deep_find('a') reflects every mutation
+        """
+        data = CachedDeepFinderDict({'a': 1})
+        mutations = [
+            (lambda: data.__setitem__('a', 2), 2),
+            (lambda: data.update(a=3), 3),
+            (lambda: data.__ior__({'a': 4}), 4),
+            (lambda: data.pop('a'), None),
+            (lambda: data.setdefault('a', 5), 5),
+            (lambda: data.__delitem__('a'), None),
+            (lambda: data.update({'a': 6}), 6),
+            (lambda: data.popitem(), None),
+            (lambda: data.update(a=7), 7),
+            (lambda: data.clear(), None),
+        ]
+        for mutate, expected in mutations:
+            data.deep_find('a')
+            mutate()
+            self.assertEqual(data.deep_find('a'), expected)
+
+    def test_list_mutations_invalidate(self):
+        """
+        Test that every mutating method of CachedDeepFinderList invalidates the cached results.
+
+        Expected: data.deep_find('*') reflects every mutation
+        """
+        data = CachedDeepFinderList([3, 1])
+        mutations = [
+            (lambda: data.append(2), [3, 1, 2]),
+            (lambda: data.extend([4]), [3, 1, 2, 4]),
+            (lambda: data.insert(0, 0), [0, 3, 1, 2, 4]),
+            (lambda: data.pop(), [0, 3, 1, 2]),
+            (lambda: data.remove(3), [0, 1, 2]),
+            (lambda: data.sort(reverse=True), [2, 1, 0]),
+            (lambda: data.reverse(), [0, 1, 2]),
+            (lambda: data.__setitem__(0, 9), [9, 1, 2]),
+            (lambda: data.__setitem__(slice(0, 2), [7]), [7, 2]),
+            (lambda: data.__delitem__(0), [2]),
+            (lambda: data.__iadd__([5]), [2, 5]),
+            (lambda: data.__imul__(2), [2, 5, 2, 5]),
+            (lambda: data.clear(), []),
+        ]
+        for mutate, expected in mutations:
+            data.deep_find('*')
+            mutate()
+            self.assertEqual(data.deep_find('*'), expected)
+
+    def test_nested_mutations_invalidate_parents(self):
+        """
+        Test that mutating a nested cached container invalidates the cached results of its parents.
+
+        Expected: pokemons.append(CachedDeepFinderDict({'name': 'onix'})) -> user.deep_find('pokemons.*.name') includes 'onix'
+        """
+        pikachu = CachedDeepFinderDict({'name': 'pikachu'})
+        pokemons = CachedDeepFinderList([pikachu])
+        user = CachedDeepFinderDict({'pokemons': pokemons})
+        users = CachedDeepFinderList([user])
+
+        self.assertEqual(users.deep_find('*.pokemons.*.name'), [['pikachu']])
+        pikachu['name'] = 'raichu'
+        self.assertEqual(users.deep_find('*.pokemons.*.name'), [['raichu']])
+        pokemons.append(CachedDeepFinderDict({'name': 'onix'}))
+        self.assertEqual(user.deep_find('pokemons.*.name'), ['raichu', 'onix'])
+        pokemons[1]['name'] = 'steelix'
+        self.assertEqual(users.deep_find('*.pokemons.*.name'), [['raichu', 'steelix']])
+
+    def test_slice_assignment_adopts_every_new_element(self):
+        """
+        Test that every element assigned to a slice invalidates the list when it changes, even if the slice grows.
+
+        Expected: after items[0:1] = [a, b] and b['n'] = 99, items.deep_find('*.n') -> [1, 99, 3]
+        """
+        items = CachedDeepFinderList([CachedDeepFinderDict({'n': 0}), CachedDeepFinderDict({'n': 3})])
+        self.assertEqual(items.deep_find('*.n'), [0, 3])
+        first, second = CachedDeepFinderDict({'n': 1}), CachedDeepFinderDict({'n': 2})
+        items[0:1] = (item for item in (first, second))
+        self.assertEqual(items.deep_find('*.n'), [1, 2, 3])
+        second['n'] = 99
+        self.assertEqual(items.deep_find('*.n'), [1, 99, 3])
+
+    def test_invalidate_after_plain_mutations(self):
+        """
+        Test that invalidate() discards cached results after a plain nested structure is modified.
+
+        Expected: data['user']['name'] = 'misty'; data.invalidate() -> data.deep_find('user.name') == 'misty'
+        """
+        data = CachedDeepFinderDict({'user': {'name': 'ash'}})
+        self.assertEqual(data.deep_find('user.name'), 'ash')
+        data['user']['name'] = 'misty'
+        data.invalidate()
+        self.assertEqual(data.deep_find('user.name'), 'misty')
+
+    def test_cache_is_bounded(self):
+        """
+        Test that the cache never holds more than ENTITY_CACHE_SIZE paths.
+
+        Expected: ENTITY_CACHE_SIZE + 1 distinct queries -> at most ENTITY_CACHE_SIZE cached paths
+        """
+        data = CachedDeepFinderList(range(entity.ENTITY_CACHE_SIZE + 1))
+        for index in range(entity.ENTITY_CACHE_SIZE + 1):
+            data.deep_find(str(index))
+        self.assertLessEqual(len(data._cache), entity.ENTITY_CACHE_SIZE)
+
+    def test_pickle_drops_the_cache(self):
+        """
+        Test that pickled instances do not carry their cache and still invalidate their parents.
+
+        Expected: pickle round trip -> same contents, nested mutations still seen
+        """
+        data = CachedDeepFinderDict({'users': CachedDeepFinderList([CachedDeepFinderDict({'name': 'ash'})])})
+        data.deep_find('users.*.name')
+        copy = pickle.loads(pickle.dumps(data))
+        self.assertEqual(copy, data)
+        self.assertIsNone(copy._cache)
+        self.assertEqual(copy.deep_find('users.*.name'), ['ash'])
+        copy['users'][0]['name'] = 'misty'
+        self.assertEqual(copy.deep_find('users.*.name'), ['misty'])
@@ -0,0 +1,66 @@
+import unittest
+
+from deepfinder import deep_find, register_accessor
+
+
+class Row:
+    def __init__(self, **fields):
+        self.fields = fields
+
+
+class Table:
+    def __init__(self, *rows):
+        self.rows = rows
+
+
+class NamedTable(Table):
+    pass
+
+
+register_accessor(Row, lambda row, key: row.fields.get(key))
+register_accessor(Table, lambda table, key: None, lambda table: table.rows)
+
+
+class TestRegisterAccessor(unittest.TestCase):
+    def test_registered_getter(self):
+        """
+        Test that deep_find reads children of a registered type through its getter.
+
+        Expected: deep_find({'row': Row(id=1)}, 'row.id') -> 1
+        """
+        data: dict = {'row': Row(id=1)}
+        result = deep_find(data, 'row.id')
+        self.assertEqual(result, 1)
+
+    def test_registered_getter_miss(self):
+        """
+        Test that a registered getter returning None is treated as a missing value.
+
+        Expected: deep_find(Row(id=1), 'name', default='default') -> 'default'
+        """
+        result = deep_find(Row(id=1), 'name', default='default')
+        self.assertEqual(result, 'default')
+
+    def test_registered_iterator(self):
+        """
+        Test that wildcard operators expand through the iterator of a registered type.
+
+        Expected: deep_find(Table(Row(id=1), Row(), Row(id=3)), '*?.id') -> [1, 3]
+        """
+        data = Table(Row(id=1), Row(), Row(id=3))
+        result = deep_find(data, '*?.id')
+        self.assertEqual(result, [1, 3])
+
+    def test_registered_base_class(self):
+        """
+        Test that subclasses of a registered type use its accessor.
+
+        Expected: deep_find(NamedTable(Row(id=1)), '?.id') -> 1
+        """
+        data = NamedTable(Row(id=1))
+        result = deep_find(data, '?.id')
+        self.assertEqual(result, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()